@@ -0,0 +1,56 @@
+"""Unique patient personal number and active request per appointment
+
+Revision ID: 3f1c9a7d2b64
+Revises: 604723f5c1b5
+Create Date: 2026-10-18 11:03:17.554201
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, None] = '604723f5c1b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    connection = op.get_bind()
+    # The old read-then-write booking could register a personal number twice. Merging those
+    # patients means moving their records, so it is left to an operator instead of guessed here.
+    duplicates = connection.execute(sa.text(
+        "SELECT personal_number, COUNT(*) FROM patient GROUP BY personal_number HAVING COUNT(*) > 1 "
+        "ORDER BY personal_number"
+    )).all()
+    if duplicates:
+        listed = ", ".join(f"{personal_number} ({count}x)" for personal_number, count in duplicates[:20])
+        raise RuntimeError(
+            f"Cannot create the unique index ix_patient_personal_number: {len(duplicates)} personal numbers "
+            f"belong to more than one patient: {listed}. Merge these patients, then run the upgrade again."
+        )
+    # Double bookings of one appointment by one patient: the earliest request stays active.
+    connection.execute(sa.text(
+        "UPDATE request SET state = 'cancelled' "
+        "WHERE state NOT IN ('declined', 'cancelled') AND appointment_id IS NOT NULL AND EXISTS ("
+        "SELECT 1 FROM request AS earlier WHERE earlier.patient_id = request.patient_id "
+        "AND earlier.appointment_id = request.appointment_id "
+        "AND earlier.state NOT IN ('declined', 'cancelled') AND earlier.id < request.id)"
+    ))
+    op.create_index('ix_patient_personal_number', 'patient', ['personal_number'], unique=True)
+    op.create_index(
+        'uq_request_patient_appointment_active', 'request', ['patient_id', 'appointment_id'],
+        unique=True,
+        postgresql_where=sa.text("state NOT IN ('declined', 'cancelled')"),
+        sqlite_where=sa.text("state NOT IN ('declined', 'cancelled')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_request_patient_appointment_active', table_name='request')
+    op.drop_index('ix_patient_personal_number', table_name='patient')
@@ -0,0 +1,71 @@
+"""Add patient search columns
+
+Revision ID: 4a9e7c2d5b18
+Revises: 8d4b2f6a1e37
+Create Date: 2026-10-18 21:02:37.418264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.text import normalize_phone, normalize_search_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a9e7c2d5b18'
+down_revision: Union[str, None] = '8d4b2f6a1e37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_CHUNK = 10000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('patient', sa.Column('name_normalized', sa.String(length=255), nullable=False, server_default=''))
+    op.add_column('patient', sa.Column('surname_normalized', sa.String(length=255), nullable=False,
+                                       server_default=''))
+    op.add_column('patient', sa.Column('phone_normalized', sa.String(length=20), nullable=True))
+    patient = sa.table('patient', sa.column('id', sa.Integer), sa.column('name', sa.String),
+                       sa.column('surname', sa.String), sa.column('phone_number', sa.String),
+                       sa.column('name_normalized', sa.String), sa.column('surname_normalized', sa.String),
+                       sa.column('phone_normalized', sa.String))
+    update = patient.update().where(patient.c.id == sa.bindparam('patient_id')).values(
+        name_normalized=sa.bindparam('name_value'), surname_normalized=sa.bindparam('surname_value'),
+        phone_normalized=sa.bindparam('phone_value')
+    )
+    connection = op.get_bind()
+    last_id = 0
+    while True:
+        rows = connection.execute(
+            sa.select(patient.c.id, patient.c.name, patient.c.surname, patient.c.phone_number)
+            .where(patient.c.id > last_id).order_by(patient.c.id).limit(BACKFILL_CHUNK)
+        ).all()
+        if not rows:
+            break
+        connection.execute(update, [
+            {'patient_id': id_, 'name_value': normalize_search_text(name), 'surname_value': normalize_search_text(surname),
+             'phone_value': normalize_phone(phone)}
+            for id_, name, surname, phone in rows
+        ])
+        last_id = rows[-1].id
+    op.create_index('ix_patient_surname_name_normalized', 'patient', ['surname_normalized', 'name_normalized'],
+                    unique=False, postgresql_ops={'surname_normalized': 'text_pattern_ops',
+                                                  'name_normalized': 'text_pattern_ops'})
+    op.create_index('ix_patient_name_normalized', 'patient', ['name_normalized'], unique=False,
+                    postgresql_ops={'name_normalized': 'text_pattern_ops'})
+    op.create_index('ix_patient_date_of_birth', 'patient', ['date_of_birth'], unique=False)
+    op.create_index('ix_patient_phone_normalized', 'patient', ['phone_normalized'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_patient_phone_normalized', table_name='patient')
+    op.drop_index('ix_patient_date_of_birth', table_name='patient')
+    op.drop_index('ix_patient_name_normalized', table_name='patient')
+    op.drop_index('ix_patient_surname_name_normalized', table_name='patient')
+    op.drop_column('patient', 'phone_normalized')
+    op.drop_column('patient', 'surname_normalized')
+    op.drop_column('patient', 'name_normalized')
@@ -0,0 +1,54 @@
+"""Index foreign key columns
+
+Revision ID: 5d0c8e3a91f7
+Revises: 9b2e4d71c0a8
+Create Date: 2026-10-18 14:02:41.553210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d0c8e3a91f7'
+down_revision: Union[str, None] = '9b2e4d71c0a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEY_COLUMNS = [
+    ('appointment_history', 'appointment_id'),
+    ('appointment_history', 'doctor_id'),
+    ('appointment_history', 'nurse_id'),
+    ('appointment_history', 'patient_id'),
+    ('doctor', 'specialization_id'),
+    ('family_relation', 'related_id'),
+    ('medical_record', 'doctor_id'),
+    ('medical_record', 'patient_id'),
+    ('notification', 'doctor_id'),
+    ('notification', 'patient_id'),
+    ('nurse', 'doctor_id'),
+    ('prescription', 'doctor_id'),
+    ('prescription', 'medicine_id'),
+    ('prescription', 'patient_id'),
+    ('request', 'appointment_id'),
+    ('request', 'doctor_id'),
+    ('request', 'nurse_id'),
+    ('request', 'patient_id'),
+    ('request', 'request_type_id'),
+    ('test', 'request_id'),
+    ('test', 'test_type_id'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column in FOREIGN_KEY_COLUMNS:
+        op.create_index(op.f(f'ix_{table}_{column}'), table, [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column in reversed(FOREIGN_KEY_COLUMNS):
+        op.drop_index(op.f(f'ix_{table}_{column}'), table_name=table)
@@ -0,0 +1,28 @@
+"""Add appointment doctor/date index
+
+Revision ID: 604723f5c1b5
+Revises: d526b866f869
+Create Date: 2026-10-18 10:12:41.213874
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '604723f5c1b5'
+down_revision: Union[str, None] = 'd526b866f869'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_appointment_doctor_id_date_from', 'appointment', ['doctor_id', 'date_from'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_appointment_doctor_id_date_from', table_name='appointment')
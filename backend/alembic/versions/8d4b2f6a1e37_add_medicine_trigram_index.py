@@ -0,0 +1,35 @@
+"""Add medicine trigram index
+
+Revision ID: 8d4b2f6a1e37
+Revises: c2f8a4e6b913
+Create Date: 2026-10-18 19:40:03.527114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4b2f6a1e37'
+down_revision: Union[str, None] = 'c2f8a4e6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fuzzy medicine search on the database uses pg_trgm; other databases only do prefix search.
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(sa.text('CREATE EXTENSION IF NOT EXISTS pg_trgm'))
+    op.create_index('ix_medicine_name_trgm', 'medicine', ['name_normalized'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'name_normalized': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_medicine_name_trgm', table_name='medicine')
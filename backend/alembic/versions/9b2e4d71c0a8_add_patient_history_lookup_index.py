@@ -0,0 +1,32 @@
+"""Add patient history lookup index
+
+Revision ID: 9b2e4d71c0a8
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-18 13:26:05.108337
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e4d71c0a8'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_patient_history_lookup', 'patient', ['personal_number', 'name', 'surname'],
+        unique=False,
+        postgresql_include=['id'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_patient_history_lookup', table_name='patient')
@@ -0,0 +1,30 @@
+"""Add notification patient/opened index
+
+Revision ID: a7c3e5d19b42
+Revises: e41a6f0b7c25
+Create Date: 2026-10-18 17:02:11.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5d19b42'
+down_revision: Union[str, None] = 'e41a6f0b7c25'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_notification_patient_opened', 'notification', ['patient_id', 'opened', 'id'], unique=False)
+    op.drop_index(op.f('ix_notification_patient_id'), table_name='notification')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_notification_patient_id'), 'notification', ['patient_id'], unique=False)
+    op.drop_index('ix_notification_patient_opened', table_name='notification')
@@ -0,0 +1,31 @@
+"""Add family relation reverse edge index
+
+Revision ID: b5e1d8c3a207
+Revises: 4a9e7c2d5b18
+Create Date: 2026-10-18 21:48:12.736905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1d8c3a207'
+down_revision: Union[str, None] = '4a9e7c2d5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_family_relation_related_patient', 'family_relation', ['related_id', 'patient_id'],
+                    unique=False)
+    op.drop_index(op.f('ix_family_relation_related_id'), table_name='family_relation')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_family_relation_related_id'), 'family_relation', ['related_id'], unique=False)
+    op.drop_index('ix_family_relation_related_patient', table_name='family_relation')
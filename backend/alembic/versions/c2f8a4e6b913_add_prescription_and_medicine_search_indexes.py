@@ -0,0 +1,48 @@
+"""Add prescription and medicine search indexes
+
+Revision ID: c2f8a4e6b913
+Revises: a7c3e5d19b42
+Create Date: 2026-10-18 18:24:50.161937
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.text import normalize_search_text
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f8a4e6b913'
+down_revision: Union[str, None] = 'a7c3e5d19b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('medicine', sa.Column('name_normalized', sa.String(length=255), nullable=False, server_default=''))
+    medicine = sa.table('medicine', sa.column('id', sa.Integer), sa.column('name', sa.String),
+                        sa.column('name_normalized', sa.String))
+    connection = op.get_bind()
+    rows = connection.execute(sa.select(medicine.c.id, medicine.c.name)).all()
+    if rows:
+        connection.execute(
+            medicine.update().where(medicine.c.id == sa.bindparam('medicine_id')).values(
+                name_normalized=sa.bindparam('normalized')
+            ),
+            [{'medicine_id': id_, 'normalized': normalize_search_text(name)} for id_, name in rows]
+        )
+    op.create_index('ix_medicine_name_normalized', 'medicine', ['name_normalized'], unique=False,
+                    postgresql_ops={'name_normalized': 'text_pattern_ops'})
+    op.create_index('ix_prescription_patient_date_to', 'prescription', ['patient_id', 'date_to'], unique=False)
+    op.drop_index(op.f('ix_prescription_patient_id'), table_name='prescription')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_prescription_patient_id'), 'prescription', ['patient_id'], unique=False)
+    op.drop_index('ix_prescription_patient_date_to', table_name='prescription')
+    op.drop_index('ix_medicine_name_normalized', table_name='medicine')
+    op.drop_column('medicine', 'name_normalized')
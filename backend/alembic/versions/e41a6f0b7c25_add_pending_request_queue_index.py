@@ -0,0 +1,33 @@
+"""Add pending request queue index
+
+Revision ID: e41a6f0b7c25
+Revises: 5d0c8e3a91f7
+Create Date: 2026-10-18 15:11:37.902114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41a6f0b7c25'
+down_revision: Union[str, None] = '5d0c8e3a91f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_request_pending_queue', 'request', ['nurse_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text("state = 'pending'"),
+        sqlite_where=sa.text("state = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_request_pending_queue', table_name='request')
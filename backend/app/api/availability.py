@@ -0,0 +1,26 @@
+from fastapi import APIRouter, HTTPException
+from app.dependencies import DbSession
+from app.services.calendar_service import CalendarService
+from app.schemas.availability import AvailabilityOut
+from datetime import datetime
+
+router = APIRouter()
+
+@router.get("/availability", response_model=AvailabilityOut)
+def get_availability(
+    doctor_id: int,
+    request_type_id: int,
+    date_from: datetime,
+    date_to: datetime,
+    db: DbSession
+):
+    """Endpoint to list free slots for a request type in a doctor's appointments within [date_from, date_to)."""
+    if date_to <= date_from:
+        raise HTTPException(status_code=400, detail="date_to must be after date_from")
+    return CalendarService.get_free_slots(
+        db,
+        doctor_id=doctor_id,
+        request_type_id=request_type_id,
+        date_from=date_from,
+        date_to=date_to
+    )
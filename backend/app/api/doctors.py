@@ -1,43 +1,40 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.core.cache import cached_response
+from app.core.pagination import Page, PageLimit, with_next_cursor
+from app.dependencies import DbSession
 from app.schemas.doctor import DoctorCreate, DoctorOut
 from app.services.doctor_service import DoctorService
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=DoctorOut)
-def create_doctor(doctor: DoctorCreate, db: Session = Depends(get_db)):
+def create_doctor(doctor: DoctorCreate, db: DbSession):
     return DoctorService.create_doctor(db, doctor)
 
 
 @router.get("/{doctor_id}", response_model=DoctorOut)
-def get_doctor(doctor_id: int, db: Session = Depends(get_db)):
+def get_doctor(doctor_id: int, db: DbSession):
     db_doctor = DoctorService.get_doctor(db=db, doctor_id=doctor_id)
     if db_doctor is None:
         raise HTTPException(status_code=404, detail="Doctor not found")
     return db_doctor
 
 @router.get("/", response_model=list[DoctorOut])
-def get_doctors(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return DoctorService.get_doctors(db=db, skip=skip, limit=limit)
+def get_doctors(request: Request, response: Response, db: DbSession, cursor: Optional[str] = None,
+                limit: PageLimit = 100):
+    entry = DoctorService.get_doctors_cached(db=db, cursor=cursor, limit=limit)
+    return cached_response(request, response, entry) or with_next_cursor(response, Page(**entry.value))
 
 @router.put("/{doctor_id}", response_model=DoctorOut)
-def update_doctor(doctor_id: int, doctor: DoctorCreate, db: Session = Depends(get_db)):
+def update_doctor(doctor_id: int, doctor: DoctorCreate, db: DbSession):
     db_doctor = DoctorService.update_doctor(db=db, doctor_id=doctor_id, doctor=doctor)
     if db_doctor is None:
         raise HTTPException(status_code=404, detail="Doctor not found")
     return db_doctor
 
 @router.delete("/{doctor_id}", response_model=DoctorOut)
-def delete_doctor(doctor_id: int, db: Session = Depends(get_db)):
+def delete_doctor(doctor_id: int, db: DbSession):
     db_doctor = DoctorService.delete_doctor(db=db, doctor_id=doctor_id)
     if db_doctor is None:
         raise HTTPException(status_code=404, detail="Doctor not found")
@@ -0,0 +1,22 @@
+from typing import Optional
+from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
+from app.core.events import stream_events
+
+router = APIRouter()
+
+@router.get("/requests")
+async def stream_request_events(nurse_id: Optional[int] = None, doctor_id: Optional[int] = None):
+    """Server-sent `request.created` and `request.state_changed` events, optionally for one nurse or doctor.
+
+    Each event's data is the request as returned by `GET /requests/{id}`; state changes also
+    carry `previous_state`.
+    """
+    def accepts(data: dict) -> bool:
+        return (nurse_id is None or data["nurse_id"] == nurse_id) and (doctor_id is None or data["doctor_id"] == doctor_id)
+
+    return StreamingResponse(
+        stream_events(accepts),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
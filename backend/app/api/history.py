@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 import logging
 
-# Correct the import path for get_db
-from app.dependencies import get_db
-from app.schemas.history import PatientLookup, PatientHistoryResponse
+from app.dependencies import get_async_db
+from app.schemas.history import HistoryCursors, HistorySection, PatientLookup, PatientHistoryPage, PatientHistoryResponse
 from app.services import history_service
 
 # Get a logger instance
@@ -13,13 +14,13 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/patient", response_model=PatientHistoryResponse)
-def get_patient_history_endpoint(
+async def get_patient_history_endpoint(
     lookup_data: PatientLookup,
-    db: Session = Depends(get_db)  # Use the correct dependency
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Endpoint to retrieve a patient's history (requests, appointments, tests) based on lookup data."""
     try:
-        history = history_service.get_patient_history(db=db, lookup_data=lookup_data)
+        history = await history_service.get_patient_history_async(db=db, lookup_data=lookup_data)
         return history
     except HTTPException as e:
         # Re-raise HTTPExceptions (like 404 Not Found from the service)
@@ -29,3 +30,32 @@ def get_patient_history_endpoint(
         logger.exception("An unexpected error occurred while fetching patient history.", e)
         # Return a generic 500 error with a detail message
         raise HTTPException(status_code=500, detail="An internal server error occurred.")
+
+
+@router.post("/patient/page", response_model=PatientHistoryPage)
+async def get_patient_history_page_endpoint(
+    lookup_data: PatientLookup,
+    limit: int = Query(default=50, ge=1, le=500),
+    section: Optional[HistorySection] = None,
+    requests_cursor: Optional[str] = None,
+    appointments_cursor: Optional[str] = None,
+    tests_cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """One page per history section; pass a section's `next_cursors` entry back to get its next page."""
+    cursors = HistoryCursors(requests=requests_cursor, appointments=appointments_cursor, tests=tests_cursor)
+    return await history_service.get_patient_history_page_async(
+        db=db, lookup_data=lookup_data, limit=limit, cursors=cursors, section=section
+    )
+
+@router.post("/patient/stream")
+async def stream_patient_history_endpoint(
+    lookup_data: PatientLookup,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Streams the patient's history as NDJSON, one `{"section": ..., "data": ...}` object per line."""
+    patient_id = await history_service.get_patient_id_async(db=db, lookup_data=lookup_data)
+    return StreamingResponse(
+        history_service.stream_patient_history_async(db, patient_id),
+        media_type="application/x-ndjson"
+    )
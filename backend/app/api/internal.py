@@ -0,0 +1,16 @@
+from fastapi import APIRouter
+from app.core.cache import cache
+from app.core.database import get_pool_metrics
+from app.schemas.internal import CacheStatsOut, PoolMetricsOut
+
+router = APIRouter()
+
+@router.get("/db-pool", response_model=PoolMetricsOut)
+def read_pool_metrics():
+    """Endpoint to inspect database connection pool usage of this worker."""
+    return get_pool_metrics()
+
+@router.get("/cache", response_model=CacheStatsOut)
+def read_cache_stats():
+    """Endpoint to inspect hit/miss counters of this worker's cache."""
+    return cache.stats()
@@ -1,21 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.dependencies import get_async_db
 from app.services.list_all_terms_service import TermService
 from app.schemas.list_all_terms import TermOut
+from datetime import datetime
+from typing import Optional
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.get("/list-all-terms", response_model=list[TermOut])
-def list_all_terms(db: Session = Depends(get_db)):
-    terms = TermService.get_all_terms(db)
-    if not terms:
+async def list_all_terms(
+    response: Response,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    doctor_id: Optional[int] = None,
+    event_type: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    entry = await TermService.get_terms_page_cached_async(
+        db,
+        date_from=date_from,
+        date_to=date_to,
+        doctor_id=doctor_id,
+        event_type=event_type,
+        cursor=cursor,
+        limit=limit
+    )
+    paged = any(value is not None for value in (date_from, date_to, doctor_id, event_type, cursor, limit))
+    if not entry.value["terms"] and not paged:
+        # Kept for clients of the unfiltered listing; a filtered or paged request just gets an empty page.
         raise HTTPException(status_code=404, detail="No terms found")
-    return terms
+    if entry.value["next_cursor"]:
+        response.headers["X-Next-Cursor"] = entry.value["next_cursor"]
+    return entry.value["terms"]
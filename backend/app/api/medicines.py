@@ -0,0 +1,29 @@
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Query, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
+from app.schemas.prescription_medicine import PrescriptionMedicineCreate, PrescriptionMedicineOut
+from app.services.prescription_medicine_service import PrescriptionMedicineService
+
+router = APIRouter()
+
+@router.post("/", response_model=PrescriptionMedicineOut)
+def create_medicine(medicine: PrescriptionMedicineCreate, db: DbSession):
+    return PrescriptionMedicineService.create_medicine(db, medicine)
+
+@router.get("/search", response_model=list[PrescriptionMedicineOut])
+def search_medicines(q: Annotated[str, Query(min_length=1, max_length=255)], db: DbSession,
+                     limit: Annotated[int, Query(ge=1, le=100)] = 20, fuzzy: bool = True):
+    """Catalogue lookup while prescribing: names starting with `q`, then (with `fuzzy`) similar names."""
+    return PrescriptionMedicineService.search_medicines(db, q, limit, fuzzy)
+
+@router.get("/{medicine_id}", response_model=PrescriptionMedicineOut)
+def get_medicine(medicine_id: int, db: DbSession):
+    db_medicine = PrescriptionMedicineService.get_medicine(db=db, medicine_id=medicine_id)
+    if db_medicine is None:
+        raise HTTPException(status_code=404, detail="Medicine not found")
+    return db_medicine
+
+@router.get("/", response_model=list[PrescriptionMedicineOut])
+def get_medicines(response: Response, db: DbSession, cursor: Optional[str] = None, limit: PageLimit = 100):
+    return with_next_cursor(response, PrescriptionMedicineService.get_medicines(db=db, cursor=cursor, limit=limit))
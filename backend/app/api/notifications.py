@@ -0,0 +1,24 @@
+from typing import Optional
+from fastapi import APIRouter, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
+from app.schemas.notification import NotificationMarkOpened, NotificationMarkOpenedOut, NotificationOut
+from app.services.notification_service import NotificationService
+
+router = APIRouter()
+
+@router.get("/patient/{patient_id}/unread", response_model=list[NotificationOut])
+def get_unread_notifications(
+    patient_id: int,
+    response: Response,
+    db: DbSession,
+    cursor: Optional[str] = None,
+    limit: PageLimit = 100
+):
+    """The patient's unread notifications, newest first."""
+    page = NotificationService.get_unread(db, patient_id, cursor=cursor, limit=limit)
+    return with_next_cursor(response, page)
+
+@router.post("/patient/{patient_id}/mark-opened", response_model=NotificationMarkOpenedOut)
+def mark_notifications_opened(patient_id: int, body: NotificationMarkOpened, db: DbSession):
+    return {"updated": NotificationService.mark_opened(db, patient_id, body.ids)}
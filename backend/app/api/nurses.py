@@ -1,42 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
 from app.schemas.nurse import NurseCreate, NurseOut
 from app.services.nurse_service import NurseService
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=NurseOut)
-def create_nurse(nurse: NurseCreate, db: Session = Depends(get_db)):
+def create_nurse(nurse: NurseCreate, db: DbSession):
     return NurseService.create_nurse(db, nurse)
 
 @router.get("/{nurse_id}", response_model=NurseOut)
-def get_nurse(nurse_id: int, db: Session = Depends(get_db)):
+def get_nurse(nurse_id: int, db: DbSession):
     db_nurse = NurseService.get_nurse(db=db, nurse_id=nurse_id)
     if db_nurse is None:
         raise HTTPException(status_code=404, detail="Nurse not found")
     return db_nurse
 
 @router.get("/", response_model=list[NurseOut])
-def get_nurses(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return NurseService.get_nurses(db=db, skip=skip, limit=limit)
+def get_nurses(response: Response, db: DbSession, cursor: Optional[str] = None, limit: PageLimit = 100):
+    return with_next_cursor(response, NurseService.get_nurses(db=db, cursor=cursor, limit=limit))
 
 @router.put("/{nurse_id}", response_model=NurseOut)
-def update_nurse(nurse_id: int, nurse: NurseCreate, db: Session = Depends(get_db)):
+def update_nurse(nurse_id: int, nurse: NurseCreate, db: DbSession):
     db_nurse = NurseService.update_nurse(db=db, nurse_id=nurse_id, nurse=nurse)
     if db_nurse is None:
         raise HTTPException(status_code=404, detail="Nurse not found")
     return db_nurse
 
 @router.delete("/{nurse_id}", response_model=NurseOut)
-def delete_nurse(nurse_id: int, db: Session = Depends(get_db)):
+def delete_nurse(nurse_id: int, db: DbSession):
     db_nurse = NurseService.delete_nurse(db=db, nurse_id=nurse_id)
     if db_nurse is None:
         raise HTTPException(status_code=404, detail="Nurse not found")
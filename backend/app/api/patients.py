@@ -1,35 +1,48 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
-from app.schemas.patient import PatientCreate, PatientOut
+from datetime import date
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Query, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
+from app.schemas.patient import PatientCreate, PatientOut, PatientSearch
 from app.services.patient_service import PatientService
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=PatientOut)
-def create_patient(patient: PatientCreate, db: Session = Depends(get_db)):
+def create_patient(patient: PatientCreate, db: DbSession):
     return PatientService.create_patient(db, patient)
 
+@router.get("/search", response_model=list[PatientOut])
+def search_patients(
+    db: DbSession,
+    surname: Optional[str] = None,
+    name: Optional[str] = None,
+    personal_number: Annotated[Optional[str], Query(max_length=11)] = None,
+    date_of_birth: Optional[date] = None,
+    birth_year: Annotated[Optional[int], Query(ge=1900, le=2100)] = None,
+    phone_number: Optional[str] = None,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20
+):
+    """Reception lookup, e.g. `?surname=novak&birth_year=1970`; names ignore case and diacritics."""
+    filters = PatientSearch(
+        surname=surname, name=name, personal_number=personal_number, date_of_birth=date_of_birth,
+        birth_year=birth_year, phone_number=phone_number
+    )
+    return PatientService.search_patients(db, filters, limit)
+
 @router.get("/{patient_id}", response_model=PatientOut)
-def get_patient(patient_id: int, db: Session = Depends(get_db)):
+def get_patient(patient_id: int, db: DbSession):
     db_patient = PatientService.get_patient(db=db, patient_id=patient_id)
     if db_patient is None:
         raise HTTPException(status_code=404, detail="Patient not found")
     return db_patient
 
 @router.get("/", response_model=list[PatientOut])
-def get_patients(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return PatientService.get_patients(db=db, skip=skip, limit=limit)
+def get_patients(response: Response, db: DbSession, cursor: Optional[str] = None, limit: PageLimit = 100):
+    return with_next_cursor(response, PatientService.get_patients(db=db, cursor=cursor, limit=limit))
 
 @router.delete("/{patient_id}", response_model=PatientOut)
-def delete_patient(patient_id: int, db: Session = Depends(get_db)):
+def delete_patient(patient_id: int, db: DbSession):
     db_patient = PatientService.delete_patient(db=db, patient_id=patient_id)
     if db_patient is None:
         raise HTTPException(status_code=404, detail="Patient not found")
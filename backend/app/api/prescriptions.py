@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
+from app.schemas.prescription import PrescriptionBatchOut, PrescriptionCreate, PrescriptionOut, PrescriptionRepeat
+from app.services.prescription_service import PrescriptionService
+
+router = APIRouter()
+
+MAX_BATCH_SIZE = 1000
+
+@router.post("/", response_model=PrescriptionOut)
+def create_prescription(prescription: PrescriptionCreate, db: DbSession):
+    return PrescriptionService.create_prescription(db, prescription)
+
+@router.post("/bulk", response_model=PrescriptionBatchOut)
+def issue_prescriptions(prescriptions: list[PrescriptionCreate], db: DbSession):
+    """Issues a batch of prescriptions and reports a result per item."""
+    if len(prescriptions) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} prescriptions per batch")
+    results = PrescriptionService.issue_prescriptions(db, prescriptions)
+    return {"created": sum(result["status"] == "created" for result in results), "results": results}
+
+@router.post("/repeat", response_model=PrescriptionBatchOut)
+def repeat_prescriptions(repeat: PrescriptionRepeat, db: DbSession):
+    """Reissues repeat prescriptions for a new period and reports a result per id."""
+    if len(repeat.prescription_ids) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} prescriptions per batch")
+    results = PrescriptionService.repeat_prescriptions(db, repeat)
+    return {"created": sum(result["status"] == "created" for result in results), "results": results}
+
+@router.get("/patient/{patient_id}/active", response_model=list[PrescriptionOut])
+def get_active_prescriptions(
+    patient_id: int,
+    response: Response,
+    db: DbSession,
+    at: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: PageLimit = 100
+):
+    """The patient's prescriptions valid now (or at `at`)."""
+    page = PrescriptionService.get_active_prescriptions(db, patient_id, at=at, cursor=cursor, limit=limit)
+    return with_next_cursor(response, page)
+
+@router.get("/{prescription_id}", response_model=PrescriptionOut)
+def get_prescription(prescription_id: int, db: DbSession):
+    db_prescription = PrescriptionService.get_prescription(db=db, prescription_id=prescription_id)
+    if db_prescription is None:
+        raise HTTPException(status_code=404, detail="Prescription not found")
+    return db_prescription
+
+@router.get("/", response_model=list[PrescriptionOut])
+def get_prescriptions(response: Response, db: DbSession, cursor: Optional[str] = None, limit: PageLimit = 100):
+    return with_next_cursor(response, PrescriptionService.get_prescriptions(db=db, cursor=cursor, limit=limit))
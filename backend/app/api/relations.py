@@ -0,0 +1,34 @@
+from typing import Annotated
+from fastapi import APIRouter, HTTPException, Query
+from app.dependencies import DbSession
+from app.schemas.relation import PendingRelativeOut, RelationCreate, RelationOut, RelativeOut
+from app.services.relation_service import MAX_RELATION_DEPTH, RelationService
+
+router = APIRouter()
+
+RelationDepth = Annotated[int, Query(ge=1, le=MAX_RELATION_DEPTH)]
+
+@router.post("/", response_model=RelationOut)
+def create_relation(relation: RelationCreate, db: DbSession):
+    return RelationService.create_relation(db, relation)
+
+@router.get("/patient/{patient_id}", response_model=list[RelationOut])
+def get_relations(patient_id: int, db: DbSession):
+    return RelationService.get_relations(db, patient_id)
+
+@router.get("/patient/{patient_id}/relatives", response_model=list[RelativeOut])
+def get_relatives(patient_id: int, db: DbSession, max_depth: RelationDepth = 2):
+    """Everyone within `max_depth` relations of the patient, e.g. `max_depth=2` adds grandparents and siblings."""
+    return RelationService.get_relatives(db, patient_id, max_depth)
+
+@router.get("/patient/{patient_id}/relatives/pending", response_model=list[PendingRelativeOut])
+def get_relatives_with_pending_requests(patient_id: int, db: DbSession, max_depth: RelationDepth = 1):
+    """Family members with pending requests, e.g. to book them together."""
+    return RelationService.get_relatives_with_pending_requests(db, patient_id, max_depth)
+
+@router.delete("/{patient_id}/{related_id}", response_model=RelationOut)
+def delete_relation(patient_id: int, related_id: int, db: DbSession):
+    db_relation = RelationService.delete_relation(db, patient_id, related_id)
+    if db_relation is None:
+        raise HTTPException(status_code=404, detail="Relation not found")
+    return db_relation
@@ -1,42 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from app.core.cache import cached_response
+from app.core.pagination import Page, PageLimit, with_next_cursor
+from app.dependencies import DbSession
 from app.schemas.request_type import RequestTypeCreate, RequestTypeOut
 from app.services.request_type_service import RequestTypeService
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("/", response_model=RequestTypeOut)
-def create_request_type(request_type: RequestTypeCreate, db: Session = Depends(get_db)):
+def create_request_type(request_type: RequestTypeCreate, db: DbSession):
     return RequestTypeService.create_request_type(db, request_type)
 
 @router.get("/{request_type_id}", response_model=RequestTypeOut)
-def get_request_type(request_type_id: int, db: Session = Depends(get_db)):
+def get_request_type(request_type_id: int, db: DbSession):
     db_request_type = RequestTypeService.get_request_type(db=db, request_type_id=request_type_id)
     if db_request_type is None:
         raise HTTPException(status_code=404, detail="Request type not found")
     return db_request_type
 
 @router.get("/", response_model=list[RequestTypeOut])
-def get_request_types(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return RequestTypeService.get_request_types(db=db, skip=skip, limit=limit)
+def get_request_types(request: Request, response: Response, db: DbSession, cursor: Optional[str] = None,
+                      limit: PageLimit = 100):
+    entry = RequestTypeService.get_request_types_cached(db=db, cursor=cursor, limit=limit)
+    return cached_response(request, response, entry) or with_next_cursor(response, Page(**entry.value))
 
 @router.put("/{request_type_id}", response_model=RequestTypeOut)
-def update_request_type(request_type_id: int, request_type: RequestTypeCreate, db: Session = Depends(get_db)):
+def update_request_type(request_type_id: int, request_type: RequestTypeCreate, db: DbSession):
     db_request_type = RequestTypeService.update_request_type(db=db, request_type_id=request_type_id, request_type=request_type)
     if db_request_type is None:
         raise HTTPException(status_code=404, detail="Request type not found")
     return db_request_type
 
 @router.delete("/{request_type_id}", response_model=RequestTypeOut)
-def delete_request_type(request_type_id: int, db: Session = Depends(get_db)):
+def delete_request_type(request_type_id: int, db: DbSession):
     db_request_type = RequestTypeService.delete_request_type(db=db, request_type_id=request_type_id)
     if db_request_type is None:
         raise HTTPException(status_code=404, detail="Request type not found")
@@ -1,28 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.core.database import SessionLocal
+from datetime import datetime
+from typing import Annotated, Optional
+from fastapi import APIRouter, HTTPException, Query, Response
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
 # Import RequestUpdate schema
-from app.schemas.request import RequestCreate, RequestOut, RequestUpdate
+from app.schemas.request import (
+    RequestCreate, RequestFilter, RequestOut, RequestSort, RequestTransition, RequestTransitionOut, RequestUpdate
+)
 from app.services.request_service import RequestService
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+MAX_BATCH_SIZE = 1000
 
 @router.post("/", response_model=RequestOut)
-def create_request(request: RequestCreate, db: Session = Depends(get_db)):
+def create_request(request: RequestCreate, db: DbSession):
     return RequestService.create_request(db, request)
 
 @router.put("/{request_id}", response_model=RequestOut)
 def update_request(
     request_id: int,
     request_update: RequestUpdate,  # Use the new RequestUpdate schema
-    db: Session = Depends(get_db)
+    db: DbSession
 ):
     db_request = RequestService.update_request_status(
         db=db, request_id=request_id, new_state=request_update.state
@@ -31,13 +30,39 @@ def update_request(
         raise HTTPException(status_code=404, detail="Request not found")
     return db_request
 
+@router.post("/transitions", response_model=RequestTransitionOut)
+def transition_requests(transition: RequestTransition, db: DbSession):
+    """Moves many requests to one state, e.g. approving a morning's queue, and reports a result per id."""
+    if len(transition.ids) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} requests per batch")
+    results = RequestService.transition_requests(db, transition.ids, transition.state)
+    return {"updated": sum(result["status"] == "updated" for result in results), "results": results}
+
 @router.get("/{request_id}", response_model=RequestOut)
-def get_request(request_id: int, db: Session = Depends(get_db)):
+def get_request(request_id: int, db: DbSession):
     db_request = RequestService.get_request(db=db, request_id=request_id)
     if db_request is None:
         raise HTTPException(status_code=404, detail="Request not found")
     return db_request
 
 @router.get("/", response_model=list[RequestOut])
-def get_requests(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return RequestService.get_requests(db=db, skip=skip, limit=limit)
+def get_requests(
+    response: Response,
+    db: DbSession,
+    state: Annotated[Optional[list[str]], Query()] = None,
+    nurse_id: Optional[int] = None,
+    doctor_id: Optional[int] = None,
+    request_type_id: Optional[int] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    sort: RequestSort = "id",
+    cursor: Optional[str] = None,
+    limit: PageLimit = 100
+):
+    """Lists requests, e.g. a nurse's queue: `?state=pending&nurse_id=3&sort=created_at`."""
+    filters = RequestFilter(
+        state=state, nurse_id=nurse_id, doctor_id=doctor_id, request_type_id=request_type_id,
+        created_from=created_from, created_to=created_to
+    )
+    page = RequestService.get_requests(db=db, cursor=cursor, limit=limit, filters=filters, sort=sort)
+    return with_next_cursor(response, page)
@@ -1,8 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
-from typing import List
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from typing import List, Optional
 
-from app.dependencies import get_db
+from app.core.cache import cached_response
+from app.core.pagination import Page, PageLimit, with_next_cursor
+from app.dependencies import DbSession
 from app.models.test_type import MedicalTestType
 # Import both TestTypeOut and TestTypeCreate schemas
 from app.schemas.test_type import TestTypeOut, TestTypeCreate
@@ -12,7 +13,7 @@ router = APIRouter()
 
 # Add the POST endpoint for creating test types
 @router.post("/", response_model=TestTypeOut, status_code=status.HTTP_201_CREATED)
-async def create_test_type(test_type: TestTypeCreate, db: Session = Depends(get_db)):
+async def create_test_type(test_type: TestTypeCreate, db: DbSession):
     """Endpoint to create a new test type."""
     db_test_type = TestTypeService.create_test_type(db=db, test_type_data=test_type)
     return db_test_type
@@ -20,19 +21,21 @@ async def create_test_type(test_type: TestTypeCreate, db: Session = Depends(get_
 
 @router.get("/", response_model=List[TestTypeOut])
 def read_test_types_endpoint(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: DbSession,
+    cursor: Optional[str] = None,
+    limit: PageLimit = 100,
 ):
-    """Endpoint to retrieve a list of test types."""
-    test_types = TestTypeService.get_all_test_types(db=db, skip=skip, limit=limit)
-    return test_types
+    """Endpoint to retrieve a page of test types; answers 304 when If-None-Match matches the ETag."""
+    entry = TestTypeService.get_all_test_types_cached(db=db, cursor=cursor, limit=limit)
+    return cached_response(request, response, entry) or with_next_cursor(response, Page(**entry.value))
 
 
 @router.get("/{test_type_id}", response_model=TestTypeOut)
 def read_test_type_endpoint(
     test_type_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession,
 ):
     """Endpoint to retrieve a specific test type by ID."""
     db_test_type = TestTypeService.get_test_type_by_id(db=db, test_type_id=test_type_id)
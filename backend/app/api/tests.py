@@ -1,20 +1,74 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import Session
-from typing import List
+import json
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from typing import Annotated, Any, List, Optional
 
-from app.dependencies import get_db
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
 from app.models.test import Test
-from app.schemas.test import TestCreate, TestOut, TestUpdate
+from app.schemas.test import TestBatchOut, TestCreate, TestOut, TestUpdate
 from app.services.test_service import TestService
 # Assuming authentication dependencies are defined elsewhere, e.g., app.dependencies
 # from app.dependencies import get_current_active_doctor # Example dependency
 
 router = APIRouter()
 
+MAX_BATCH_SIZE = 10000
+NDJSON_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl")
+
+
+def too_many_results() -> HTTPException:
+    return HTTPException(status_code=413, detail=f"At most {MAX_BATCH_SIZE} results per batch")
+
+
+def decode_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as error:
+        return error
+
+
+async def read_test_batch(request: Request) -> list[Any]:
+    """Decodes the body of `POST /tests/bulk`: a JSON array, or NDJSON with one result per line.
+
+    NDJSON is decoded while it arrives, so an analyzer can stream its results; a line that is
+    not valid JSON becomes a ValueError and is reported for that row only.
+    """
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip()
+    if content_type in NDJSON_CONTENT_TYPES:
+        items, pending = [], b""
+        async for chunk in request.stream():
+            *lines, pending = (pending + chunk).split(b"\n")
+            items += [decode_line(line) for line in lines if line.strip()]
+            if len(items) > MAX_BATCH_SIZE:
+                raise too_many_results()
+        if pending.strip():
+            items.append(decode_line(pending))
+    elif content_type == "application/json":
+        try:
+            items = json.loads(await request.body())
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Body is not valid JSON")
+        if not isinstance(items, list):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Expected a JSON array of results")
+    else:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                            detail="Send application/json or application/x-ndjson")
+    if len(items) > MAX_BATCH_SIZE:
+        raise too_many_results()
+    return items
+
+@router.post("/bulk", response_model=TestBatchOut)
+def ingest_tests_endpoint(items: Annotated[list[Any], Depends(read_test_batch)], db: DbSession):
+    """Bulk ingestion for lab analyzers: a JSON array or an NDJSON stream of TestCreate items.
+
+    Valid rows are stored even when others fail; the failed ones are listed by index.
+    """
+    return TestService.ingest_tests(db=db, items=items)
+
 @router.post("/", response_model=TestOut, status_code=status.HTTP_201_CREATED)
 def create_test_endpoint(
     test_data: TestCreate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     # current_doctor: Doctor = Depends(get_current_active_doctor) # Add auth if needed
 ):
     """Endpoint to create a new test result."""
@@ -24,7 +78,7 @@ def create_test_endpoint(
 @router.get("/{test_id}", response_model=TestOut)
 def read_test_endpoint(
     test_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession,
     # Add auth dependencies if needed, e.g., get_current_user
 ):
     """Endpoint to retrieve a specific test result by ID."""
@@ -37,22 +91,23 @@ def read_test_endpoint(
 
 @router.get("/", response_model=List[TestOut])
 def read_tests_endpoint(
-    skip: int = 0,
-    limit: int = 100,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: DbSession,
+    cursor: Optional[str] = None,
+    limit: PageLimit = 100,
     # Add auth dependencies if needed
 ):
-    """Endpoint to retrieve a list of test results."""
+    """Endpoint to retrieve a page of test results; the next page's cursor is in X-Next-Cursor."""
     # Use TestService class
-    tests = TestService.get_all_tests(db=db, skip=skip, limit=limit)
+    page = TestService.get_all_tests(db=db, cursor=cursor, limit=limit)
     # Add filtering/authorization based on user role if needed
-    return tests
+    return with_next_cursor(response, page)
 
 @router.put("/{test_id}", response_model=TestOut)
 def update_test_endpoint(
     test_id: int,
     test_update_data: TestUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession,
     # current_doctor: Doctor = Depends(get_current_active_doctor) # Add auth if needed
 ):
     """Endpoint to update an existing test result."""
@@ -65,7 +120,7 @@ def update_test_endpoint(
 @router.delete("/{test_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_test_endpoint(
     test_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession,
     # current_doctor: Doctor = Depends(get_current_active_doctor) # Add auth if needed
 ):
     """Endpoint to delete a test result."""
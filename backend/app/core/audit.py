@@ -0,0 +1,17 @@
+from sqlalchemy.orm import Session
+
+from app.core.batch_writer import BatchWriter
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.appointment_history import AppointmentHistory
+
+# AppointmentHistory is append-only: rows about bookings and state changes are batched here.
+audit_writer = BatchWriter(
+    AppointmentHistory, SessionLocal, batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_MS / 1000, max_buffer=settings.AUDIT_MAX_BUFFER
+)
+
+
+def audit_on_commit(db: Session, rows: list[dict]) -> None:
+    """Hands AppointmentHistory `rows` to `audit_writer` once `db` commits; a rollback discards them."""
+    audit_writer.record_on_commit(db, rows)
@@ -0,0 +1,99 @@
+import logging
+import threading
+from typing import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.core.transaction import on_commit
+
+logger = logging.getLogger(__name__)
+
+
+class BatchWriter:
+    """Buffers rows of `model` and inserts them in batches off the request path.
+
+    A background thread flushes the buffer once `batch_size` rows are waiting or every
+    `flush_interval` seconds, each batch as one INSERT in a session of its own. `stop` flushes
+    what is left, so rows are only lost if the process dies without shutting down. A failed
+    flush keeps its rows for the next attempt, dropping the oldest beyond `max_buffer`.
+    """
+
+    def __init__(self, model, session_factory: Callable[[], Session], batch_size: int, flush_interval: float,
+                 max_buffer: int):
+        self.model = model
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.written = 0
+        self.dropped = 0
+        self._rows: list[dict] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def pending(self) -> int:
+        return len(self._rows)
+
+    def record(self, rows: list[dict]) -> None:
+        with self._lock:
+            self._rows.extend(rows)
+            full = len(self._rows) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> int:
+        """Writes every buffered row; returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if not rows:
+                return 0
+            try:
+                with self.session_factory() as db:
+                    db.execute(insert(self.model), rows)
+                    db.commit()
+            except Exception:
+                logger.exception("Could not write %d %s rows, keeping them for the next flush.", len(rows),
+                                 self.model.__tablename__)
+                with self._lock:
+                    self._rows[:0] = rows
+                    overflow = len(self._rows) - self.max_buffer
+                    if overflow > 0:
+                        del self._rows[:overflow]
+                        self.dropped += overflow
+                        logger.error("%s buffer full, dropped the %d oldest rows.", self.model.__tablename__, overflow)
+                return 0
+            self.written += len(rows)
+            return len(rows)
+
+    def record_on_commit(self, db: Session, rows: list[dict]) -> None:
+        """Records `rows` once `db` commits; a rollback discards them."""
+        on_commit(db, lambda: self.record(rows))
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.model.__tablename__}-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background thread and flushes the rest of the buffer."""
+        if self._thread is not None:
+            self._stopping.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if not self._stopping.is_set():
+                self.flush()
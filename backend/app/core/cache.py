@@ -0,0 +1,292 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+from fastapi import Request, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.transaction import on_commit
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached JSON-ready payload with the ETag of its serialized form."""
+    value: Any
+    etag: str
+    expires_at: float
+
+
+def make_etag(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return '"' + hashlib.sha1(payload.encode()).hexdigest() + '"'
+
+
+class CacheBackend:
+    """Interface shared by the cache implementations.
+
+    Keys are tuples whose first element is a namespace (e.g. "doctors"), so all entries of
+    one kind of data can be invalidated together when it changes. Values must be JSON-ready.
+    """
+
+    name = "base"
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, key: tuple, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        raise NotImplementedError
+
+    def invalidate(self, namespace: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def stats(self) -> dict:
+        raise NotImplementedError
+
+    def start(self) -> None:
+        """Starts background work such as listening for invalidations; called from the app lifespan."""
+
+    def stop(self) -> None:
+        """Stops what `start` started."""
+
+    async def get_async(self, key: tuple) -> Optional[CacheEntry]:
+        return self.get(key)
+
+    async def set_async(self, key: tuple, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        return self.set(key, value, ttl)
+
+    def get_or_load(self, key: tuple, loader: Callable[[], Any], ttl: Optional[float] = None) -> CacheEntry:
+        entry = self.get(key)
+        if entry is None:
+            entry = self.set(key, loader(), ttl)
+        return entry
+
+    async def get_or_load_async(self, key: tuple, loader: Callable[[], Awaitable[Any]],
+                                ttl: Optional[float] = None) -> CacheEntry:
+        entry = await self.get_async(key)
+        if entry is None:
+            entry = await self.set_async(key, await loader(), ttl)
+        return entry
+
+
+class TTLCache(CacheBackend):
+    """In-process LRU cache whose entries also expire after `ttl` seconds."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= self.clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def set(self, key: tuple, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        entry = CacheEntry(value=value, etag=make_etag(value), expires_at=self.clock() + ttl)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, namespace: Hashable) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"backend": self.name, "size": len(self._entries), "maxsize": self.maxsize, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses}
+
+
+class RedisCache(CacheBackend):
+    """Cache shared by all workers through a Redis-protocol server.
+
+    Each worker keeps the entries it has read in a small local `TTLCache` for `local_ttl`
+    seconds. Every namespace has a set of its entry keys on the server, so an invalidation
+    deletes exactly those keys instead of scanning the keyspace; it is also published on
+    `channel`, so every other worker drops its local copies as well; `local_ttl` bounds how
+    stale a worker can get if it misses a message. When the server is unreachable the cache
+    is bypassed and values are loaded from the database.
+    """
+
+    name = "redis"
+
+    def __init__(self, client, ttl: float, maxsize: int, local_ttl: float, prefix: str = "cache",
+                 channel: str = "cache:invalidate"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.channel = channel
+        self.local = TTLCache(maxsize=maxsize, ttl=local_ttl)
+        self.origin = uuid.uuid4().hex
+        self.hits = 0
+        self.misses = 0
+        self._pubsub = None
+        self._listener = None
+
+    def namespace_key(self, namespace: Hashable) -> str:
+        """The server-side set of the namespace's entry keys."""
+        return f"{self.prefix}:{namespace}"
+
+    def redis_key(self, key: tuple) -> str:
+        # Parts such as event_type come from query strings, so they are hashed rather than joined.
+        digest = hashlib.sha1(json.dumps(key[1:], default=str).encode()).hexdigest()
+        return f"{self.namespace_key(key[0])}:{digest}"
+
+    def get(self, key: tuple) -> Optional[CacheEntry]:
+        entry = self.local.get(key)
+        if entry is None:
+            try:
+                raw = self.client.get(self.redis_key(key))
+            except Exception:
+                logger.warning("Cache server unavailable, reading through to the database.", exc_info=True)
+                raw = None
+            if raw is not None:
+                entry = self.local.set(key, json.loads(raw))
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def set(self, key: tuple, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        ttl = self.ttl if ttl is None else ttl
+        redis_key, namespace_key = self.redis_key(key), self.namespace_key(key[0])
+        try:
+            pipeline = self.client.pipeline(transaction=False)
+            pipeline.set(redis_key, json.dumps(value), px=int(ttl * 1000))
+            pipeline.sadd(namespace_key, redis_key)
+            # The set outlives its entries; keys that expired on their own are dropped with it.
+            pipeline.pexpire(namespace_key, int(max(ttl, self.ttl) * 1000))
+            pipeline.execute()
+        except Exception:
+            logger.warning("Cache server unavailable, value kept in this worker only.", exc_info=True)
+        return self.local.set(key, value, ttl)
+
+    async def get_async(self, key: tuple) -> Optional[CacheEntry]:
+        # The Redis client blocks, so only local hits are answered on the event loop.
+        entry = self.local.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+        return await asyncio.to_thread(self.get, key)
+
+    async def set_async(self, key: tuple, value: Any, ttl: Optional[float] = None) -> CacheEntry:
+        return await asyncio.to_thread(self.set, key, value, ttl)
+
+    def invalidate(self, namespace: Hashable) -> None:
+        self.local.invalidate(namespace)
+        try:
+            # Reading and dropping the set in one transaction loses no key added meanwhile.
+            pipeline = self.client.pipeline(transaction=True)
+            pipeline.smembers(self.namespace_key(namespace))
+            pipeline.delete(self.namespace_key(namespace))
+            keys, _ = pipeline.execute()
+            if keys:
+                self.client.delete(*keys)
+            self.client.publish(self.channel, json.dumps({"namespace": namespace, "origin": self.origin}))
+        except Exception:
+            logger.warning("Could not invalidate %r on the cache server.", namespace, exc_info=True)
+
+    def on_invalidation(self, message: dict) -> None:
+        data = json.loads(message["data"])
+        if data["origin"] != self.origin:
+            self.local.invalidate(data["namespace"])
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        return {"backend": self.name, "size": self.local.stats()["size"], "maxsize": self.local.maxsize,
+                "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+    def start(self) -> None:
+        if self._listener is not None:
+            return
+        self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(**{self.channel: self.on_invalidation})
+        self._listener = self._pubsub.run_in_thread(sleep_time=0.1, daemon=True)
+
+    def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener.join(timeout=1)
+            self._pubsub.close()
+            self._listener = self._pubsub = None
+
+
+def create_cache() -> CacheBackend:
+    """Builds the backend selected by CACHE_BACKEND ("memory" or "redis")."""
+    if settings.CACHE_BACKEND == "redis":
+        import redis
+        from redis.backoff import NoBackoff
+        from redis.retry import Retry
+
+        # RESP2 is spoken by every Redis-compatible server, not only Redis 6+. A cache miss is cheaper
+        # than retrying with backoff, so a slow or dead server costs one timeout per call at most.
+        client = redis.Redis.from_url(
+            settings.CACHE_URL, protocol=2, retry=Retry(NoBackoff(), 0),
+            socket_timeout=settings.CACHE_SOCKET_TIMEOUT, socket_connect_timeout=settings.CACHE_SOCKET_TIMEOUT
+        )
+        return RedisCache(client, ttl=settings.REFERENCE_CACHE_TTL, maxsize=settings.REFERENCE_CACHE_MAXSIZE,
+                          local_ttl=settings.CACHE_LOCAL_TTL)
+    return TTLCache(maxsize=settings.REFERENCE_CACHE_MAXSIZE, ttl=settings.REFERENCE_CACHE_TTL)
+
+
+cache = create_cache()
+
+
+def invalidate_on_commit(db: Session, namespace: Hashable) -> None:
+    """Drops the namespace from `cache` once `db` commits.
+
+    Services only flush, so invalidating right away would let a concurrent request cache the
+    old rows again before the change is visible; a rollback leaves the cache untouched.
+    """
+    on_commit(db, lambda: cache.invalidate(namespace))
+
+
+def cached_response(request: Request, response: Response, entry: CacheEntry) -> Optional[Response]:
+    """Sets ETag and Cache-Control on `response`; returns a 304 response if the client's copy is current."""
+    headers = {"ETag": entry.etag, "Cache-Control": f"private, max-age={settings.REFERENCE_CACHE_MAX_AGE}"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if entry.etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -12,5 +12,47 @@ class Settings(BaseSettings):
     SECRET_KEY: str = os.getenv("SECRET_KEY", "your-secret-key")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+    # Connection pool, per uvicorn worker: at most DB_POOL_SIZE + DB_MAX_OVERFLOW connections.
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    # Seconds to wait for a free connection before failing the request.
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Seconds after which a connection is replaced, before the server or a proxy drops it.
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+    # PostgreSQL statement_timeout in milliseconds; 0 disables it.
+    DB_STATEMENT_TIMEOUT_MS: int = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))
 
-settings = Settings()
\ No newline at end of file
+    # Per-worker cache of the reference lists (doctors, specializations, request and test types).
+    REFERENCE_CACHE_TTL: float = float(os.getenv("REFERENCE_CACHE_TTL", "300"))
+    REFERENCE_CACHE_MAXSIZE: int = int(os.getenv("REFERENCE_CACHE_MAXSIZE", "256"))
+    # Seconds browsers may reuse a reference list before revalidating it with If-None-Match.
+    REFERENCE_CACHE_MAX_AGE: int = int(os.getenv("REFERENCE_CACHE_MAX_AGE", "60"))
+    # Seconds a page of /api/terms stays cached; bookings invalidate it earlier.
+    TERMS_CACHE_TTL: float = float(os.getenv("TERMS_CACHE_TTL", "30"))
+
+    # "memory" keeps the cache per worker; "redis" shares it between workers through CACHE_URL.
+    CACHE_BACKEND: str = os.getenv("CACHE_BACKEND", "memory")
+    CACHE_URL: str = os.getenv("CACHE_URL", "redis://localhost:6379/0")
+    CACHE_SOCKET_TIMEOUT: float = float(os.getenv("CACHE_SOCKET_TIMEOUT", "0.5"))
+    # With the redis backend, seconds a worker reuses an entry without asking the server.
+    CACHE_LOCAL_TTL: float = float(os.getenv("CACHE_LOCAL_TTL", "5"))
+
+    # AppointmentHistory rows are written in batches of up to AUDIT_BATCH_SIZE rows, at least
+    # every AUDIT_FLUSH_INTERVAL_MS; AUDIT_MAX_BUFFER rows are kept while the database is down.
+    AUDIT_BATCH_SIZE: int = int(os.getenv("AUDIT_BATCH_SIZE", "200"))
+    AUDIT_FLUSH_INTERVAL_MS: int = int(os.getenv("AUDIT_FLUSH_INTERVAL_MS", "500"))
+    AUDIT_MAX_BUFFER: int = int(os.getenv("AUDIT_MAX_BUFFER", "10000"))
+    # The same for patient notifications, flushed sooner since patients are waiting for them.
+    NOTIFICATION_BATCH_SIZE: int = int(os.getenv("NOTIFICATION_BATCH_SIZE", "200"))
+    NOTIFICATION_FLUSH_INTERVAL_MS: int = int(os.getenv("NOTIFICATION_FLUSH_INTERVAL_MS", "200"))
+    NOTIFICATION_MAX_BUFFER: int = int(os.getenv("NOTIFICATION_MAX_BUFFER", "10000"))
+
+    # "memory" serves /medicines/search from an index each worker loads at startup; "database"
+    # queries the medicine table (with pg_trgm similarity on PostgreSQL).
+    MEDICINE_SEARCH_BACKEND: str = os.getenv("MEDICINE_SEARCH_BACKEND", "memory")
+    # Seconds between checks for medicines added by other workers.
+    MEDICINE_INDEX_REFRESH_SECONDS: float = float(os.getenv("MEDICINE_INDEX_REFRESH_SECONDS", "30"))
+
+
+settings = Settings()
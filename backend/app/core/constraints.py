@@ -0,0 +1,13 @@
+from sqlalchemy.exc import IntegrityError
+
+
+def violates_unique_index(error: IntegrityError, name: str, table: str, columns: tuple[str, ...]) -> bool:
+    """True if `error` was raised by the unique index `name` on `table(columns)`.
+
+    PostgreSQL reports the index name; SQLite only lists the columns, as in
+    "UNIQUE constraint failed: request.patient_id, request.appointment_id".
+    """
+    constraint_name = getattr(getattr(error.orig, "diag", None), "constraint_name", None)
+    if constraint_name is not None:
+        return constraint_name == name
+    return str(error.orig) == "UNIQUE constraint failed: " + ", ".join(f"{table}.{column}" for column in columns)
@@ -1,22 +1,144 @@
 from sqlmodel import SQLModel
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.models import *
 from app.core.config import settings
 import os
+import threading
+import time
 
 # Use the DATABASE_URL from settings, with a fallback to SQLite
 DATABASE_URL = settings.DATABASE_URL or "sqlite:///./test.db"
 
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long checkouts wait for a free connection."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._metrics_lock = threading.Lock()
+        self.wait_count = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            with self._metrics_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            with self._metrics_lock:
+                self.wait_count += 1
+                self.wait_total += waited
+                self.wait_max = max(self.wait_max, waited)
+
+
+class MeteredAsyncAdaptedQueuePool(MeteredQueuePool, AsyncAdaptedQueuePool):
+    """MeteredQueuePool for the async engine; waits for a free connection are timed the same way."""
+
+
+engine_args = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+
 # For PostgreSQL from Neon.tech, we need to ensure SSL mode is enabled
 connect_args = {}
 if DATABASE_URL.startswith("postgresql"):
     connect_args = {"sslmode": "require"}
+    engine_args.update(
+        poolclass=MeteredQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **engine_args)
+
+if DATABASE_URL.startswith("postgresql") and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    # Set per connection rather than as a startup option, which connection poolers reject.
+    @event.listens_for(engine, "connect")
+    def set_statement_timeout(dbapi_connection, connection_record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"SET statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+        dbapi_connection.commit()
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+# Objects stay loaded after the unit-of-work commit, so responses need no refresh SELECTs.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_async_database_url(url: str):
+    """Maps the sync DATABASE_URL onto its async driver: asyncpg for PostgreSQL, aiosqlite for SQLite."""
+    async_url = make_url(url)
+    if async_url.get_backend_name() == "postgresql":
+        # asyncpg takes SSL through connect_args and rejects libpq-only query options.
+        return async_url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode", "channel_binding"])
+    if async_url.get_backend_name() == "sqlite":
+        return async_url.set(drivername="sqlite+aiosqlite")
+    return async_url
+
+
+async_engine_args = {"pool_pre_ping": settings.DB_POOL_PRE_PING}
+async_connect_args = {}
+if DATABASE_URL.startswith("postgresql"):
+    async_connect_args = {"ssl": "require"}
+    async_engine_args.update(
+        poolclass=MeteredAsyncAdaptedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+    )
+
+async_engine = create_async_engine(
+    get_async_database_url(DATABASE_URL), connect_args=async_connect_args, **async_engine_args
+)
+
+if DATABASE_URL.startswith("postgresql") and settings.DB_STATEMENT_TIMEOUT_MS > 0:
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_async_statement_timeout(dbapi_connection, connection_record):
+        dbapi_connection.run_async(
+            lambda connection: connection.execute(f"SET statement_timeout = {int(settings.DB_STATEMENT_TIMEOUT_MS)}")
+        )
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 
 def create_tables():
     SQLModel.metadata.create_all(bind=engine)
-    print(f"Tables created using {DATABASE_URL}")
\ No newline at end of file
+    print(f"Tables created using {DATABASE_URL}")
+
+def get_pool_metrics():
+    """Snapshot of both connection pools for sizing them against the number of workers.
+
+    The async engine keeps its own pool, reported under "async_pool".
+    """
+    return {**_pool_metrics(engine.pool), "async_pool": _pool_metrics(async_engine.sync_engine.pool)}
+
+def _pool_metrics(pool):
+    metrics = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, MeteredQueuePool):
+        with pool._metrics_lock:
+            metrics.update(
+                wait_count=pool.wait_count,
+                wait_total_ms=pool.wait_total * 1000,
+                wait_avg_ms=pool.wait_total * 1000 / pool.wait_count if pool.wait_count else 0.0,
+                wait_max_ms=pool.wait_max * 1000,
+                timeouts=pool.timeouts,
+            )
+    return metrics
@@ -0,0 +1,148 @@
+import asyncio
+import itertools
+import json
+import signal
+import threading
+from typing import AsyncIterator, Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.core.transaction import on_commit
+
+# Events a subscriber may fall behind by before it is disconnected; it reconnects and refetches.
+SUBSCRIBER_QUEUE_SIZE = 256
+HEARTBEAT_SECONDS = 15
+RECONNECT_DELAY_MS = 3000
+
+
+class Subscription:
+    """One listener's queue, bound to the event loop it was created on."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, accepts: Callable[[dict], bool]):
+        self.loop = loop
+        self.accepts = accepts
+        self.queue: "asyncio.Queue[Optional[dict]]" = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.closed = False
+
+    def deliver(self, message: Optional[dict]) -> None:
+        """Runs on `loop`; None ends the subscription."""
+        if self.closed:
+            return
+        if message is None or self.queue.full():
+            self.closed = True
+            # A reader that fell behind has lost events anyway; it reconnects and refetches.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return
+        if self.accepts(message["data"]):
+            self.queue.put_nowait(message)
+
+
+class EventBroker:
+    """In-process publish/subscribe fan-out for server-sent events.
+
+    `publish` may be called from any thread (sync endpoints run in the threadpool); each event
+    loop with subscribers gets one callback per event that fans it out to its queues. Only this
+    worker's subscribers are reached: with several workers each one streams its own events.
+    """
+
+    def __init__(self):
+        self._subscriptions: set[Subscription] = set()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self, accepts: Callable[[dict], bool] = lambda data: True) -> Subscription:
+        subscription = Subscription(asyncio.get_running_loop(), accepts)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, event_type: str, data: dict) -> None:
+        self._send({"id": next(self._ids), "event": event_type, "data": data})
+
+    def close(self) -> None:
+        """Ends every open stream."""
+        self._send(None)
+
+    def _send(self, message: Optional[dict]) -> None:
+        with self._lock:
+            by_loop: dict[asyncio.AbstractEventLoop, list[Subscription]] = {}
+            for subscription in self._subscriptions:
+                by_loop.setdefault(subscription.loop, []).append(subscription)
+        for loop, subscriptions in by_loop.items():
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._fan_out, subscriptions, message)
+
+    @staticmethod
+    def _fan_out(subscriptions: list[Subscription], message: Optional[dict]) -> None:
+        for subscription in subscriptions:
+            subscription.deliver(message)
+
+
+broker = EventBroker()
+
+
+def publish_on_commit(db: Session, event_type: str, data: dict) -> None:
+    """Publishes the event once `db` commits; a rollback discards it, so undone changes are never announced."""
+    on_commit(db, lambda: broker.publish(event_type, data))
+
+
+def close_streams_on_exit_signal() -> None:
+    """Ends every stream as soon as SIGINT or SIGTERM arrives, before the server starts shutting down.
+
+    uvicorn waits for open connections before it runs the lifespan shutdown, so streams that were
+    only closed there would keep it, and the writers stopped after them, waiting forever. Call it
+    from the lifespan startup: the server's own handlers are installed by then and still run.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        previous = signal.getsignal(signum)
+        if not callable(previous):
+            continue
+
+        def handle(signum, frame, previous=previous):
+            # A signal handler must not take the broker's lock, so the streams are closed from the loop.
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(broker.close)
+            previous(signum, frame)
+
+        signal.signal(signum, handle)
+
+
+def format_sse(message: dict) -> str:
+    return f"id: {message['id']}\nevent: {message['event']}\ndata: {json.dumps(message['data'])}\n\n"
+
+
+async def stream_events(accepts: Callable[[dict], bool] = lambda data: True,
+                        heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+    """Yields the broker's events as a text/event-stream body until the client goes away.
+
+    The subscription is made when streaming starts, so it is always released by `finally`.
+    Events are not replayed after a reconnect; clients refetch the list when they reconnect.
+    """
+    subscription = broker.subscribe(accepts)
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n: subscribed\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(subscription.queue.get(), timeout=heartbeat)
+            except asyncio.TimeoutError:
+                # Comment lines keep proxies from closing an idle stream.
+                yield ": keep-alive\n\n"
+                continue
+            if message is None:
+                return
+            yield format_sse(message)
+    finally:
+        broker.unsubscribe(subscription)
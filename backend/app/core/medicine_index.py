@@ -0,0 +1,133 @@
+import bisect
+import re
+import threading
+import time
+from collections import Counter
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.prescription_medicine import Medicine
+
+# Minimum trigram similarity of a fuzzy match, the pg_trgm default.
+SIMILARITY_THRESHOLD = 0.3
+WORD = re.compile(r"\w+")
+# Refreshes re-read this many ids below the highest one seen: ids are allocated before commit,
+# so a slow transaction can commit a lower id after a faster one's higher id was indexed.
+REFRESH_ID_WINDOW = 1000
+
+
+def trigrams(normalized: str) -> set[str]:
+    """The trigrams of a normalized name as pg_trgm builds them, each word padded as "  word "."""
+    return {padded[i:i + 3] for word in WORD.findall(normalized) for padded in [f"  {word} "]
+            for i in range(len(padded) - 2)}
+
+
+class MedicineIndex:
+    """In-memory search index over the medicine catalogue, for search-as-you-type.
+
+    Prefix matches come from a sorted list of normalized names (bisect); fuzzy matches from
+    trigram posting lists, scored like pg_trgm's similarity(). The index is loaded once at
+    startup, gets this worker's inserts after they commit, and picks up other workers' inserts
+    every `refresh_interval` seconds by reading the rows above `max_id - REFRESH_ID_WINDOW`;
+    rows already indexed are skipped. Medicines are never renamed or deleted through the API,
+    so only new rows need to be followed.
+    """
+
+    def __init__(self, refresh_interval: float):
+        self.refresh_interval = refresh_interval
+        self.loaded = False
+        self.max_id = 0
+        self.refreshed_at = 0.0
+        self._medicines: dict[int, tuple[str, Optional[str], str]] = {}
+        self._sorted: list[tuple[str, int]] = []
+        self._postings: dict[str, list[int]] = {}
+        self._trigram_counts: dict[int, int] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._medicines)
+
+    def load(self, db: Session) -> None:
+        """Replaces the index with the whole medicine table."""
+        with self._lock:
+            self._medicines.clear()
+            self._sorted.clear()
+            self._postings.clear()
+            self._trigram_counts.clear()
+            self.max_id = 0
+            self._add_rows(db, append_sorted=True)
+            self._sorted.sort()
+            self.loaded = True
+
+    def refresh(self, db: Session) -> None:
+        """Adds the medicines committed since the last load or refresh, including late commits of lower ids."""
+        with self._lock:
+            self._add_rows(db, append_sorted=False)
+
+    def refresh_if_stale(self, db: Session) -> None:
+        if time.monotonic() - self.refreshed_at >= self.refresh_interval:
+            self.refresh(db)
+
+    def add(self, medicine_id: int, name: str, description: Optional[str], normalized: str) -> None:
+        with self._lock:
+            self._add(medicine_id, name, description, normalized, append_sorted=False)
+
+    def search(self, prefix: str, limit: int, fuzzy: bool = True) -> list[dict]:
+        """Up to `limit` medicines as dicts of id, name and description.
+
+        Names starting with `prefix` come first, in name order; with `fuzzy` the rest are filled
+        with names similar to it, most similar first.
+        """
+        with self._lock:
+            ids = []
+            start = bisect.bisect_left(self._sorted, (prefix,))
+            for normalized, medicine_id in self._sorted[start:start + limit]:
+                if not normalized.startswith(prefix):
+                    break
+                ids.append(medicine_id)
+            if fuzzy and len(ids) < limit:
+                ids.extend(self._similar(prefix, limit - len(ids), exclude=set(ids)))
+            return [{"id": medicine_id, "name": self._medicines[medicine_id][0],
+                     "description": self._medicines[medicine_id][1]} for medicine_id in ids]
+
+    def _similar(self, normalized: str, limit: int, exclude: set[int]) -> list[int]:
+        query = trigrams(normalized)
+        shared = Counter()
+        for trigram in query:
+            shared.update(self._postings.get(trigram, ()))
+        scored = []
+        for medicine_id, count in shared.items():
+            similarity = count / (len(query) + self._trigram_counts[medicine_id] - count)
+            if similarity >= SIMILARITY_THRESHOLD and medicine_id not in exclude:
+                scored.append((-similarity, self._medicines[medicine_id][2], medicine_id))
+        scored.sort()
+        return [medicine_id for _, _, medicine_id in scored[:limit]]
+
+    def _add_rows(self, db: Session, append_sorted: bool) -> None:
+        statement = select(Medicine.id, Medicine.name, Medicine.description, Medicine.name_normalized).where(
+            Medicine.id > self.max_id - REFRESH_ID_WINDOW
+        ).order_by(Medicine.id)
+        for row in db.execute(statement):
+            self._add(*row, append_sorted=append_sorted)
+        self.refreshed_at = time.monotonic()
+
+    def _add(self, medicine_id: int, name: str, description: Optional[str], normalized: str,
+             append_sorted: bool) -> None:
+        if medicine_id in self._medicines:
+            return
+        self._medicines[medicine_id] = (name, description, normalized)
+        if append_sorted:
+            self._sorted.append((normalized, medicine_id))
+        else:
+            bisect.insort(self._sorted, (normalized, medicine_id))
+        medicine_trigrams = trigrams(normalized)
+        for trigram in medicine_trigrams:
+            self._postings.setdefault(trigram, []).append(medicine_id)
+        self._trigram_counts[medicine_id] = len(medicine_trigrams)
+        self.max_id = max(self.max_id, medicine_id)
+
+
+medicine_index = MedicineIndex(refresh_interval=settings.MEDICINE_INDEX_REFRESH_SECONDS)
@@ -0,0 +1,19 @@
+from sqlalchemy.orm import Session
+
+from app.core.batch_writer import BatchWriter
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.notification import Notification
+
+notification_writer = BatchWriter(
+    Notification, SessionLocal, batch_size=settings.NOTIFICATION_BATCH_SIZE,
+    flush_interval=settings.NOTIFICATION_FLUSH_INTERVAL_MS / 1000, max_buffer=settings.NOTIFICATION_MAX_BUFFER
+)
+
+
+def notify_on_commit(db: Session, rows: list[dict]) -> None:
+    """Hands Notification `rows` to `notification_writer` once `db` commits; a rollback discards them.
+
+    Enqueueing only appends to a buffer, so producers such as book_term never wait for the insert.
+    """
+    notification_writer.record_on_commit(db, rows)
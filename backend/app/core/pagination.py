@@ -0,0 +1,95 @@
+import base64
+import operator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Annotated, Any, Optional
+
+from fastapi import HTTPException, Query, Response, status
+from sqlalchemy import and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.dates import as_utc
+
+MAX_PAGE_SIZE = 1000
+# Query parameter type shared by the list endpoints: `limit: PageLimit = 100`.
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+@dataclass
+class Page:
+    items: list
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(last_id: int, sort_value: Any = None) -> str:
+    raw = str(last_id) if sort_value is None else f"{sort_value.isoformat()}|{last_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def decode_sort_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        sort_part, id_part = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return as_utc(datetime.fromisoformat(sort_part)), int(id_part)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset(statement, id_column, cursor: Optional[str], limit: int, sort_column=None, descending: bool = False):
+    """Orders `statement` by `id_column` (or by `sort_column`, then id) and limits it to the rows after `cursor`.
+
+    One row more than `limit` is fetched so `to_page` can tell whether another page exists
+    without a COUNT; an index on the ordering columns serves any page in the same time.
+    `sort_column` must be a non-null datetime column.
+    """
+    after = operator.lt if descending else operator.gt
+    if cursor is not None and sort_column is None:
+        statement = statement.where(after(id_column, decode_cursor(cursor)))
+    elif cursor is not None:
+        sort_value, last_id = decode_sort_cursor(cursor)
+        statement = statement.where(or_(
+            after(sort_column, sort_value),
+            and_(sort_column == sort_value, after(id_column, last_id))
+        ))
+    order = [sort_column, id_column] if sort_column is not None else [id_column]
+    return statement.order_by(*(column.desc() if descending else column for column in order)).limit(limit + 1)
+
+
+def to_page(rows, limit: int, sort_key: Optional[str] = None) -> Page:
+    rows = list(rows)
+    if len(rows) <= limit:
+        return Page(items=rows)
+    last = rows[limit - 1]
+    return Page(items=rows[:limit], next_cursor=encode_cursor(last.id, getattr(last, sort_key) if sort_key else None))
+
+
+def paginate(db: Session, statement, id_column, cursor: Optional[str], limit: int, sort_column=None,
+             descending: bool = False) -> Page:
+    """Runs `statement` (selecting ORM entities) as one keyset page, see `keyset`."""
+    rows = db.scalars(keyset(statement, id_column, cursor, limit, sort_column, descending)).all()
+    return to_page(rows, limit, sort_column.key if sort_column is not None else None)
+
+
+async def paginate_async(db: AsyncSession, statement, id_column, cursor: Optional[str], limit: int,
+                         sort_column=None, descending: bool = False) -> Page:
+    """Async variant of `paginate` for `async def` endpoints."""
+    rows = (await db.scalars(keyset(statement, id_column, cursor, limit, sort_column, descending))).all()
+    return to_page(rows, limit, sort_column.key if sort_column is not None else None)
+
+
+def with_next_cursor(response: Response, page: Page) -> list[Any]:
+    """Returns the page's items and passes its cursor in the X-Next-Cursor header.
+
+    The body stays a plain list, so clients that read only the first page keep working.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    return page.items
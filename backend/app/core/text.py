@@ -0,0 +1,42 @@
+import re
+import unicodedata
+from typing import Optional
+
+
+def normalize_search_text(text: str) -> str:
+    """Folds `text` for case- and diacritics-insensitive matching.
+
+    "Ibálgin  RAPID" and "ibalgin rapid" both become "ibalgin rapid".
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(stripped.casefold().split())
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Digits of a phone number without the Czech country code.
+
+    "+420 603 123 456", "00420603123456" and "603 123 456" all become "603123456".
+    """
+    digits = re.sub(r"\D", "", phone or "")
+    if digits.startswith("00"):
+        digits = digits[2:]
+    if digits.startswith("420") and len(digits) == 12:
+        digits = digits[3:]
+    return digits or None
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """The smallest string greater than every string starting with `prefix`, for `>= prefix AND < bound` scans."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def starts_with(column, prefix: str, dialect: str):
+    """SQL condition for `column` starting with `prefix`, in the form the dialect's index can serve.
+
+    PostgreSQL matches with LIKE 'prefix%', which needs a text_pattern_ops index under a non-C
+    collation. Other databases compare bytes, so a `>= prefix AND < bound` range walks a plain index.
+    """
+    if dialect == "postgresql":
+        return column.startswith(prefix, autoescape=True)
+    return (column >= prefix) & (column < prefix_upper_bound(prefix))
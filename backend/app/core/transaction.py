@@ -0,0 +1,30 @@
+from typing import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+PENDING_CALLBACKS_KEY = "pending_after_commit"
+
+
+def on_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Runs `callback` once `db` commits; a rollback drops it, so undone changes have no side effects.
+
+    Services only flush; the unit of work in `get_db` commits, so work that must only happen for
+    persisted changes (events, audit rows, notifications, in-memory indexes) is deferred here.
+    """
+    pending = db.info.get(PENDING_CALLBACKS_KEY)
+    if pending is None:
+        pending = db.info[PENDING_CALLBACKS_KEY] = []
+        event.listen(db, "after_commit", _run_pending)
+        event.listen(db, "after_rollback", _drop_pending)
+    pending.append(callback)
+
+
+def _run_pending(session: Session) -> None:
+    pending, session.info[PENDING_CALLBACKS_KEY] = session.info[PENDING_CALLBACKS_KEY], []
+    for callback in pending:
+        callback()
+
+
+def _drop_pending(session: Session) -> None:
+    session.info[PENDING_CALLBACKS_KEY] = []
@@ -1,9 +1,31 @@
-from app.core.database import SessionLocal
+from typing import Annotated
+from fastapi import Depends
+from sqlalchemy.orm import Session
+from app.core.database import SessionLocal, AsyncSessionLocal
 
 def get_db():
-    """Dependency function to get a database session."""
+    """Unit-of-work dependency: one session and one transaction per HTTP request.
+
+    Services only flush their changes; the transaction is committed once after the
+    endpoint returns and rolled back if it raises.
+    """
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
+
+
+# scope="function" ends the unit of work before the response is sent, so a failed
+# commit reaches the client as an error instead of following a 200.
+DbSession = Annotated[Session, Depends(get_db, scope="function")]
+
+
+async def get_async_db():
+    """Dependency function to get an async database session for `async def` endpoints."""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,7 +1,13 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-from app.core.database import create_tables
+from app.core.audit import audit_writer
+from app.core.cache import cache
+from app.core.events import broker, close_streams_on_exit_signal
+from app.core.notifications import notification_writer
+from app.core.config import settings
+from app.core.database import SessionLocal, create_tables
+from app.core.medicine_index import medicine_index
 from app.api.patients import router as patients_router
 from app.api.doctors import router as doctors_router
 from app.api.medical_records import router as medical_records_router
@@ -15,12 +21,30 @@ from app.api.test_types import router as test_types_router
 from app.api.history import router as history_router
 from app.api.tests import router as tests_router
 from app.api.book_term import router as book_term_router
+from app.api.availability import router as availability_router
+from app.api.internal import router as internal_router
+from app.api.events import router as events_router
+from app.api.notifications import router as notifications_router
+from app.api.prescriptions import router as prescriptions_router
+from app.api.medicines import router as medicines_router
+from app.api.relations import router as relations_router
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Starting up...")
     create_tables()
+    cache.start()
+    audit_writer.start()
+    notification_writer.start()
+    close_streams_on_exit_signal()
+    if settings.MEDICINE_SEARCH_BACKEND == "memory":
+        with SessionLocal() as db:
+            medicine_index.load(db)
     yield
+    broker.close()
+    audit_writer.stop()
+    notification_writer.stop()
+    cache.stop()
     print("Shutting down...")
 
 app = FastAPI(lifespan=lifespan)
@@ -32,6 +56,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 app.include_router(patients_router, prefix="/patients", tags=["Patients"])
@@ -44,10 +69,17 @@ app.include_router(all_terms_router, prefix="/api/terms", tags=["Terms"])
 app.include_router(appointments_router, prefix="/appointments", tags=["Appointments"])
 app.include_router(requests_router, prefix="/requests", tags=["requests"])
 app.include_router(book_term_router, prefix="/api/terms", tags=["Terms"])
+app.include_router(availability_router, prefix="/api/terms", tags=["Terms"])
 app.include_router(request_types_router, prefix="/request_types", tags=["Request Types"])
 app.include_router(test_types_router, prefix="/test-types", tags=["test-types"])
 app.include_router(history_router, prefix="/history", tags=["History"])
 app.include_router(tests_router, prefix="/tests", tags=["Tests"])
+app.include_router(events_router, prefix="/events", tags=["Events"])
+app.include_router(notifications_router, prefix="/notifications", tags=["Notifications"])
+app.include_router(prescriptions_router, prefix="/prescriptions", tags=["Prescriptions"])
+app.include_router(medicines_router, prefix="/medicines", tags=["Medicines"])
+app.include_router(relations_router, prefix="/relations", tags=["Relations"])
+app.include_router(internal_router, prefix="/internal", tags=["Internal"], include_in_schema=False)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
 
@@ -8,6 +9,9 @@ if TYPE_CHECKING:
 
 class Appointment(SQLModel, table=True):
     __tablename__ = 'appointment'
+    __table_args__ = (
+        Index('ix_appointment_doctor_id_date_from', 'doctor_id', 'date_from'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     event_type: str = Field(max_length=255)
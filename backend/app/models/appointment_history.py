@@ -13,9 +13,9 @@ class AppointmentHistory(SQLModel, table=True):
     description: Optional[str] = Field(default=None, max_length=255)
     created_at: datetime = Field(default=datetime.now(timezone.utc))
 
-    appointment_id: Optional[int] = Field(default=None, foreign_key="appointment.id")
-    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id")
-    patient_id: Optional[int] = Field(default=None, foreign_key="patient.id")
-    nurse_id: Optional[int] = Field(default=None, foreign_key="nurse.id")
+    appointment_id: Optional[int] = Field(default=None, foreign_key="appointment.id", index=True)
+    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id", index=True)
+    patient_id: Optional[int] = Field(default=None, foreign_key="patient.id", index=True)
+    nurse_id: Optional[int] = Field(default=None, foreign_key="nurse.id", index=True)
 
     patient: Optional["Patient"] = Relationship(back_populates="appointments_history")
\ No newline at end of file
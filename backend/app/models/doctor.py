@@ -18,7 +18,7 @@ class Doctor(SQLModel, table=True):
     email: Optional[str] = Field(default=None, max_length=255)
     phone_number: Optional[str] = Field(default=None, max_length=20)
 
-    specialization_id: Optional[int] = Field(default=None, foreign_key="doctor_specialization.id")
+    specialization_id: Optional[int] = Field(default=None, foreign_key="doctor_specialization.id", index=True)
 
     medical_records: List["MedicalRecord"] = Relationship(back_populates="doctor")
     requests: List["Request"] = Relationship(back_populates="doctor")
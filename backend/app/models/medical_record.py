@@ -13,8 +13,8 @@ class MedicalRecord(SQLModel, table=True):
     type: str = Field(max_length=255)
     created_at: datetime = Field(default=datetime.now(timezone.utc))
 
-    patient_id: int = Field(foreign_key="patient.id")
-    doctor_id: int = Field(foreign_key="doctor.id")
+    patient_id: int = Field(foreign_key="patient.id", index=True)
+    doctor_id: int = Field(foreign_key="doctor.id", index=True)
 
     patient: "Patient" = Relationship(back_populates="medical_records")
     doctor: "Doctor" = Relationship(back_populates="medical_records")
\ No newline at end of file
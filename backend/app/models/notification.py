@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING
 
@@ -7,13 +8,17 @@ if TYPE_CHECKING:
 
 class Notification(SQLModel, table=True):
     __tablename__ = 'notification'
+    __table_args__ = (
+        # A patient's unread notifications, newest first.
+        Index('ix_notification_patient_opened', 'patient_id', 'opened', 'id'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     message: str = Field(max_length=255)
     opened: bool = Field(default=False)
-    created_at: datetime = Field(default=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     patient_id: Optional[int] = Field(default=None, foreign_key="patient.id")
-    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id")
+    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id", index=True)
 
     patient: Optional["Patient"] = Relationship(back_populates="notifications")
\ No newline at end of file
@@ -14,7 +14,7 @@ class Nurse(SQLModel, table=True):
     email: Optional[str] = Field(default=None, max_length=255)
     phone_number: Optional[str] = Field(default=None, max_length=20)
 
-    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id")
+    doctor_id: Optional[int] = Field(default=None, foreign_key="doctor.id", index=True)
 
     doctor: Optional["Doctor"] = Relationship(back_populates="nurses")
     requests: List["Request"] = Relationship(back_populates="nurse")
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from datetime import date
 from typing import Optional, List, TYPE_CHECKING
 
@@ -11,6 +12,17 @@ if TYPE_CHECKING:
 
 class Patient(SQLModel, table=True):
     __tablename__ = 'patient'
+    __table_args__ = (
+        Index('ix_patient_personal_number', 'personal_number', unique=True),
+        # Covers the history lookup, which only needs the id of the matching patient.
+        Index('ix_patient_history_lookup', 'personal_number', 'name', 'surname', postgresql_include=['id']),
+        # Patient search (PatientService.search_patients). Personal number prefixes use the unique index above.
+        Index('ix_patient_surname_name_normalized', 'surname_normalized', 'name_normalized',
+              postgresql_ops={'surname_normalized': 'text_pattern_ops', 'name_normalized': 'text_pattern_ops'}),
+        Index('ix_patient_name_normalized', 'name_normalized', postgresql_ops={'name_normalized': 'text_pattern_ops'}),
+        Index('ix_patient_date_of_birth', 'date_of_birth'),
+        Index('ix_patient_phone_normalized', 'phone_normalized'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=255)
@@ -21,6 +33,11 @@ class Patient(SQLModel, table=True):
     address: Optional[str] = Field(default=None, max_length=255)
     phone_number: Optional[str] = Field(default=None, max_length=20)
     personal_number: str = Field(min_length=10, max_length=10)
+    # Lower-cased names without diacritics and the phone number's digits, for search;
+    # see PatientService.search_columns.
+    name_normalized: str = Field(default="", max_length=255)
+    surname_normalized: str = Field(default="", max_length=255)
+    phone_normalized: Optional[str] = Field(default=None, max_length=20)
 
     medical_records: List["MedicalRecord"] = Relationship(back_populates="patient")
     prescriptions: List["Prescription"] = Relationship(back_populates="patient")
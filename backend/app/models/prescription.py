@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List, TYPE_CHECKING
 from datetime import datetime, timezone
 
@@ -10,16 +11,21 @@ if TYPE_CHECKING:
 
 class Prescription(SQLModel, table=True):
     __tablename__ = 'prescription'
+    __table_args__ = (
+        # A patient's currently active prescriptions: date_to in the future (or open-ended).
+        # Also serves the patient_id foreign key, which therefore has no index of its own.
+        Index('ix_prescription_patient_date_to', 'patient_id', 'date_to'),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     dosage: str = Field(max_length=255)
     date_from: Optional[datetime]
     date_to: Optional[datetime]
-    created_at: datetime = Field(default=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     patient_id: int = Field(foreign_key="patient.id")
-    doctor_id: int = Field(foreign_key="doctor.id")
-    medicine_id: int = Field(foreign_key="medicine.id")
+    doctor_id: int = Field(foreign_key="doctor.id", index=True)
+    medicine_id: int = Field(foreign_key="medicine.id", index=True)
 
     patient: "Patient" = Relationship(back_populates="prescriptions")
     doctor: "Doctor" = Relationship(back_populates="prescriptions")
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, List, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -6,9 +7,16 @@ if TYPE_CHECKING:
 
 class Medicine(SQLModel, table=True):
     __tablename__ = 'medicine'
+    __table_args__ = (
+        # text_pattern_ops lets PostgreSQL use the index for LIKE 'prefix%' under any collation.
+        # The pg_trgm GIN index for fuzzy search exists on PostgreSQL only (migration 8d4b2f6a1e37).
+        Index('ix_medicine_name_normalized', 'name_normalized', postgresql_ops={'name_normalized': 'text_pattern_ops'}),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     name: str = Field(max_length=255)
+    # Lower-cased name without diacritics, for prefix search; see normalize_search_text.
+    name_normalized: str = Field(default="", max_length=255)
     description: Optional[str] = Field(default=None, max_length=255)
 
     prescriptions: List["Prescription"] = Relationship(back_populates="medicine")
\ No newline at end of file
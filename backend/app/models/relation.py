@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -7,6 +8,11 @@ if TYPE_CHECKING:
 
 class FamilyRelation(SQLModel, table=True):
     __tablename__ = 'family_relation'
+    __table_args__ = (
+        # Relations are walked in both directions (RelationService); the primary key serves
+        # patient_id -> related_id, this index the reverse edges without reading the table.
+        Index('ix_family_relation_related_patient', 'related_id', 'patient_id'),
+    )
 
     patient_id: int = Field(foreign_key="patient.id", primary_key=True)
     related_id: int = Field(foreign_key="patient.id", primary_key=True)
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index, text
 from datetime import datetime, timezone
 from typing import Optional, TYPE_CHECKING, List
 
@@ -10,19 +11,49 @@ if TYPE_CHECKING:
     from app.models.nurse import Nurse
     from app.models.test import Test
 
+# Requests in these states no longer hold their place in an appointment.
+RELEASED_STATES = ("declined", "cancelled")
+# Predicate of the partial unique index below; upserts targeting that index must repeat it verbatim.
+ACTIVE_STATE_PREDICATE = text(
+    "state NOT IN ({})".format(", ".join(f"'{state}'" for state in RELEASED_STATES))
+)
+# The states a request may move to from each state; released and completed requests are final.
+ALLOWED_TRANSITIONS = {
+    "pending": ("approved", "declined", "cancelled"),
+    "approved": ("completed", "declined", "cancelled"),
+    "completed": (),
+    "declined": (),
+    "cancelled": (),
+}
+
 class Request(SQLModel, table=True):
     __tablename__ = 'request'
+    __table_args__ = (
+        # A patient can hold only one active (not declined/cancelled) request per appointment.
+        Index(
+            'uq_request_patient_appointment_active', 'patient_id', 'appointment_id',
+            unique=True,
+            postgresql_where=ACTIVE_STATE_PREDICATE,
+            sqlite_where=ACTIVE_STATE_PREDICATE,
+        ),
+        # The nurse work queue: pending requests of one nurse, oldest first.
+        Index(
+            'ix_request_pending_queue', 'nurse_id', 'created_at', 'id',
+            postgresql_where=text("state = 'pending'"),
+            sqlite_where=text("state = 'pending'"),
+        ),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     state: str = Field(default="pending", max_length=50)
-    created_at: datetime = Field(default=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     description: Optional[str] = Field(default=None, max_length=255)
 
-    patient_id: int = Field(foreign_key="patient.id")
-    doctor_id: int = Field(foreign_key="doctor.id")
-    nurse_id: Optional[int] = Field(foreign_key="nurse.id")
-    appointment_id: Optional[int] = Field(foreign_key="appointment.id")
-    request_type_id: Optional[int] = Field(foreign_key="request_type.id")
+    patient_id: int = Field(foreign_key="patient.id", index=True)
+    doctor_id: int = Field(foreign_key="doctor.id", index=True)
+    nurse_id: Optional[int] = Field(foreign_key="nurse.id", index=True)
+    appointment_id: Optional[int] = Field(foreign_key="appointment.id", index=True)
+    request_type_id: Optional[int] = Field(foreign_key="request_type.id", index=True)
 
     patient: "Patient" = Relationship(back_populates="requests")
     doctor: "Doctor" = Relationship(back_populates="requests")
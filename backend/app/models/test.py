@@ -10,11 +10,11 @@ class Test(SQLModel, table=True):
     id: int | None = Field(primary_key=True)
     test_date: datetime
     results: str = Field(max_length=512)
-    created_at: datetime = Field(default=datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     state: str = Field(max_length=20)
 
-    test_type_id: int = Field(foreign_key="test_type.id")
-    request_id: int = Field(foreign_key="request.id")
+    test_type_id: int = Field(foreign_key="test_type.id", index=True)
+    request_id: int = Field(foreign_key="request.id", index=True)
 
     test_type: "MedicalTestType" = Relationship(back_populates="tests")
     request: "Request" = Relationship(back_populates="tests")
@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import List
+
+class FreeSlotOut(BaseModel):
+    kalendar_id: int
+    date_from: datetime
+    date_to: datetime
+
+class AvailabilityOut(BaseModel):
+    doctor_id: int
+    request_type_id: int
+    length: int
+    free_slots: List[FreeSlotOut]
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from typing import List, Optional
 
 
 class BookTermBase(BaseModel):
@@ -13,3 +14,13 @@ class BookTermBase(BaseModel):
 
 class BookTermOut(BaseModel):
     message: str
+
+class BookTermItemResult(BaseModel):
+    index: int
+    status: str
+    request_id: Optional[int] = None
+    detail: Optional[str] = None
+
+class BookTermBatchOut(BaseModel):
+    created: int
+    results: List[BookTermItemResult]
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import List, Optional
+from typing import List, Literal, Optional
 from app.schemas.request import RequestOut
 from app.schemas.appointment import AppointmentOut
 from app.schemas.test import TestOut
@@ -13,3 +13,14 @@ class PatientHistoryResponse(BaseModel):
     requests: List[RequestOut]
     appointments: List[AppointmentOut]
     tests: List[TestOut]
+
+
+HistorySection = Literal["requests", "appointments", "tests"]
+
+class HistoryCursors(BaseModel):
+    requests: Optional[str] = None
+    appointments: Optional[str] = None
+    tests: Optional[str] = None
+
+class PatientHistoryPage(PatientHistoryResponse):
+    next_cursors: HistoryCursors
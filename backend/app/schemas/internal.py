@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import Optional
+
+class PoolMetricsOut(BaseModel):
+    pool_class: str
+    status: str
+    size: Optional[int] = None
+    checked_in: Optional[int] = None
+    checked_out: Optional[int] = None
+    overflow: Optional[int] = None
+    max_overflow: Optional[int] = None
+    timeout: Optional[float] = None
+    wait_count: Optional[int] = None
+    wait_total_ms: Optional[float] = None
+    wait_avg_ms: Optional[float] = None
+    wait_max_ms: Optional[float] = None
+    timeouts: Optional[int] = None
+    async_pool: Optional["PoolMetricsOut"] = None
+
+class CacheStatsOut(BaseModel):
+    backend: str
+    size: int
+    maxsize: int
+    ttl: float
+    hits: int
+    misses: int
@@ -1,5 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
+from typing import List, Optional
 
 
 class NotificationBase(BaseModel):
@@ -17,3 +18,11 @@ class NotificationOut(NotificationBase):
 
     class Config:
         orm_mode = True
+
+
+class NotificationMarkOpened(BaseModel):
+    """Body of the mark-opened endpoint; without `ids` every unread notification is marked."""
+    ids: Optional[List[int]] = None
+
+class NotificationMarkOpenedOut(BaseModel):
+    updated: int
@@ -28,3 +28,16 @@ class PatientOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class PatientSearch(BaseModel):
+    """Filters of `GET /patients/search`; every given filter must match.
+
+    Names match by prefix, ignoring case and diacritics; `personal_number` matches by prefix.
+    """
+    surname: Optional[str] = None
+    name: Optional[str] = None
+    personal_number: Optional[str] = None
+    date_of_birth: Optional[date] = None
+    birth_year: Optional[int] = None
+    phone_number: Optional[str] = None
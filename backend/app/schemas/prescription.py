@@ -1,12 +1,14 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class PrescriptionBase(BaseModel):
     dosage: str
     date_from: Optional[datetime] = None
     date_to: Optional[datetime] = None
-    created_at: datetime
+    patient_id: int
+    doctor_id: int
+    medicine_id: int
 
 
 class PrescriptionCreate(PrescriptionBase):
@@ -14,6 +16,25 @@ class PrescriptionCreate(PrescriptionBase):
 
 class PrescriptionOut(PrescriptionBase):
     id: int
+    created_at: datetime
 
     class Config:
-        orm_mode = True
+        from_attributes = True
+
+
+class PrescriptionRepeat(BaseModel):
+    """Body of `POST /prescriptions/repeat`: reissue the listed prescriptions for a new period."""
+    prescription_ids: List[int]
+    doctor_id: int
+    date_from: datetime
+    date_to: datetime
+
+class PrescriptionItemResult(BaseModel):
+    index: int
+    status: str
+    prescription_id: Optional[int] = None
+    detail: Optional[str] = None
+
+class PrescriptionBatchOut(BaseModel):
+    created: int
+    results: List[PrescriptionItemResult]
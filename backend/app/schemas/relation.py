@@ -4,11 +4,23 @@ class RelationBase(BaseModel):
     relation: str
 
 class RelationCreate(RelationBase):
-    pass
+    patient_id: int
+    related_id: int
 
 class RelationOut(RelationBase):
     patient_id: int
     related_id: int
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        from_attributes = True
+
+class RelativeOut(BaseModel):
+    """A relative of the patient `depth` relations away (1 = a direct relation)."""
+    patient_id: int
+    name: str
+    surname: str
+    personal_number: str
+    depth: int
+
+class PendingRelativeOut(RelativeOut):
+    pending_requests: int
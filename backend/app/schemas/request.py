@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional, List
+from typing import Literal, Optional, List
 
 class RequestBase(BaseModel):
     state: str = "pending"
@@ -15,16 +15,47 @@ class RequestCreate(RequestBase):
     pass
 
 class RequestUpdate(BaseModel):
-    state: Optional[str] = None
+    # PUT /requests/{id} changes the state, so it must be given; a missing one is a 422.
+    state: str
     description: Optional[str] = None
     nurse_id: Optional[int] = None
     appointment_id: Optional[int] = None
     request_type_id: Optional[int] = None
 
 
+class RequestTransition(BaseModel):
+    """Body of `POST /requests/transitions`: move every listed request to `state`."""
+    ids: List[int]
+    state: str
+
+class RequestTransitionResult(BaseModel):
+    id: int
+    status: str
+    previous_state: Optional[str] = None
+    detail: Optional[str] = None
+
+class RequestTransitionOut(BaseModel):
+    updated: int
+    results: List[RequestTransitionResult]
+
+
 class RequestOut(RequestBase):
     id: int
     created_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class RequestFilter(BaseModel):
+    """Filters of `GET /requests/`; every given filter must match."""
+    state: Optional[List[str]] = None
+    nurse_id: Optional[int] = None
+    doctor_id: Optional[int] = None
+    request_type_id: Optional[int] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+
+
+# "-" sorts descending; the nurse queue uses "created_at" (oldest first).
+RequestSort = Literal["id", "-id", "created_at", "-created_at"]
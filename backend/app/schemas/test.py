@@ -1,6 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 class TestBase(BaseModel):
     test_date: datetime
@@ -25,4 +25,14 @@ class TestOut(TestBase):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class TestItemError(BaseModel):
+    index: int
+    detail: str
+
+class TestBatchOut(BaseModel):
+    """Outcome of a bulk ingestion; only the rows that were not stored are listed."""
+    created: int
+    failed: int
+    errors: List[TestItemError]
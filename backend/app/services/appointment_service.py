@@ -1,14 +1,20 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
 from sqlalchemy.orm import Session
 from app.models.appointment import Appointment
+from app.core.cache import invalidate_on_commit
+from app.core.pagination import Page, paginate, paginate_async
 from app.schemas.appointment import AppointmentCreate
+from app.services.list_all_terms_service import CACHE_NAMESPACE as TERMS_CACHE_NAMESPACE
 
 class AppointmentService:
     @staticmethod
     def create_appointment(db: Session, appointment: AppointmentCreate):
         db_appointment = Appointment(**appointment.dict())
         db.add(db_appointment)
-        db.commit()
-        db.refresh(db_appointment)
+        db.flush()
+        invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
         return db_appointment
 
     @staticmethod
@@ -16,5 +22,9 @@ class AppointmentService:
         return db.query(Appointment).filter(Appointment.id == appointment_id).first()
 
     @staticmethod
-    def get_appointments(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Appointment).offset(skip).limit(limit).all()
+    def get_appointments(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Appointment), Appointment.id, cursor, limit)
+
+    @staticmethod
+    async def get_appointments_async(db: AsyncSession, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return await paginate_async(db, select(Appointment), Appointment.id, cursor, limit)
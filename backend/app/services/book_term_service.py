@@ -0,0 +1,149 @@
+from datetime import datetime, timezone
+from fastapi import HTTPException, status
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.appointment import Appointment
+from app.models.nurse import Nurse
+from app.models.request import ACTIVE_STATE_PREDICATE, Request
+from app.models.request_type import RequestType
+from app.core.cache import invalidate_on_commit
+from app.core.constraints import violates_unique_index
+from app.schemas.book_term import BookTermBase
+from app.services.list_all_terms_service import CACHE_NAMESPACE as TERMS_CACHE_NAMESPACE
+from app.services.patient_service import PatientService
+from app.services.request_service import RequestService
+
+
+class BookTermService:
+    @staticmethod
+    def resolve_references(db: Session, booking: BookTermBase):
+        """Looks up the doctor's nurse, the appointment and the request type in a single SELECT."""
+        statement = select(
+            select(Nurse.id).where(Nurse.doctor_id == booking.doctor_id).order_by(Nurse.id).limit(1).scalar_subquery(),
+            select(Appointment.id).where(Appointment.id == booking.appointment_id).scalar_subquery(),
+            select(RequestType.id).where(RequestType.id == booking.request_type_id).scalar_subquery(),
+        )
+        nurse_id, appointment_id, request_type_id = db.execute(statement).one()
+        if nurse_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Nurse for this doctor not found")
+        if appointment_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Appointment not found")
+        if request_type_id is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request type not found")
+        return nurse_id
+
+    @staticmethod
+    def book_term(db: Session, booking: BookTermBase) -> Request:
+        """Books the patient into the appointment within the caller's transaction.
+
+        Duplicate bookings are rejected by the unique index on active (patient_id, appointment_id)
+        requests rather than by a read-then-write check.
+        """
+        nurse_id = BookTermService.resolve_references(db, booking)
+        patient_id = PatientService.upsert_patient(
+            db,
+            name=booking.name,
+            surname=booking.surname,
+            phone_number=booking.phone_number,
+            personal_number=booking.personal_number
+        )
+        new_request = Request(
+            appointment_id=booking.appointment_id,
+            doctor_id=booking.doctor_id,
+            patient_id=patient_id,
+            nurse_id=nurse_id,
+            request_type_id=booking.request_type_id,
+            state="pending",
+            created_at=datetime.now(timezone.utc),
+            description=booking.description
+        )
+        db.add(new_request)
+        try:
+            db.flush()
+        except IntegrityError as error:
+            if not violates_unique_index(error, "uq_request_patient_appointment_active", "request",
+                                         ("patient_id", "appointment_id")):
+                raise
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Request already exists")
+        invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
+        RequestService.on_created(db, new_request)
+        return new_request
+
+    @staticmethod
+    def book_terms(db: Session, bookings: list[BookTermBase]) -> list[dict]:
+        """Books a batch of terms; patients are upserted together and the requests inserted in one statement.
+
+        A booking that repeats another one in the batch, or an already active request, is reported
+        as "Request already exists".
+        """
+        doctor_ids = {booking.doctor_id for booking in bookings}
+        appointment_ids = {booking.appointment_id for booking in bookings}
+        request_type_ids = {booking.request_type_id for booking in bookings}
+        nurses = dict(db.execute(
+            select(Nurse.doctor_id, func.min(Nurse.id)).where(Nurse.doctor_id.in_(doctor_ids)).group_by(Nurse.doctor_id)
+        ).all())
+        known_appointments = set(db.scalars(select(Appointment.id).where(Appointment.id.in_(appointment_ids))))
+        known_request_types = set(db.scalars(select(RequestType.id).where(RequestType.id.in_(request_type_ids))))
+
+        results = [None] * len(bookings)
+        valid = []
+        for index, booking in enumerate(bookings):
+            if booking.doctor_id not in nurses:
+                results[index] = {"index": index, "status": "error", "detail": "Nurse for this doctor not found"}
+            elif booking.appointment_id not in known_appointments:
+                results[index] = {"index": index, "status": "error", "detail": "Appointment not found"}
+            elif booking.request_type_id not in known_request_types:
+                results[index] = {"index": index, "status": "error", "detail": "Request type not found"}
+            else:
+                valid.append(index)
+
+        patient_ids = PatientService.upsert_patients(db, [
+            {
+                "name": bookings[index].name,
+                "surname": bookings[index].surname,
+                "phone_number": bookings[index].phone_number,
+                "personal_number": bookings[index].personal_number
+            }
+            for index in valid
+        ])
+
+        created_at = datetime.now(timezone.utc)
+        rows = {}
+        for index in valid:
+            booking = bookings[index]
+            key = (patient_ids[booking.personal_number], booking.appointment_id)
+            if key in rows:
+                results[index] = {"index": index, "status": "error", "detail": "Request already exists"}
+                continue
+            rows[key] = (index, {
+                "appointment_id": booking.appointment_id,
+                "doctor_id": booking.doctor_id,
+                "patient_id": key[0],
+                "nurse_id": nurses[booking.doctor_id],
+                "request_type_id": booking.request_type_id,
+                "state": "pending",
+                "created_at": created_at,
+                "description": booking.description
+            })
+
+        if rows:
+            insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+            # Conflicts with already active requests are skipped by the partial unique index.
+            statement = insert(Request).values([row for _, row in rows.values()]).on_conflict_do_nothing(
+                index_elements=[Request.patient_id, Request.appointment_id],
+                index_where=ACTIVE_STATE_PREDICATE
+            ).returning(Request.id, Request.patient_id, Request.appointment_id)
+            created = {(patient_id, appointment_id): request_id for request_id, patient_id, appointment_id in db.execute(statement)}
+            for key, (index, row) in rows.items():
+                if key in created:
+                    results[index] = {"index": index, "status": "created", "request_id": created[key]}
+                    RequestService.on_created(db, {**row, "id": created[key]})
+                else:
+                    results[index] = {"index": index, "status": "error", "detail": "Request already exists"}
+            if created:
+                invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
+
+        return results
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.appointment import Appointment
+from app.models.request import Request, RELEASED_STATES
+from app.models.request_type import RequestType
+from app.core.dates import as_utc
+
+
+class CalendarService:
+    @staticmethod
+    def get_free_slots(db: Session, doctor_id: int, request_type_id: int, date_from: datetime, date_to: datetime):
+        """Returns the slots of `RequestType.length` minutes still free in the doctor's appointments."""
+        request_type = db.query(RequestType).filter(RequestType.id == request_type_id).first()
+        if not request_type:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Request type not found")
+        if request_type.length <= 0:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Request type has no length")
+
+        windows = CalendarService.get_booked_windows(db, doctor_id, date_from, date_to)
+        slots = CalendarService.compute_free_slots(
+            windows,
+            timedelta(minutes=request_type.length),
+            as_utc(date_from),
+            as_utc(date_to),
+        )
+        return {
+            "doctor_id": doctor_id,
+            "request_type_id": request_type.id,
+            "length": request_type.length,
+            "free_slots": [
+                {"kalendar_id": appointment_id, "date_from": start, "date_to": end}
+                for appointment_id, start, end in slots
+            ],
+        }
+
+    @staticmethod
+    def get_booked_windows(db: Session, doctor_id: int, date_from: datetime, date_to: datetime):
+        """Loads the doctor's appointments overlapping the range with the minutes already booked in each.
+
+        Returns (appointment_id, start, end, booked_minutes) tuples; booked_minutes is None when a
+        request without a request type occupies the appointment, which blocks the whole window.
+        """
+        in_range = (
+            db.query(Appointment.id)
+            .filter(
+                Appointment.doctor_id == doctor_id,
+                Appointment.date_from < as_utc(date_to),
+                Appointment.date_to > as_utc(date_from),
+            )
+        )
+        booked = (
+            db.query(
+                Request.appointment_id,
+                func.sum(RequestType.length).label("minutes"),
+                (func.count(Request.id) - func.count(RequestType.id)).label("untyped"),
+            )
+            .outerjoin(RequestType, Request.request_type_id == RequestType.id)
+            .filter(
+                Request.appointment_id.in_(in_range.scalar_subquery()),
+                Request.state.notin_(RELEASED_STATES),
+            )
+            .group_by(Request.appointment_id)
+            .subquery()
+        )
+        rows = (
+            in_range
+            .with_entities(Appointment.id, Appointment.date_from, Appointment.date_to, booked.c.minutes,
+                           booked.c.untyped)
+            .outerjoin(booked, booked.c.appointment_id == Appointment.id)
+            .order_by(Appointment.date_from, Appointment.id)
+            .all()
+        )
+        return [
+            (
+                appointment_id,
+                as_utc(start),
+                as_utc(end),
+                None if untyped else (minutes or 0),
+            )
+            for appointment_id, start, end, minutes, untyped in rows
+        ]
+
+    @staticmethod
+    def compute_free_slots(windows, length: timedelta, range_from: Optional[datetime] = None,
+                           range_to: Optional[datetime] = None):
+        """Splits the unbooked part of each window into consecutive slots of `length`.
+
+        Requests carry no start time, so the booked minutes of a window are packed from its start.
+        Busy intervals of all windows are merged with a sorted sweep and subtracted from every
+        window, so overlapping appointments of the same doctor never yield a double booking.
+        """
+        busy = []
+        for _, start, end, minutes in windows:
+            busy_end = end if minutes is None else min(end, start + timedelta(minutes=minutes))
+            if busy_end > start:
+                busy.append((start, busy_end))
+        busy.sort()
+
+        merged = []
+        for start, end in busy:
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1][1] = end
+            else:
+                merged.append([start, end])
+        busy_starts = [start for start, _ in merged]
+
+        slots = []
+        for appointment_id, start, end, _ in windows:
+            if range_from is not None and start < range_from:
+                start = range_from
+            if range_to is not None and end > range_to:
+                end = range_to
+            # Busy intervals are disjoint and sorted, so only those from the one overlapping
+            # `start` onwards can cut into this window.
+            index = max(bisect_left(busy_starts, start) - 1, 0)
+            cursor = start
+            while cursor < end:
+                while index < len(merged) and merged[index][1] <= cursor:
+                    index += 1
+                free_end = end
+                if index < len(merged) and merged[index][0] <= cursor:
+                    cursor = merged[index][1]
+                    continue
+                if index < len(merged) and merged[index][0] < end:
+                    free_end = merged[index][0]
+                while cursor + length <= free_end:
+                    slots.append((appointment_id, cursor, cursor + length))
+                    cursor += length
+                cursor = free_end
+        return slots
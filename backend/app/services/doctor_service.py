@@ -1,6 +1,12 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.cache import CacheEntry, invalidate_on_commit, cache
+from app.core.pagination import Page, paginate
 from app.models.doctor import Doctor
-from app.schemas.doctor import DoctorCreate
+from app.schemas.doctor import DoctorCreate, DoctorOut
+
+CACHE_NAMESPACE = "doctors"
 
 class DoctorService:
     @staticmethod
@@ -8,8 +14,8 @@ class DoctorService:
         # Changed from doctor.dict() to doctor.model_dump() for Pydantic v2 compatibility
         db_doctor = Doctor(**doctor.model_dump())
         db.add(db_doctor)
-        db.commit()
-        db.refresh(db_doctor)
+        db.flush()
+        invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_doctor
 
     @staticmethod
@@ -17,8 +23,20 @@ class DoctorService:
         return db.query(Doctor).filter(Doctor.id == doctor_id).first()
 
     @staticmethod
-    def get_doctors(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Doctor).offset(skip).limit(limit).all()
+    def get_doctors(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Doctor), Doctor.id, cursor, limit)
+
+    @staticmethod
+    def get_doctors_cached(db: Session, cursor: Optional[str] = None, limit: int = 100) -> CacheEntry:
+        """Cached, JSON-ready page of `get_doctors` as {"items": [...], "next_cursor": ...}."""
+        def load():
+            page = DoctorService.get_doctors(db, cursor, limit)
+            return {
+                "items": [DoctorOut.model_validate(d, from_attributes=True).model_dump(mode="json") for d in page.items],
+                "next_cursor": page.next_cursor
+            }
+
+        return cache.get_or_load((CACHE_NAMESPACE, cursor, limit), load)
 
     @staticmethod
     def update_doctor(db: Session, doctor_id: int, doctor: DoctorCreate):
@@ -28,9 +46,9 @@ class DoctorService:
             db_doctor.surname = doctor.surname
             db_doctor.email = doctor.email
             db_doctor.phone_number = doctor.phone_number
-            db_doctor.specialization = doctor.specialization
-            db.commit()
-            db.refresh(db_doctor)
+            db_doctor.specialization_id = doctor.specialization_id
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_doctor
 
     @staticmethod
@@ -38,5 +56,6 @@ class DoctorService:
         db_doctor = db.query(Doctor).filter(Doctor.id == doctor_id).first()
         if db_doctor:
             db.delete(db_doctor)
-            db.commit()
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_doctor
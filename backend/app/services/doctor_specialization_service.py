@@ -1,6 +1,12 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.cache import CacheEntry, invalidate_on_commit, cache
+from app.core.pagination import Page, paginate
 from app.models.doctor_specialization import DoctorSpecialization
-from app.schemas.doctor_specialization import DoctorSpecializationCreate
+from app.schemas.doctor_specialization import DoctorSpecializationCreate, DoctorSpecializationOut
+
+CACHE_NAMESPACE = "specializations"
 
 
 class DoctorSpecializationService:
@@ -10,8 +16,8 @@ class DoctorSpecializationService:
         specialization_data = doctor_specialization.model_dump()
         db_specialization = DoctorSpecialization(**specialization_data)
         db.add(db_specialization)
-        db.commit()
-        db.refresh(db_specialization)
+        db.flush()
+        invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_specialization
 
     @staticmethod
@@ -19,8 +25,20 @@ class DoctorSpecializationService:
         return db.query(DoctorSpecialization).filter(DoctorSpecialization.id == specialization_id).first()
 
     @staticmethod
-    def get_doctor_specializations(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(DoctorSpecialization).offset(skip).limit(limit).all()
+    def get_doctor_specializations(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(DoctorSpecialization), DoctorSpecialization.id, cursor, limit)
+
+    @staticmethod
+    def get_doctor_specializations_cached(db: Session, cursor: Optional[str] = None, limit: int = 100) -> CacheEntry:
+        """Cached, JSON-ready page of `get_doctor_specializations` as {"items": [...], "next_cursor": ...}."""
+        def load():
+            page = DoctorSpecializationService.get_doctor_specializations(db, cursor, limit)
+            return {
+                "items": [DoctorSpecializationOut.model_validate(s, from_attributes=True).model_dump(mode="json") for s in page.items],
+                "next_cursor": page.next_cursor
+            }
+
+        return cache.get_or_load((CACHE_NAMESPACE, cursor, limit), load)
 
     @staticmethod
     def update_doctor_specialization(db: Session, specialization_id: int, doctor_specialization: DoctorSpecializationCreate):
@@ -29,8 +47,8 @@ class DoctorSpecializationService:
             specialization_data = doctor_specialization.model_dump()
             for key, value in specialization_data.items():
                 setattr(db_specialization, key, value)
-            db.commit()
-            db.refresh(db_specialization)
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_specialization
 
     @staticmethod
@@ -38,5 +56,6 @@ class DoctorSpecializationService:
         db_specialization = DoctorSpecializationService.get_doctor_specialization(db, specialization_id)
         if db_specialization:
             db.delete(db_specialization)
-            db.commit()
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_specialization
\ No newline at end of file
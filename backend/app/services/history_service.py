@@ -1,50 +1,166 @@
+import json
+from typing import AsyncIterator, Optional
+
 from sqlmodel import select
-from sqlalchemy.orm import joinedload, Session as SQLAlchemySession
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session as SQLAlchemySession
 from fastapi import HTTPException, status
 
+from app.core.pagination import decode_cursor, to_page
+from app.models.appointment import Appointment
 from app.models.patient import Patient
 from app.models.request import Request
-from app.schemas.history import PatientLookup, PatientHistoryResponse
+from app.models.test import Test
+from app.schemas.appointment import AppointmentOut
+from app.schemas.history import HistoryCursors, HistorySection, PatientLookup, PatientHistoryPage, PatientHistoryResponse
+from app.schemas.request import RequestOut
+from app.schemas.test import TestOut
 
-def get_patient_history(db: SQLAlchemySession, lookup_data: PatientLookup) -> PatientHistoryResponse:
-    """Fetches requests, appointments, and tests for a patient based on lookup data."""
+HISTORY_SECTIONS = {
+    "requests": (Request, RequestOut),
+    "appointments": (Appointment, AppointmentOut),
+    "tests": (Test, TestOut),
+}
+# Rows fetched per round trip while streaming.
+STREAM_BATCH_SIZE = 500
 
-    statement = select(Patient).where(
+def build_patient_statement(lookup_data: PatientLookup):
+    # Only the id is selected so the lookup can be answered from ix_patient_history_lookup alone.
+    return select(Patient.id).where(
         Patient.personal_number == lookup_data.personal_number,
         Patient.name == lookup_data.name,
         Patient.surname == lookup_data.surname
     )
-    patient = db.scalars(statement).first()
-
-    if not patient:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Patient not found with the provided details."
-        )
-
-    request_statement = (
-        select(Request)
-        .where(Request.patient_id == patient.id)
-        .options(
-            joinedload(Request.appointments),
-            joinedload(Request.tests)
-        )
-    )
-    patient_requests = db.scalars(request_statement).unique().all()
 
-    patient_appointments = []
-    patient_tests = []
-    for req in patient_requests:
-        if req.appointments:
-            patient_appointments.append(req.appointments)
-        if req.tests:
-            patient_tests.extend(req.tests)
+def build_requests_statement(patient_id: int):
+    return select(Request).where(Request.patient_id == patient_id).order_by(Request.id)
 
-    unique_appointments = list({appt.id: appt for appt in patient_appointments}.values())
-    unique_tests = list({test.id: test for test in patient_tests}.values())
+def build_appointments_statement(appointment_ids):
+    return select(Appointment).where(Appointment.id.in_(appointment_ids)).order_by(Appointment.id)
+
+def build_tests_statement(request_ids):
+    return select(Test).where(Test.request_id.in_(request_ids)).order_by(Test.id)
+
+def patient_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Patient not found with the provided details."
+    )
 
+def build_history_response(patient_requests, appointments, tests) -> PatientHistoryResponse:
     return PatientHistoryResponse(
         requests=patient_requests,
-        appointments=unique_appointments,
-        tests=unique_tests
+        appointments=appointments,
+        tests=tests
     )
+
+def get_patient_history(db: SQLAlchemySession, lookup_data: PatientLookup) -> PatientHistoryResponse:
+    """Fetches requests, appointments, and tests for a patient based on lookup data.
+
+    Each section is loaded by its own narrow query keyed on the ids from the requests, so a
+    patient with many tests does not multiply the request and appointment rows.
+    """
+    patient_id = db.scalars(build_patient_statement(lookup_data)).first()
+    if patient_id is None:
+        raise patient_not_found()
+
+    patient_requests = db.scalars(build_requests_statement(patient_id)).all()
+    appointment_ids = {req.appointment_id for req in patient_requests if req.appointment_id is not None}
+    appointments = db.scalars(build_appointments_statement(appointment_ids)).all() if appointment_ids else []
+    tests = db.scalars(build_tests_statement([req.id for req in patient_requests])).all() if patient_requests else []
+    return build_history_response(patient_requests, appointments, tests)
+
+async def get_patient_history_async(db: AsyncSession, lookup_data: PatientLookup) -> PatientHistoryResponse:
+    """Async variant of `get_patient_history` for `async def` endpoints."""
+    patient_id = (await db.scalars(build_patient_statement(lookup_data))).first()
+    if patient_id is None:
+        raise patient_not_found()
+
+    patient_requests = (await db.scalars(build_requests_statement(patient_id))).all()
+    appointment_ids = {req.appointment_id for req in patient_requests if req.appointment_id is not None}
+    appointments = (await db.scalars(build_appointments_statement(appointment_ids))).all() if appointment_ids else []
+    tests = (await db.scalars(build_tests_statement([req.id for req in patient_requests]))).all() if patient_requests else []
+    return build_history_response(patient_requests, appointments, tests)
+
+def build_section_statement(section: HistorySection, patient_id: int, after_id: Optional[int] = None,
+                            limit: Optional[int] = None):
+    """Rows of one history section ordered by id, optionally after a keyset cursor.
+
+    Sections are filtered through a subquery on the patient's requests so each one can be
+    paged independently of the others.
+    """
+    patient_requests = select(Request).where(Request.patient_id == patient_id)
+    if section == "requests":
+        model, criterion = Request, Request.patient_id == patient_id
+    elif section == "appointments":
+        model, criterion = Appointment, Appointment.id.in_(patient_requests.with_only_columns(Request.appointment_id))
+    else:
+        model, criterion = Test, Test.request_id.in_(patient_requests.with_only_columns(Request.id))
+
+    statement = select(model).where(criterion).order_by(model.id)
+    if after_id is not None:
+        statement = statement.where(model.id > after_id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    return statement
+
+def page_statements(patient_id: int, limit: int, cursors: HistoryCursors, section: Optional[HistorySection]):
+    sections = [section] if section else list(HISTORY_SECTIONS)
+    for name in sections:
+        cursor = getattr(cursors, name)
+        after_id = decode_cursor(cursor) if cursor else None
+        # One extra row tells whether another page exists.
+        yield name, build_section_statement(name, patient_id, after_id, limit + 1)
+
+def build_page_response(rows_by_section: dict, limit: int) -> PatientHistoryPage:
+    sections = {name: [] for name in HISTORY_SECTIONS}
+    next_cursors = {}
+    for name, rows in rows_by_section.items():
+        page = to_page(rows, limit)
+        sections[name], next_cursors[name] = page.items, page.next_cursor
+    return PatientHistoryPage(**sections, next_cursors=HistoryCursors(**next_cursors))
+
+def get_patient_history_page(db: SQLAlchemySession, lookup_data: PatientLookup, limit: int,
+                             cursors: HistoryCursors, section: Optional[HistorySection] = None) -> PatientHistoryPage:
+    """One page of each history section (or of `section` only), with a next cursor per section."""
+    patient_id = db.scalars(build_patient_statement(lookup_data)).first()
+    if patient_id is None:
+        raise patient_not_found()
+
+    rows_by_section = {
+        name: db.scalars(statement).all() for name, statement in page_statements(patient_id, limit, cursors, section)
+    }
+    return build_page_response(rows_by_section, limit)
+
+async def get_patient_history_page_async(db: AsyncSession, lookup_data: PatientLookup, limit: int,
+                                         cursors: HistoryCursors,
+                                         section: Optional[HistorySection] = None) -> PatientHistoryPage:
+    """Async variant of `get_patient_history_page` for `async def` endpoints."""
+    patient_id = (await db.scalars(build_patient_statement(lookup_data))).first()
+    if patient_id is None:
+        raise patient_not_found()
+
+    rows_by_section = {
+        name: (await db.scalars(statement)).all()
+        for name, statement in page_statements(patient_id, limit, cursors, section)
+    }
+    return build_page_response(rows_by_section, limit)
+
+def format_ndjson_line(section: HistorySection, row) -> str:
+    schema = HISTORY_SECTIONS[section][1]
+    data = schema.model_validate(row).model_dump(mode="json")
+    return json.dumps({"section": section, "data": data}) + "\n"
+
+async def stream_patient_history_async(db: AsyncSession, patient_id: int) -> AsyncIterator[str]:
+    """Yields the patient's history as NDJSON lines, section by section, in batches of STREAM_BATCH_SIZE rows."""
+    for section in HISTORY_SECTIONS:
+        statement = build_section_statement(section, patient_id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        async for row in await db.stream_scalars(statement):
+            yield format_ndjson_line(section, row)
+
+async def get_patient_id_async(db: AsyncSession, lookup_data: PatientLookup) -> int:
+    """Resolves the patient before a stream starts, so an unknown patient still gets a 404."""
+    patient_id = (await db.scalars(build_patient_statement(lookup_data))).first()
+    if patient_id is None:
+        raise patient_not_found()
+    return patient_id
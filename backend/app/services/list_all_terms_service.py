@@ -1,14 +1,135 @@
-from sqlalchemy.orm import Session
+import base64
+from datetime import datetime
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload, joinedload
+from app.core.cache import CacheEntry, cache
+from app.core.config import settings
+from app.core.dates import as_utc
 from app.models.request import Request
 from app.models.request_type import RequestType
 from app.models.appointment import Appointment
+from app.schemas.list_all_terms import TermOut
+
+# Invalidated whenever an appointment or the requests booked on it change.
+CACHE_NAMESPACE = "terms"
 
 class TermService:
     @staticmethod
-    def get_all_terms(db: Session):
-        appointments = db.query(Appointment).all()
+    def build_terms_statement(
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        """Builds the SELECT behind the terms listing, shared by the sync and async paths.
+
+        Lists appointments starting in [date_from, date_to), ordered by (date_from, id);
+        `cursor` is the value returned by `encode_cursor` for the last term of the previous page.
+        """
+        # Requests and their types are loaded in one batched SELECT ... WHERE appointment_id IN (...)
+        # instead of lazily per appointment, so the statement count does not grow with the calendar.
+        statement = select(Appointment).options(
+            selectinload(Appointment.requests).joinedload(Request.request_type)
+        )
+        if doctor_id is not None:
+            statement = statement.where(Appointment.doctor_id == doctor_id)
+        if event_type is not None:
+            statement = statement.where(Appointment.event_type == event_type)
+        if date_from is not None:
+            statement = statement.where(Appointment.date_from >= as_utc(date_from))
+        if date_to is not None:
+            statement = statement.where(Appointment.date_from < as_utc(date_to))
+        if cursor is not None:
+            cursor_date, cursor_id = TermService.decode_cursor(cursor)
+            statement = statement.where(or_(
+                Appointment.date_from > cursor_date,
+                and_(Appointment.date_from == cursor_date, Appointment.id > cursor_id)
+            ))
+        statement = statement.order_by(Appointment.date_from, Appointment.id)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return statement
+
+    @staticmethod
+    def get_all_terms(
+        db: Session,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        statement = TermService.build_terms_statement(date_from, date_to, doctor_id, event_type, cursor, limit)
+        return [TermService.format_appointment(appointment) for appointment in db.scalars(statement).all()]
+
+    @staticmethod
+    async def get_all_terms_async(
+        db: AsyncSession,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        statement = TermService.build_terms_statement(date_from, date_to, doctor_id, event_type, cursor, limit)
+        appointments = (await db.scalars(statement)).all()
         return [TermService.format_appointment(appointment) for appointment in appointments]
 
+    @staticmethod
+    async def get_terms_page_cached_async(
+        db: AsyncSession,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        doctor_id: Optional[int] = None,
+        event_type: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> CacheEntry:
+        """Cached page of `get_all_terms_async` as {"terms": [...], "next_cursor": ...}, JSON-ready."""
+        key = (
+            CACHE_NAMESPACE,
+            as_utc(date_from).isoformat() if date_from else None,
+            as_utc(date_to).isoformat() if date_to else None,
+            doctor_id, event_type, cursor, limit
+        )
+
+        async def load():
+            terms = await TermService.get_all_terms_async(db, date_from, date_to, doctor_id, event_type, cursor, limit)
+            return {
+                "terms": [TermOut.model_validate(term).model_dump(mode="json") for term in terms],
+                "next_cursor": TermService.next_cursor(terms, limit)
+            }
+
+        return await cache.get_or_load_async(key, load, ttl=settings.TERMS_CACHE_TTL)
+
+    @staticmethod
+    def next_cursor(terms: list[dict], limit: Optional[int]) -> Optional[str]:
+        """A full page means there may be more; the client passes this back as `cursor`."""
+        if limit is None or len(terms) < limit:
+            return None
+        return TermService.encode_cursor(terms[-1]["date_from"], terms[-1]["kalendar_id"])
+
+    @staticmethod
+    def encode_cursor(date_from: datetime, appointment_id: int) -> str:
+        raw = f"{as_utc(date_from).isoformat()}|{appointment_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> tuple[datetime, int]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+            date_part, id_part = raw.rsplit("|", 1)
+            return as_utc(datetime.fromisoformat(date_part)), int(id_part)
+        except ValueError:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
     @staticmethod
     def get_appointment_by_id(db: Session, appointment_id: int):
         return db.query(Appointment).filter(Appointment.id == appointment_id).first()
@@ -1,4 +1,7 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.pagination import Page, paginate
 from app.models.medical_record import MedicalRecord
 from app.schemas.medical_record import MedicalRecordCreate
 
@@ -7,8 +10,7 @@ class MedicalRecordService:
     def create_medical_record(db: Session, medical_record: MedicalRecordCreate):
         db_medical_record = MedicalRecord(**medical_record.dict())
         db.add(db_medical_record)
-        db.commit()
-        db.refresh(db_medical_record)
+        db.flush()
         return db_medical_record
 
     @staticmethod
@@ -16,13 +18,13 @@ class MedicalRecordService:
         return db.query(MedicalRecord).filter(MedicalRecord.id == medical_record_id).first()
 
     @staticmethod
-    def get_medical_records(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(MedicalRecord).offset(skip).limit(limit).all()
+    def get_medical_records(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(MedicalRecord), MedicalRecord.id, cursor, limit)
 
     @staticmethod
     def delete_medical_record(db: Session, medical_record_id: int):
         db_medical_record = db.query(MedicalRecord).filter(MedicalRecord.id == medical_record_id).first()
         if db_medical_record:
             db.delete(db_medical_record)
-            db.commit()
+            db.flush()
         return db_medical_record
@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import false, select, update
+from sqlalchemy.orm import Session
+from app.core.pagination import Page, paginate
+from app.models.notification import Notification
+
+# Patient-facing messages per new request state; other states are not announced.
+STATE_MESSAGES = {
+    "approved": "Your request #{id} was approved.",
+    "declined": "Your request #{id} was declined.",
+    "cancelled": "Your request #{id} was cancelled.",
+    "completed": "Your request #{id} was completed.",
+}
+BOOKED_MESSAGE = "Your request #{id} was received and is waiting for approval."
+
+
+class NotificationService:
+    @staticmethod
+    def notification_row(message: str, patient_id: int, doctor_id: Optional[int]) -> dict:
+        return {"message": message, "opened": False, "created_at": datetime.now(timezone.utc),
+                "patient_id": patient_id, "doctor_id": doctor_id}
+
+    @staticmethod
+    def booked_rows(request: dict) -> list[dict]:
+        """The notification for a new request, given as a dict of its columns."""
+        return [NotificationService.notification_row(
+            BOOKED_MESSAGE.format(id=request["id"]), request["patient_id"], request["doctor_id"]
+        )]
+
+    @staticmethod
+    def state_rows(request) -> list[dict]:
+        """The notification for `request` having moved to its current state, if that state is announced."""
+        message = STATE_MESSAGES.get(request.state)
+        if message is None:
+            return []
+        return [NotificationService.notification_row(
+            message.format(id=request.id), request.patient_id, request.doctor_id
+        )]
+
+    @staticmethod
+    def get_unread(db: Session, patient_id: int, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        """One keyset page of the patient's unread notifications, newest first."""
+        statement = select(Notification).where(Notification.patient_id == patient_id, Notification.opened == false())
+        return paginate(db, statement, Notification.id, cursor, limit, descending=True)
+
+    @staticmethod
+    def mark_opened(db: Session, patient_id: int, notification_ids: Optional[list[int]] = None) -> int:
+        """Marks the given (or else all) unread notifications of the patient as opened in one UPDATE.
+
+        Ids of other patients' notifications are ignored. Returns how many were marked.
+        """
+        statement = update(Notification).where(
+            Notification.patient_id == patient_id, Notification.opened == false()
+        ).values(opened=True)
+        if notification_ids is not None:
+            statement = statement.where(Notification.id.in_(notification_ids))
+        return db.execute(statement, execution_options={"synchronize_session": False}).rowcount
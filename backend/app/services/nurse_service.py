@@ -1,4 +1,7 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.pagination import Page, paginate
 from app.models.nurse import Nurse
 from app.schemas.nurse import NurseCreate
 
@@ -10,8 +13,7 @@ class NurseService:
         nurse_data = nurse.model_dump()
         db_nurse = Nurse(**nurse_data)
         db.add(db_nurse)
-        db.commit()
-        db.refresh(db_nurse)
+        db.flush()
         return db_nurse
 
     @staticmethod
@@ -19,8 +21,8 @@ class NurseService:
         return db.query(Nurse).filter(Nurse.id == nurse_id).first()
 
     @staticmethod
-    def get_nurses(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Nurse).offset(skip).limit(limit).all()
+    def get_nurses(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Nurse), Nurse.id, cursor, limit)
 
     @staticmethod
     def get_nurse_by_doctor_id(db: Session, doctor_id: int):
@@ -33,8 +35,7 @@ class NurseService:
             nurse_data = nurse.model_dump()
             for key, value in nurse_data.items():
                 setattr(db_nurse, key, value)
-            db.commit()
-            db.refresh(db_nurse)
+            db.flush()
         return db_nurse
 
     @staticmethod
@@ -42,5 +43,5 @@ class NurseService:
         db_nurse = NurseService.get_nurse(db, nurse_id)
         if db_nurse:
             db.delete(db_nurse)
-            db.commit()
+            db.flush()
         return db_nurse
\ No newline at end of file
@@ -1,14 +1,39 @@
+from datetime import date
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from app.core.constraints import violates_unique_index
+from app.core.pagination import Page, paginate
+from app.core.text import normalize_phone, normalize_search_text, prefix_upper_bound, starts_with
 from app.models.patient import Patient
-from app.schemas.patient import PatientCreate
+from app.schemas.patient import PatientCreate, PatientSearch
 
 class PatientService:
+    @staticmethod
+    def search_columns(name: str, surname: str, phone_number: Optional[str]) -> dict:
+        """The normalized columns `search_patients` matches on; every insert must set them."""
+        return {
+            "name_normalized": normalize_search_text(name),
+            "surname_normalized": normalize_search_text(surname),
+            "phone_normalized": normalize_phone(phone_number)
+        }
+
     @staticmethod
     def create_patient(db: Session, patient: PatientCreate):
-        db_patient = Patient(**patient.dict())
+        db_patient = Patient(**patient.model_dump(),
+                             **PatientService.search_columns(patient.name, patient.surname, patient.phone_number))
         db.add(db_patient)
-        db.commit()
-        db.refresh(db_patient)
+        try:
+            db.flush()
+        except IntegrityError as error:
+            if not violates_unique_index(error, "ix_patient_personal_number", "patient", ("personal_number",)):
+                raise
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT,
+                                detail="A patient with this personal number already exists")
         return db_patient
 
     @staticmethod
@@ -20,13 +45,82 @@ class PatientService:
         return db.query(Patient).filter(Patient.personal_number == personal_number).first()
 
     @staticmethod
-    def get_patients(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Patient).offset(skip).limit(limit).all()
+    def upsert_patient(db: Session, name: str, surname: str, phone_number: str, personal_number: str) -> int:
+        """Inserts the patient unless the personal number is already registered; returns the patient id.
+
+        Uses INSERT ... ON CONFLICT on the unique personal_number index, so concurrent bookings for the
+        same new patient cannot create duplicates. Existing patient data is left untouched.
+        """
+        return PatientService.upsert_patients(db, [{
+            "name": name,
+            "surname": surname,
+            "phone_number": phone_number,
+            "personal_number": personal_number
+        }])[personal_number]
+
+    @staticmethod
+    def upsert_patients(db: Session, patients: list[dict]) -> dict[str, int]:
+        """Bulk variant of `upsert_patient` using one multi-row INSERT; returns {personal_number: id}."""
+        # ON CONFLICT DO UPDATE may not touch the same row twice in one statement.
+        unique_patients = [
+            {**patient, **PatientService.search_columns(patient["name"], patient["surname"], patient.get("phone_number"))}
+            for patient in {patient["personal_number"]: patient for patient in reversed(patients)}.values()
+        ]
+        if not unique_patients:
+            return {}
+        insert = postgresql_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        statement = insert(Patient).values(unique_patients)
+        statement = statement.on_conflict_do_update(
+            index_elements=[Patient.personal_number],
+            set_={"personal_number": statement.excluded.personal_number}
+        ).returning(Patient.personal_number, Patient.id)
+        return {personal_number: patient_id for personal_number, patient_id in db.execute(statement)}
+
+    @staticmethod
+    def get_patients(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Patient), Patient.id, cursor, limit)
+
+    @staticmethod
+    def build_search_statement(filters: PatientSearch, dialect: str):
+        """Patients matching every given filter, in surname and name order; None if no filter is given.
+
+        Each filter has an index of its own, and the database picks the most selective one.
+        Personal numbers are digits only, so their prefix is a range on the unique index in
+        every collation.
+        """
+        conditions = []
+        if filters.surname and (surname := normalize_search_text(filters.surname)):
+            conditions.append(starts_with(Patient.surname_normalized, surname, dialect))
+        if filters.name and (name := normalize_search_text(filters.name)):
+            conditions.append(starts_with(Patient.name_normalized, name, dialect))
+        if filters.personal_number and (personal_number := filters.personal_number.replace("/", "").strip()):
+            conditions.append(Patient.personal_number >= personal_number)
+            conditions.append(Patient.personal_number < prefix_upper_bound(personal_number))
+        if filters.date_of_birth is not None:
+            conditions.append(Patient.date_of_birth == filters.date_of_birth)
+        if filters.birth_year is not None:
+            conditions.append(Patient.date_of_birth >= date(filters.birth_year, 1, 1))
+            conditions.append(Patient.date_of_birth < date(filters.birth_year + 1, 1, 1))
+        if filters.phone_number and (phone := normalize_phone(filters.phone_number)):
+            conditions.append(Patient.phone_normalized == phone)
+        if not conditions:
+            return None
+        return select(Patient).where(*conditions).order_by(
+            Patient.surname_normalized, Patient.name_normalized, Patient.id
+        )
+
+    @staticmethod
+    def search_patients(db: Session, filters: PatientSearch, limit: int = 20) -> list:
+        """Up to `limit` patients matching `filters`, e.g. surname "novák" born in 1970."""
+        statement = PatientService.build_search_statement(filters, db.get_bind().dialect.name)
+        if statement is None:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="At least one search filter is required")
+        return list(db.scalars(statement.limit(limit)))
 
     @staticmethod
     def delete_patient(db: Session, patient_id: int):
         db_patient = db.query(Patient).filter(Patient.id == patient_id).first()
         if db_patient:
             db.delete(db_patient)
-            db.commit()
+            db.flush()
         return db_patient
@@ -0,0 +1,62 @@
+from typing import Optional
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.medicine_index import medicine_index
+from app.core.pagination import Page, paginate
+from app.core.text import normalize_search_text, starts_with
+from app.core.transaction import on_commit
+from app.models.prescription_medicine import Medicine
+from app.schemas.prescription_medicine import PrescriptionMedicineCreate
+
+class PrescriptionMedicineService:
+    @staticmethod
+    def create_medicine(db: Session, medicine: PrescriptionMedicineCreate):
+        db_medicine = Medicine(**medicine.model_dump(), name_normalized=normalize_search_text(medicine.name))
+        db.add(db_medicine)
+        db.flush()
+        row = (db_medicine.id, db_medicine.name, db_medicine.description, db_medicine.name_normalized)
+        on_commit(db, lambda: medicine_index.add(*row))
+        return db_medicine
+
+    @staticmethod
+    def get_medicine(db: Session, medicine_id: int):
+        return db.query(Medicine).filter(Medicine.id == medicine_id).first()
+
+    @staticmethod
+    def get_medicines(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Medicine), Medicine.id, cursor, limit)
+
+    @staticmethod
+    def build_search_statement(prefix: str, dialect: str, fuzzy: bool = False):
+        """Medicines whose normalized name starts with the normalized `prefix`, in name order.
+
+        PostgreSQL matches with LIKE 'prefix%' on the text_pattern_ops index and, with `fuzzy`,
+        adds names pg_trgm finds similar (the `%` operator, served by the trigram GIN index),
+        ranked after the prefix matches. Other databases use a range on the plain index (see
+        `starts_with`); they have no fuzzy matching.
+        """
+        column = Medicine.name_normalized
+        is_prefix = starts_with(column, prefix, dialect)
+        if dialect != "postgresql" or not fuzzy:
+            return select(Medicine).where(is_prefix).order_by(column, Medicine.id)
+        # Prefix matches rank above every similarity, which is at most 1.
+        rank = case((is_prefix, 2.0), else_=func.similarity(column, prefix))
+        return select(Medicine).where(is_prefix | column.op("%")(prefix)).order_by(rank.desc(), column, Medicine.id)
+
+    @staticmethod
+    def search_medicines(db: Session, query: str, limit: int = 20, fuzzy: bool = True) -> list:
+        """Up to `limit` medicines whose name starts with `query`, ignoring case and diacritics.
+
+        With `fuzzy`, names similar to `query` (typos, a word from the middle of the name) follow
+        the prefix matches. The in-memory index answers when it is enabled and loaded; otherwise
+        the database does.
+        """
+        prefix = normalize_search_text(query)
+        if not prefix:
+            return []
+        if settings.MEDICINE_SEARCH_BACKEND == "memory" and medicine_index.loaded:
+            medicine_index.refresh_if_stale(db)
+            return medicine_index.search(prefix, limit, fuzzy)
+        statement = PrescriptionMedicineService.build_search_statement(prefix, db.get_bind().dialect.name, fuzzy)
+        return list(db.scalars(statement.limit(limit)))
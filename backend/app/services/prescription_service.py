@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import insert, or_, select
+from sqlalchemy.orm import Session
+from app.core.dates import as_utc
+from app.core.pagination import Page, paginate
+from app.models.doctor import Doctor
+from app.models.patient import Patient
+from app.models.prescription import Prescription
+from app.models.prescription_medicine import Medicine
+from app.schemas.prescription import PrescriptionCreate, PrescriptionRepeat
+
+class PrescriptionService:
+    @staticmethod
+    def prescription_row(prescription: PrescriptionCreate, created_at: datetime) -> dict:
+        return {
+            "dosage": prescription.dosage,
+            "date_from": as_utc(prescription.date_from),
+            "date_to": as_utc(prescription.date_to),
+            "created_at": created_at,
+            "patient_id": prescription.patient_id,
+            "doctor_id": prescription.doctor_id,
+            "medicine_id": prescription.medicine_id
+        }
+
+    @staticmethod
+    def invalid_period(prescription: PrescriptionCreate) -> bool:
+        if prescription.date_from is None or prescription.date_to is None:
+            return False
+        return as_utc(prescription.date_to) < as_utc(prescription.date_from)
+
+    @staticmethod
+    def create_prescription(db: Session, prescription: PrescriptionCreate):
+        if PrescriptionService.invalid_period(prescription):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date_to is before date_from")
+        db_prescription = Prescription(**PrescriptionService.prescription_row(prescription, datetime.now(timezone.utc)))
+        db.add(db_prescription)
+        db.flush()
+        return db_prescription
+
+    @staticmethod
+    def get_prescription(db: Session, prescription_id: int):
+        return db.query(Prescription).filter(Prescription.id == prescription_id).first()
+
+    @staticmethod
+    def get_prescriptions(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(Prescription), Prescription.id, cursor, limit)
+
+    @staticmethod
+    def build_active_statement(patient_id: int, at: datetime):
+        """Prescriptions of the patient valid at `at`; open-ended periods count as valid.
+
+        The (patient_id, date_to) index narrows the scan to the patient's prescriptions that
+        have not ended yet, however long their history is.
+        """
+        return select(Prescription).where(
+            Prescription.patient_id == patient_id,
+            or_(Prescription.date_to >= at, Prescription.date_to.is_(None)),
+            or_(Prescription.date_from <= at, Prescription.date_from.is_(None))
+        )
+
+    @staticmethod
+    def get_active_prescriptions(db: Session, patient_id: int, at: Optional[datetime] = None,
+                                 cursor: Optional[str] = None, limit: int = 100) -> Page:
+        at = as_utc(at) or datetime.now(timezone.utc)
+        statement = PrescriptionService.build_active_statement(patient_id, at)
+        return paginate(db, statement, Prescription.id, cursor, limit)
+
+    @staticmethod
+    def insert_prescriptions(db: Session, rows: list[dict]) -> list[int]:
+        """Inserts `rows` and returns their ids in the same order.
+
+        PostgreSQL sends them as one batched INSERT ... RETURNING; SQLite cannot order the
+        returned rows, so SQLAlchemy falls back to one INSERT per row there.
+        """
+        if not rows:
+            return []
+        statement = insert(Prescription).returning(Prescription.id, sort_by_parameter_order=True)
+        return list(db.scalars(statement, rows))
+
+    @staticmethod
+    def issue_prescriptions(db: Session, prescriptions: list[PrescriptionCreate]) -> list[dict]:
+        """Issues a batch of prescriptions; patients, doctors and medicines are checked with one SELECT each."""
+        known = {
+            "patient_id": set(db.scalars(select(Patient.id).where(
+                Patient.id.in_({p.patient_id for p in prescriptions})))),
+            "doctor_id": set(db.scalars(select(Doctor.id).where(
+                Doctor.id.in_({p.doctor_id for p in prescriptions})))),
+            "medicine_id": set(db.scalars(select(Medicine.id).where(
+                Medicine.id.in_({p.medicine_id for p in prescriptions})))),
+        }
+        missing = {"patient_id": "Patient not found", "doctor_id": "Doctor not found", "medicine_id": "Medicine not found"}
+
+        results = [None] * len(prescriptions)
+        valid = []
+        for index, prescription in enumerate(prescriptions):
+            detail = next((detail for column, detail in missing.items()
+                           if getattr(prescription, column) not in known[column]), None)
+            if detail is None and PrescriptionService.invalid_period(prescription):
+                detail = "date_to is before date_from"
+            if detail is None:
+                valid.append(index)
+            else:
+                results[index] = {"index": index, "status": "error", "detail": detail}
+
+        created_at = datetime.now(timezone.utc)
+        ids = PrescriptionService.insert_prescriptions(
+            db, [PrescriptionService.prescription_row(prescriptions[index], created_at) for index in valid]
+        )
+        for index, prescription_id in zip(valid, ids):
+            results[index] = {"index": index, "status": "created", "prescription_id": prescription_id}
+        return results
+
+    @staticmethod
+    def repeat_prescriptions(db: Session, repeat: PrescriptionRepeat) -> list[dict]:
+        """Reissues existing prescriptions (same patient, medicine and dosage) for a new period.
+
+        One SELECT reads the originals and one INSERT creates the copies; each listed id gets a
+        result in input order.
+        """
+        if as_utc(repeat.date_to) < as_utc(repeat.date_from):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="date_to is before date_from")
+        if db.get(Doctor, repeat.doctor_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Doctor not found")
+        originals = {
+            prescription.id: prescription
+            for prescription in db.execute(
+                select(Prescription.id, Prescription.dosage, Prescription.patient_id, Prescription.medicine_id)
+                .where(Prescription.id.in_(repeat.prescription_ids))
+            )
+        }
+
+        results = [None] * len(repeat.prescription_ids)
+        valid = []
+        for index, prescription_id in enumerate(repeat.prescription_ids):
+            if prescription_id in originals:
+                valid.append(index)
+            else:
+                results[index] = {"index": index, "status": "error", "detail": "Prescription not found"}
+
+        created_at = datetime.now(timezone.utc)
+        rows = []
+        for index in valid:
+            original = originals[repeat.prescription_ids[index]]
+            rows.append(PrescriptionService.prescription_row(PrescriptionCreate(
+                dosage=original.dosage, date_from=repeat.date_from, date_to=repeat.date_to,
+                patient_id=original.patient_id, doctor_id=repeat.doctor_id, medicine_id=original.medicine_id
+            ), created_at))
+        ids = PrescriptionService.insert_prescriptions(db, rows)
+        for index, prescription_id in zip(valid, ids):
+            results[index] = {"index": index, "status": "created", "prescription_id": prescription_id}
+        return results
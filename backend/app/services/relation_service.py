@@ -0,0 +1,113 @@
+from fastapi import HTTPException, status
+from sqlalchemy import Integer, bindparam, case, func, literal, or_, select
+from sqlalchemy.orm import Session
+from app.models.patient import Patient
+from app.models.relation import FamilyRelation
+from app.models.request import Request
+from app.schemas.relation import RelationCreate
+
+MAX_RELATION_DEPTH = 6
+
+class RelationService:
+    @staticmethod
+    def create_relation(db: Session, relation: RelationCreate):
+        if relation.patient_id == relation.related_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A patient cannot be related to themselves")
+        found = set(db.scalars(select(Patient.id).where(Patient.id.in_([relation.patient_id, relation.related_id]))))
+        if len(found) < 2:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
+        if db.get(FamilyRelation, (relation.patient_id, relation.related_id)) is not None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Relation already exists")
+        db_relation = FamilyRelation(**relation.model_dump())
+        db.add(db_relation)
+        db.flush()
+        return db_relation
+
+    @staticmethod
+    def get_relations(db: Session, patient_id: int) -> list:
+        """The patient's direct relations, recorded from either side."""
+        return list(db.scalars(select(FamilyRelation).where(
+            or_(FamilyRelation.patient_id == patient_id, FamilyRelation.related_id == patient_id)
+        ).order_by(FamilyRelation.patient_id, FamilyRelation.related_id)))
+
+    @staticmethod
+    def delete_relation(db: Session, patient_id: int, related_id: int):
+        db_relation = db.get(FamilyRelation, (patient_id, related_id))
+        if db_relation:
+            db.delete(db_relation)
+            db.flush()
+        return db_relation
+
+    @staticmethod
+    def ensure_patient(db: Session, patient_id: int) -> None:
+        if db.get(Patient, patient_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Patient not found")
+
+    @staticmethod
+    def get_relatives(db: Session, patient_id: int, max_depth: int = 2) -> list[dict]:
+        """Relatives within `max_depth` relations, nearest first, in one query."""
+        RelationService.ensure_patient(db, patient_id)
+        rows = db.execute(RELATIVES_STATEMENT, {"patient_id": patient_id, "max_depth": max_depth}).mappings()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def get_relatives_with_pending_requests(db: Session, patient_id: int, max_depth: int = 1) -> list[dict]:
+        """Relatives within `max_depth` relations who have pending requests, with how many, in one query."""
+        RelationService.ensure_patient(db, patient_id)
+        rows = db.execute(PENDING_RELATIVES_STATEMENT, {"patient_id": patient_id, "max_depth": max_depth}).mappings()
+        return [dict(row) for row in rows]
+
+
+def build_relatives_statement():
+    """(id, depth) of everyone within :max_depth relations of :patient_id, the patient excluded.
+
+    A recursive CTE walks the relations in the database, in both directions: the primary key
+    serves patient_id -> related_id edges and ix_family_relation_related_patient the reverse
+    ones. UNION drops repeats of a person at the same depth, so cycles (two parents of the same
+    child) end at max_depth; each person keeps the shortest depth.
+    """
+    patient_id = bindparam("patient_id", type_=Integer)
+    relatives = select(patient_id.label("id"), literal(0, Integer).label("depth")).cte("relatives", recursive=True)
+    edge = FamilyRelation.__table__
+    relatives = relatives.union(
+        select(
+            case((edge.c.patient_id == relatives.c.id, edge.c.related_id), else_=edge.c.patient_id),
+            relatives.c.depth + 1
+        )
+        .join(edge, or_(edge.c.patient_id == relatives.c.id, edge.c.related_id == relatives.c.id))
+        .where(relatives.c.depth < bindparam("max_depth", type_=Integer))
+    )
+    return (
+        select(relatives.c.id, func.min(relatives.c.depth).label("depth"))
+        .where(relatives.c.id != patient_id)
+        .group_by(relatives.c.id)
+    )
+
+
+def build_relatives_out_statement():
+    """The relatives of `build_relatives_statement` with their names, nearest first."""
+    relatives = build_relatives_statement().subquery()
+    return (
+        select(Patient.id.label("patient_id"), Patient.name, Patient.surname, Patient.personal_number,
+               relatives.c.depth)
+        .join(relatives, relatives.c.id == Patient.id)
+        .order_by(relatives.c.depth, Patient.id)
+    )
+
+
+def build_pending_relatives_statement():
+    """The relatives of `build_relatives_statement` with their count of pending requests, those without left out."""
+    relatives = build_relatives_statement().subquery()
+    return (
+        select(Patient.id.label("patient_id"), Patient.name, Patient.surname, Patient.personal_number,
+               relatives.c.depth, func.count(Request.id).label("pending_requests"))
+        .join(relatives, relatives.c.id == Patient.id)
+        .join(Request, (Request.patient_id == Patient.id) & (Request.state == "pending"))
+        .group_by(Patient.id, Patient.name, Patient.surname, Patient.personal_number, relatives.c.depth)
+        .order_by(relatives.c.depth, Patient.id)
+    )
+
+
+# Built once: constructing the recursive statement costs more than running it on an indexed graph.
+RELATIVES_STATEMENT = build_relatives_out_statement()
+PENDING_RELATIVES_STATEMENT = build_pending_relatives_statement()
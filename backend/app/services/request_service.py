@@ -1,30 +1,155 @@
+from datetime import datetime, timezone
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
-from app.models.request import Request
-from app.schemas.request import RequestCreate
+from app.core.pagination import Page, paginate
+from app.models.request import ALLOWED_TRANSITIONS, Request
+from app.schemas.request import RequestCreate, RequestFilter, RequestOut, RequestSort
+from app.core.audit import audit_on_commit
+from app.core.dates import as_utc
+from app.core.cache import invalidate_on_commit
+from app.core.events import publish_on_commit
+from app.core.notifications import notify_on_commit
+from app.services.list_all_terms_service import CACHE_NAMESPACE as TERMS_CACHE_NAMESPACE
+from app.services.notification_service import NotificationService
+
+REQUEST_CREATED = "request.created"
+REQUEST_STATE_CHANGED = "request.state_changed"
+# Columns copied from a request into its AppointmentHistory rows.
+HISTORY_COLUMNS = ("appointment_id", "doctor_id", "patient_id", "nurse_id")
+
+
+def column_value(request, column: str):
+    return request[column] if isinstance(request, dict) else getattr(request, column)
+
 
 class RequestService:
+    @staticmethod
+    def event_data(request) -> dict:
+        """The JSON payload of request events; `request` is a Request or a dict of its columns."""
+        return RequestOut.model_validate(request, from_attributes=True).model_dump(mode="json")
+
+    @staticmethod
+    def history_row(request, change_type: str, description: str) -> dict:
+        """An AppointmentHistory row about `request` (a Request or a dict of its columns)."""
+        return {"change_type": change_type, "description": description, "created_at": datetime.now(timezone.utc),
+                **{column: column_value(request, column) for column in HISTORY_COLUMNS}}
+
+    @staticmethod
+    def booked_history_row(request) -> dict:
+        request_id, appointment_id = column_value(request, "id"), column_value(request, "appointment_id")
+        return RequestService.history_row(request, "request_booked",
+                                          f"Request {request_id} booked for appointment {appointment_id}")
+
+    @staticmethod
+    def state_history_row(request, previous_state: str) -> dict:
+        return RequestService.history_row(
+            request, f"request_{request.state}", f"Request {request.id}: {previous_state} -> {request.state}"
+        )
+
+    @staticmethod
+    def on_created(db: Session, request) -> None:
+        """Queues the event, history row and patient notification of a new request until `db` commits."""
+        data = RequestService.event_data(request)
+        publish_on_commit(db, REQUEST_CREATED, data)
+        audit_on_commit(db, [RequestService.booked_history_row(data)])
+        notify_on_commit(db, NotificationService.booked_rows(data))
+
+    @staticmethod
+    def on_state_changed(db: Session, request: Request, previous_state: str) -> None:
+        """Queues the event, history row and patient notification of a state change until `db` commits."""
+        publish_on_commit(db, REQUEST_STATE_CHANGED, {**RequestService.event_data(request), "previous_state": previous_state})
+        audit_on_commit(db, [RequestService.state_history_row(request, previous_state)])
+        notify_on_commit(db, NotificationService.state_rows(request))
+
     @staticmethod
     def get_request(db: Session, request_id: int):
         return db.query(Request).filter(Request.id == request_id).first()
 
     @staticmethod
-    def get_requests(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(Request).offset(skip).limit(limit).all()
+    def build_requests_statement(filters: RequestFilter):
+        statement = select(Request)
+        if filters.state:
+            # A single state compiles to "state = ..." so the pending-queue partial index applies.
+            statement = statement.where(
+                Request.state == filters.state[0] if len(filters.state) == 1 else Request.state.in_(filters.state)
+            )
+        for column in ("nurse_id", "doctor_id", "request_type_id"):
+            value = getattr(filters, column)
+            if value is not None:
+                statement = statement.where(getattr(Request, column) == value)
+        if filters.created_from is not None:
+            statement = statement.where(Request.created_at >= as_utc(filters.created_from))
+        if filters.created_to is not None:
+            statement = statement.where(Request.created_at < as_utc(filters.created_to))
+        return statement
+
+    @staticmethod
+    def get_requests(db: Session, cursor: Optional[str] = None, limit: int = 100,
+                     filters: Optional[RequestFilter] = None, sort: RequestSort = "id") -> Page:
+        """One keyset page of requests matching `filters`, ordered by `sort` and then id."""
+        statement = RequestService.build_requests_statement(filters or RequestFilter())
+        sort_column = Request.created_at if sort.lstrip("-") == "created_at" else None
+        return paginate(db, statement, Request.id, cursor, limit, sort_column, descending=sort.startswith("-"))
 
     @staticmethod
     def create_request(db: Session, request: RequestCreate):
         db_request = Request(**request.model_dump())
         db.add(db_request)
-        db.commit()
-        db.refresh(db_request)
+        db.flush()
+        invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
+        RequestService.on_created(db, db_request)
         return db_request
 
+    @staticmethod
+    def transition_requests(db: Session, request_ids: list[int], new_state: str) -> list[dict]:
+        """Moves a batch of requests to `new_state`.
+
+        The current states are read (and locked) in one SELECT and the allowed requests are changed
+        in one UPDATE ... RETURNING; their history rows, events and notifications follow on commit.
+        """
+        if new_state not in ALLOWED_TRANSITIONS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown state '{new_state}'")
+        request_ids = list(dict.fromkeys(request_ids))
+        current = dict(db.execute(
+            select(Request.id, Request.state).where(Request.id.in_(request_ids)).with_for_update()
+        ).all())
+
+        results = {}
+        for request_id in request_ids:
+            previous_state = current.get(request_id)
+            if previous_state is None:
+                results[request_id] = {"id": request_id, "status": "error", "detail": "Request not found"}
+            elif new_state not in ALLOWED_TRANSITIONS.get(previous_state, ()):
+                results[request_id] = {"id": request_id, "status": "error", "previous_state": previous_state,
+                                       "detail": f"Cannot change state from {previous_state} to {new_state}"}
+            else:
+                results[request_id] = {"id": request_id, "status": "updated", "previous_state": previous_state}
+
+        allowed = [request_id for request_id, result in results.items() if result["status"] == "updated"]
+        if allowed:
+            updated = db.scalars(
+                update(Request).where(Request.id.in_(allowed)).values(state=new_state).returning(Request)
+            ).all()
+            invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
+            for request in updated:
+                RequestService.on_state_changed(db, request, current[request.id])
+        return list(results.values())
+
     @staticmethod
     def update_request_status(db: Session, request_id: int, new_state: str):
-        """Updates the state of a specific request."""
-        db_request = db.query(Request).filter(Request.id == request_id).first()
+        """Updates the state of a specific request, following the same ALLOWED_TRANSITIONS as `transition_requests`."""
+        if new_state not in ALLOWED_TRANSITIONS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Unknown state '{new_state}'")
+        db_request = db.query(Request).filter(Request.id == request_id).with_for_update().first()
         if db_request:
+            previous_state = db_request.state
+            if new_state not in ALLOWED_TRANSITIONS.get(previous_state, ()):
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                                    detail=f"Cannot change state from {previous_state} to {new_state}")
             db_request.state = new_state
-            db.commit()
-            db.refresh(db_request)
+            db.flush()
+            invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
+            RequestService.on_state_changed(db, db_request, previous_state)
         return db_request
\ No newline at end of file
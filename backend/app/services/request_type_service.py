@@ -1,14 +1,21 @@
+from typing import Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
+from app.core.cache import CacheEntry, invalidate_on_commit, cache
+from app.core.pagination import Page, paginate
 from app.models.request_type import RequestType
 from app.schemas.request_type import RequestTypeCreate, RequestTypeOut
+from app.services.list_all_terms_service import CACHE_NAMESPACE as TERMS_CACHE_NAMESPACE
+
+CACHE_NAMESPACE = "request_types"
 
 class RequestTypeService:
     @staticmethod
     def create_request_type(db: Session, request_type: RequestTypeCreate):
         db_request_type = RequestType(**request_type.model_dump())
         db.add(db_request_type)
-        db.commit()
-        db.refresh(db_request_type)
+        db.flush()
+        invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_request_type
 
     @staticmethod
@@ -16,8 +23,20 @@ class RequestTypeService:
         return db.query(RequestType).filter(RequestType.id == request_type_id).first()
 
     @staticmethod
-    def get_request_types(db: Session, skip: int = 0, limit: int = 100):
-        return db.query(RequestType).offset(skip).limit(limit).all()
+    def get_request_types(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        return paginate(db, select(RequestType), RequestType.id, cursor, limit)
+
+    @staticmethod
+    def get_request_types_cached(db: Session, cursor: Optional[str] = None, limit: int = 100) -> CacheEntry:
+        """Cached, JSON-ready page of `get_request_types` as {"items": [...], "next_cursor": ...}."""
+        def load():
+            page = RequestTypeService.get_request_types(db, cursor, limit)
+            return {
+                "items": [RequestTypeOut.model_validate(t, from_attributes=True).model_dump(mode="json") for t in page.items],
+                "next_cursor": page.next_cursor
+            }
+
+        return cache.get_or_load((CACHE_NAMESPACE, cursor, limit), load)
 
     @staticmethod
     def update_request_type(db: Session, request_type_id: int, request_type: RequestTypeCreate):
@@ -26,8 +45,10 @@ class RequestTypeService:
             db_request_type.name = request_type.name
             db_request_type.description = request_type.description
             db_request_type.length = request_type.length
-            db.commit()
-            db.refresh(db_request_type)
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
+            # Term listings embed the request type's name and length.
+            invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
         return db_request_type
 
     @staticmethod
@@ -35,5 +56,8 @@ class RequestTypeService:
         db_request_type = db.query(RequestType).filter(RequestType.id == request_type_id).first()
         if db_request_type:
             db.delete(db_request_type)
-            db.commit()
+            db.flush()
+            invalidate_on_commit(db, CACHE_NAMESPACE)
+            # Term listings embed the request type's name and length.
+            invalidate_on_commit(db, TERMS_CACHE_NAMESPACE)
         return db_request_type
@@ -1,23 +1,70 @@
+from datetime import datetime, timezone
+from typing import Any, Optional
+from pydantic import ValidationError
+from sqlalchemy import insert
 from sqlmodel import Session, select
 from fastapi import HTTPException, status
+from app.core.dates import as_utc
+from app.core.pagination import Page, paginate
+from app.models.request import Request
 from app.models.test import Test
+from app.models.test_type import MedicalTestType
 from app.schemas.test import TestCreate, TestUpdate
 
 class TestService:
     @staticmethod
     def create_test(db: Session, test_data: TestCreate) -> Test:
         """Creates a new test record in the database."""
-        print(f"Received test data: {test_data}")
-        test_dict = test_data.model_dump()
-        test_dict["id"] = None
-        db_test = Test.model_validate(test_dict)
-        print(f"Validated test model: {db_test}")
+        db_test = Test(**test_data.model_dump())
         db.add(db_test)
-        db.commit()
-        db.refresh(db_test)
-        print(f"Test after commit and refresh: {db_test}")
+        db.flush()
         return db_test
 
+    @staticmethod
+    def validation_detail(error: ValidationError) -> str:
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc'])}: {item['msg']}" if item["loc"] else item["msg"]
+            for item in error.errors()
+        )
+
+    @staticmethod
+    def ingest_tests(db: Session, items: list[Any]) -> dict:
+        """Stores a batch of analyzer results.
+
+        `items` are decoded JSON values; a ValueError stands for a line that was not valid JSON.
+        The valid rows go in one executemany INSERT without RETURNING, so it stays one batched
+        statement on every database.
+        """
+        errors = []
+        valid: list[tuple[int, TestCreate]] = []
+        for index, item in enumerate(items):
+            if isinstance(item, ValueError):
+                errors.append({"index": index, "detail": f"Invalid JSON: {item}"})
+                continue
+            try:
+                valid.append((index, TestCreate.model_validate(item)))
+            except ValidationError as error:
+                errors.append({"index": index, "detail": TestService.validation_detail(error)})
+
+        test_types = set(db.scalars(select(MedicalTestType.id).where(
+            MedicalTestType.id.in_({test.test_type_id for _, test in valid})))) if valid else set()
+        requests = set(db.scalars(select(Request.id).where(
+            Request.id.in_({test.request_id for _, test in valid})))) if valid else set()
+
+        created_at = datetime.now(timezone.utc)
+        rows = []
+        for index, test in valid:
+            if test.test_type_id not in test_types:
+                errors.append({"index": index, "detail": "Test type not found"})
+            elif test.request_id not in requests:
+                errors.append({"index": index, "detail": "Request not found"})
+            else:
+                rows.append({**test.model_dump(), "test_date": as_utc(test.test_date), "created_at": created_at})
+        if rows:
+            db.execute(insert(Test), rows)
+        errors.sort(key=lambda error: error["index"])
+        return {"created": len(rows), "failed": len(errors), "errors": errors}
+
     @staticmethod
     def get_test_by_id(db: Session, test_id: int) -> Test | None:
         """Retrieves a test record by its ID."""
@@ -28,11 +75,9 @@ class TestService:
         return test
 
     @staticmethod
-    def get_all_tests(db: Session, skip: int = 0, limit: int = 100) -> list[Test]:
-        """Retrieve all tests with pagination."""
-        statement = select(Test).offset(skip).limit(limit)
-        tests = db.execute(statement).scalars().all()
-        return tests
+    def get_all_tests(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        """Retrieve one keyset page of tests, ordered by id."""
+        return paginate(db, select(Test), Test.id, cursor, limit)
 
     @staticmethod
     def update_test(db: Session, test_id: int, test_update_data: TestUpdate) -> Test:
@@ -44,8 +89,7 @@ class TestService:
             setattr(db_test, key, value)
 
         db.add(db_test)
-        db.commit()
-        db.refresh(db_test)
+        db.flush()
         return db_test
 
     @staticmethod
@@ -54,5 +98,5 @@ class TestService:
         db_test = TestService.get_test_by_id(db, test_id)
 
         db.delete(db_test)
-        db.commit()
+        db.flush()
         return db_test
@@ -1,19 +1,32 @@
 from sqlmodel import Session, select
-from typing import List
+from typing import List, Optional
+from app.core.cache import CacheEntry, invalidate_on_commit, cache
+from app.core.pagination import Page, paginate
 # Correct the model import
 from app.models.test_type import MedicalTestType
 # Import the create schema
-from app.schemas.test_type import TestTypeCreate
+from app.schemas.test_type import TestTypeCreate, TestTypeOut
+
+CACHE_NAMESPACE = "test_types"
 
 class TestTypeService:
 
     @staticmethod
-    def get_all_test_types(db: Session, skip: int = 0, limit: int = 100) -> List[MedicalTestType]:
-        """Retrieve all test types with pagination."""
-        # Use the correct model name and db.execute
-        statement = select(MedicalTestType).offset(skip).limit(limit)
-        test_types = db.execute(statement).scalars().all()
-        return test_types
+    def get_all_test_types(db: Session, cursor: Optional[str] = None, limit: int = 100) -> Page:
+        """Retrieve one keyset page of test types, ordered by id."""
+        return paginate(db, select(MedicalTestType), MedicalTestType.id, cursor, limit)
+
+    @staticmethod
+    def get_all_test_types_cached(db: Session, cursor: Optional[str] = None, limit: int = 100) -> CacheEntry:
+        """Cached, JSON-ready variant of `get_all_test_types`, invalidated when a test type is created."""
+        def load():
+            page = TestTypeService.get_all_test_types(db, cursor, limit)
+            return {
+                "items": [TestTypeOut.model_validate(t, from_attributes=True).model_dump(mode="json") for t in page.items],
+                "next_cursor": page.next_cursor
+            }
+
+        return cache.get_or_load((CACHE_NAMESPACE, cursor, limit), load)
 
     @staticmethod
     def get_test_type_by_id(db: Session, test_type_id: int) -> MedicalTestType | None:
@@ -28,8 +41,8 @@ class TestTypeService:
         """Creates a new test type record in the database."""
         db_test_type = MedicalTestType.model_validate(test_type_data)
         db.add(db_test_type)
-        db.commit()
-        db.refresh(db_test_type)
+        db.flush()
+        invalidate_on_commit(db, CACHE_NAMESPACE)
         return db_test_type
 
 # Add other methods like update, delete if needed later
@@ -0,0 +1,89 @@
+"""Benchmark CalendarService.get_free_slots for a doctor with a year of bookings.
+
+Run from the backend directory: python -m benchmarks.bench_availability
+"""
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.models import Appointment, Doctor, Patient, Request, RequestType
+from app.services.calendar_service import CalendarService
+
+WORKING_DAYS = 250
+WINDOWS_PER_DAY = 8
+RUNS = 50
+
+
+def seed(db):
+    random.seed(0)
+    doctor = Doctor(name="Jan", surname="Novak")
+    patients = [Patient(name="Eva", surname="Dvorakova", personal_number=f"90010112{i:02d}") for i in range(3)]
+    request_types = [RequestType(name=f"type {m}", description="desc", length=m) for m in (10, 15, 20, 30)]
+    db.add_all([doctor, *patients, *request_types])
+    db.flush()
+
+    start = datetime(2025, 1, 6, 7, 0, tzinfo=timezone.utc)
+    appointments = []
+    for day in range(WORKING_DAYS):
+        day_start = start + timedelta(days=day + 2 * (day // 5))
+        for window in range(WINDOWS_PER_DAY):
+            window_start = day_start + timedelta(hours=window)
+            appointments.append(Appointment(
+                event_type="ambulance",
+                date_from=window_start,
+                date_to=window_start + timedelta(hours=1),
+                doctor_id=doctor.id,
+            ))
+    db.add_all(appointments)
+    db.flush()
+
+    requests = []
+    for appointment in appointments:
+        for patient in patients[:random.randint(0, 3)]:
+            requests.append(Request(
+                patient_id=patient.id,
+                doctor_id=doctor.id,
+                nurse_id=None,
+                appointment_id=appointment.id,
+                request_type_id=random.choice(request_types).id,
+                state=random.choice(("pending", "approved", "declined")),
+            ))
+    db.add_all(requests)
+    db.commit()
+    return doctor.id, request_types[1].id, start, len(appointments), len(requests)
+
+
+def measure(fn):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def main():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    doctor_id, request_type_id, start, appointments, requests = seed(db)
+    print(f"{appointments} appointments, {requests} requests")
+
+    for label, days in (("week", 7), ("year", 365)):
+        availability, median_ms = measure(lambda: CalendarService.get_free_slots(
+            db, doctor_id, request_type_id, start, start + timedelta(days=days)
+        ))
+        print(f"{label:>5}: {len(availability['free_slots']):6d} free slots, median {median_ms:7.2f} ms")
+
+    windows = CalendarService.get_booked_windows(db, doctor_id, start, start + timedelta(days=365))
+    _, median_ms = measure(lambda: CalendarService.compute_free_slots(windows, timedelta(minutes=15)))
+    print(f"sweep only (year): median {median_ms:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
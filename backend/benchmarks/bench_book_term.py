@@ -0,0 +1,85 @@
+"""Benchmark 1,000 bookings through BookTermService.book_term versus BookTermService.book_terms.
+
+Run from the backend directory: python -m benchmarks.bench_book_term
+Uses a SQLite file so every commit pays for a real fsync, as it would on a database server.
+"""
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.models import Appointment, Doctor, Nurse, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+
+BOOKINGS = 1000
+
+
+def setup(path):
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    doctor = Doctor(name="Jan", surname="Novak")
+    db.add(doctor)
+    db.flush()
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    appointments = [
+        Appointment(event_type="screening", date_from=start + timedelta(days=day),
+                    date_to=start + timedelta(days=day, hours=8), doctor_id=doctor.id)
+        for day in range(20)
+    ]
+    request_type = RequestType(name="screening", description="desc", length=10)
+    db.add_all([Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id), request_type, *appointments])
+    db.commit()
+    bookings = [
+        BookTermBase.model_validate({
+            "kalendar_id": appointments[i % len(appointments)].id,
+            "doktor_id": doctor.id,
+            "pacient_jmeno": "Pacient",
+            "pacient_prijmeni": f"{i}",
+            "pacient_telefon": "777123456",
+            "pacient_rodne_cislo": f"{i:010d}",
+            "pacient_poznamka": "screening",
+            "typ_zadanky_id": request_type.id,
+        })
+        for i in range(BOOKINGS)
+    ]
+    return engine, db, bookings
+
+
+def run(label, book):
+    with tempfile.TemporaryDirectory() as directory:
+        engine, db, bookings = setup(os.path.join(directory, "bench.db"))
+        started = time.perf_counter()
+        book(db, bookings)
+        elapsed = time.perf_counter() - started
+        db.close()
+        engine.dispose()
+    print(f"{label:>6}: {BOOKINGS} bookings in {elapsed * 1000:8.1f} ms ({BOOKINGS / elapsed:8.0f} / s)")
+    return elapsed
+
+
+def book_one_by_one(db, bookings):
+    # One unit of work per booking, as with separate POST /api/terms/book-term calls.
+    for booking in bookings:
+        BookTermService.book_term(db, booking)
+        db.commit()
+
+
+def book_batch(db, bookings):
+    BookTermService.book_terms(db, bookings)
+    db.commit()
+
+
+def main():
+    single = run("single", book_one_by_one)
+    batch = run("batch", book_batch)
+    print(f"batch speed-up: {single / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
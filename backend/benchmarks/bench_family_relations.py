@@ -0,0 +1,121 @@
+"""Benchmark family-relation traversal over a synthetic graph of a million patients.
+
+Compares the recursive CTE of RelationService with walking the graph from Python, one query
+per level, with and without the reverse-edge index.
+
+Run from the backend directory: python -m benchmarks.bench_family_relations [--patients 1000000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, or_, select
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Doctor, FamilyRelation, Patient, Request
+from app.services.relation_service import RelationService
+
+RUNS = 50
+CHUNK = 50_000
+HOUSEHOLD = 4
+DEPTHS = (1, 2, 4, 6)
+REVERSE_INDEX = "ix_family_relation_related_patient"
+
+
+def seed(engine, patients):
+    """Households of two parents and two children; each household's daughter marries the next household's son."""
+    for table in (Doctor.__table__, Patient.__table__, FamilyRelation.__table__, Request.__table__):
+        table.create(engine)
+    random.seed(0)
+    with engine.begin() as connection:
+        connection.execute(insert(Doctor), [{"name": "Jan", "surname": "Novak"}])
+        for start in range(0, patients, CHUNK):
+            connection.execute(insert(Patient), [
+                {"name": f"Jmeno{i}", "surname": f"Prijmeni{i // HOUSEHOLD}", "personal_number": f"{i:010d}"}
+                for i in range(start + 1, min(start + CHUNK, patients) + 1)
+            ])
+        relations = []
+        for father in range(1, patients - HOUSEHOLD + 2, HOUSEHOLD):
+            mother, son, daughter = father + 1, father + 2, father + 3
+            relations += [(father, mother, "spouse"), (son, father, "parent"), (son, mother, "parent"),
+                          (daughter, father, "parent"), (daughter, mother, "parent")]
+            if daughter + HOUSEHOLD + 1 <= patients:
+                relations.append((daughter, daughter + HOUSEHOLD - 1, "spouse"))
+        for start in range(0, len(relations), CHUNK):
+            connection.execute(insert(FamilyRelation), [
+                {"patient_id": patient_id, "related_id": related_id, "relation": relation}
+                for patient_id, related_id, relation in relations[start:start + CHUNK]
+            ])
+        connection.execute(insert(Request), [
+            {"patient_id": patient_id, "doctor_id": 1, "state": "pending"}
+            for patient_id in random.sample(range(1, patients + 1), patients // 20)
+        ])
+    return len(relations)
+
+
+def walk_in_python(db, patient_id, max_depth):
+    """Breadth-first search issuing one query per level."""
+    seen, frontier = {patient_id: 0}, [patient_id]
+    for depth in range(1, max_depth + 1):
+        edges = db.execute(select(FamilyRelation.patient_id, FamilyRelation.related_id).where(or_(
+            FamilyRelation.patient_id.in_(frontier), FamilyRelation.related_id.in_(frontier)
+        ))).all()
+        frontier = [other for edge in edges for other in edge if other not in seen]
+        for other in frontier:
+            seen[other] = depth
+        if not frontier:
+            break
+    del seen[patient_id]
+    return seen
+
+
+def median_ms(fn, starts):
+    timings = []
+    for patient_id in starts:
+        started = time.perf_counter()
+        fn(patient_id)
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def measure(db, starts, label):
+    print(label)
+    for depth in DEPTHS:
+        found = len(RelationService.get_relatives(db, starts[0], depth))
+        cte_ms = median_ms(lambda patient_id: RelationService.get_relatives(db, patient_id, depth), starts)
+        python_ms = median_ms(lambda patient_id: walk_in_python(db, patient_id, depth), starts)
+        print(f"  depth {depth}: ~{found:3d} relatives, recursive CTE {cte_ms:8.3f} ms, "
+              f"python walk {python_ms:8.3f} ms")
+    pending_ms = median_ms(lambda patient_id: RelationService.get_relatives_with_pending_requests(db, patient_id, 2),
+                           starts)
+    print(f"  relatives within 2 with pending requests: {pending_ms:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        started = time.perf_counter()
+        relations = seed(engine, args.patients)
+        print(f"seeded {args.patients} patients, {relations} relations in {time.perf_counter() - started:.1f} s")
+        db = sessionmaker(bind=engine)()
+        random.seed(1)
+        starts = [random.randrange(1, args.patients - 2 * HOUSEHOLD) for _ in range(RUNS)]
+
+        measure(db, starts, "with the reverse-edge index")
+        index = next(index for index in FamilyRelation.__table__.indexes if index.name == REVERSE_INDEX)
+        index.drop(engine)
+        # Every step of the walk scans the table without it, so fewer runs suffice.
+        measure(db, starts[:5], "without it")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
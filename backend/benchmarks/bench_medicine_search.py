@@ -0,0 +1,88 @@
+"""Benchmark medicine search over a 100k-row catalogue: the in-memory index against the database.
+
+Run from the backend directory: python -m benchmarks.bench_medicine_search
+"""
+import random
+import statistics
+import time
+import tracemalloc
+
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.core.medicine_index import MedicineIndex
+from app.core.text import normalize_search_text
+from app.models import Medicine
+from app.services.prescription_medicine_service import PrescriptionMedicineService
+
+MEDICINES = 100_000
+RUNS = 50
+SYLLABLES = ["pa", "ra", "len", "ibu", "pro", "fen", "ce", "ta", "mol", "ál", "gin", "zo", "lek", "vi", "tamín", "ox"]
+SUFFIXES = ["", " 200", " 400", " 500", " Rapid", " Forte", " Teva", " Zentiva", " sirup", " tbl."]
+QUERIES = ["p", "pa", "ibu", "Ibupro", "tamin", "zolekvi", "xyz"]
+# A doctor typing with a typo: every keystroke is a search.
+KEYSTROKES = ["i", "ib", "ibu", "ibup", "ibupr", "ibupro", "ibuprf", "ibuprfe", "ibuprfen"]
+
+
+def seed(db):
+    random.seed(0)
+    rows = []
+    for _ in range(MEDICINES):
+        name = "".join(random.choices(SYLLABLES, k=random.randint(2, 4))).capitalize() + random.choice(SUFFIXES)
+        rows.append({"name": name, "name_normalized": normalize_search_text(name)})
+    db.execute(insert(Medicine), rows)
+    db.commit()
+
+
+def measure(fn):
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        result = fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return result, statistics.median(timings)
+
+
+def scan(db, query, limit=20):
+    """The unindexed equivalent: case-insensitive LIKE on the raw name (diacritics not folded)."""
+    return db.scalars(
+        select(Medicine).where(func.lower(Medicine.name).like(query.lower() + "%")).order_by(Medicine.name).limit(limit)
+    ).all()
+
+
+def main():
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    seed(db)
+    print(f"{MEDICINES} medicines")
+
+    index = MedicineIndex(refresh_interval=3600)
+    started = time.perf_counter()
+    index.load(db)
+    load_s = time.perf_counter() - started
+    tracemalloc.start()
+    measured = MedicineIndex(refresh_interval=3600)
+    measured.load(db)
+    memory_mb = tracemalloc.get_traced_memory()[0] / 2**20
+    tracemalloc.stop()
+    del measured
+    print(f"index load {load_s:.2f} s, {memory_mb:.0f} MB")
+
+    print("prefix only:")
+    for query in QUERIES:
+        found, memory_ms = measure(lambda: index.search(normalize_search_text(query), 20, fuzzy=False))
+        _, indexed_ms = measure(lambda: PrescriptionMedicineService.search_medicines(db, query, fuzzy=False))
+        _, scan_ms = measure(lambda: scan(db, query))
+        print(f"{query!r:>12}: {len(found):3d} hits, memory {memory_ms:6.3f} ms, "
+              f"database index {indexed_ms:6.3f} ms, database scan {scan_ms:7.3f} ms")
+
+    print("prefix + fuzzy, per keystroke:")
+    for query in KEYSTROKES:
+        found, memory_ms = measure(lambda: index.search(normalize_search_text(query), 20))
+        print(f"{query!r:>12}: {len(found):3d} hits, memory {memory_ms:6.3f} ms, first {found[0]['name'] if found else '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark patient lookups by personal number with and without the patient indexes.
+
+Run from the backend directory: python -m benchmarks.bench_patient_lookup [--patients 1000000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Patient
+from app.schemas.history import PatientLookup
+from app.services.history_service import build_patient_statement
+from app.services.patient_service import PatientService
+
+LOOKUPS = 200
+CHUNK = 50_000
+
+
+def seed(engine, patients):
+    Patient.__table__.create(engine)
+    for index in Patient.__table__.indexes:
+        index.drop(engine)
+    with engine.begin() as connection:
+        for start in range(0, patients, CHUNK):
+            connection.execute(insert(Patient), [
+                {"name": f"Jmeno{i % 5000}", "surname": f"Prijmeni{i % 20000}", "personal_number": f"{i:010d}"}
+                for i in range(start, min(start + CHUNK, patients))
+            ])
+
+
+def measure(db, patients, label):
+    random.seed(1)
+    numbers = [random.randrange(patients) for _ in range(LOOKUPS)]
+    by_pn, history = [], []
+    for i in numbers:
+        started = time.perf_counter()
+        PatientService.get_patient_by_pn(db, f"{i:010d}")
+        by_pn.append((time.perf_counter() - started) * 1000)
+        lookup = PatientLookup(personal_number=f"{i:010d}", name=f"Jmeno{i % 5000}", surname=f"Prijmeni{i % 20000}")
+        started = time.perf_counter()
+        db.scalars(build_patient_statement(lookup)).first()
+        history.append((time.perf_counter() - started) * 1000)
+        db.expunge_all()
+    print(f"{label:>15}: get_patient_by_pn median {statistics.median(by_pn):8.3f} ms, "
+          f"history lookup median {statistics.median(history):8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        started = time.perf_counter()
+        seed(engine, args.patients)
+        print(f"seeded {args.patients} patients in {time.perf_counter() - started:.1f} s")
+        db = sessionmaker(bind=engine)()
+
+        measure(db, args.patients, "without indexes")
+        for index in Patient.__table__.indexes:
+            index.create(engine)
+        measure(db, args.patients, "with indexes")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Benchmark patient search over a million patients with and without the search indexes.
+
+Run from the backend directory: python -m benchmarks.bench_patient_search [--patients 1000000]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Patient
+from app.schemas.patient import PatientSearch
+from app.services.patient_service import PatientService
+
+RUNS = 20
+CHUNK = 50_000
+NAMES = ["Jiří", "Jan", "Petr", "Josef", "Pavel", "Tomáš", "Jana", "Marie", "Eva", "Hana", "Lucie", "Věra",
+         "Zdeněk", "Michal", "Martin", "Kateřina", "Lenka", "Alena", "Šárka", "Tereza"]
+SURNAMES = ["Novák", "Svoboda", "Novotný", "Dvořák", "Černý", "Procházka", "Kučera", "Veselý", "Horák",
+            "Němec", "Marek", "Pokorný", "Pospíšil", "Hájek", "Jelínek", "Král", "Růžička", "Beneš", "Fiala",
+            "Sedláček", "Doležal", "Zeman", "Kolář", "Navrátil", "Čermák", "Vaněk", "Urban", "Blažek", "Kříž",
+            "Kovář"]
+SEARCHES = [
+    ("surname", {"surname": "novak"}),
+    ("surname + year", {"surname": "Novák", "birth_year": 1970}),
+    ("surname + name", {"surname": "dvor", "name": "sar"}),
+    ("name", {"name": "zdenek"}),
+    ("pn prefix", {"personal_number": "700501"}),
+    ("date of birth", {"date_of_birth": date(1970, 5, 1)}),
+    ("phone", {"phone_number": "+420 600 123 456"}),
+]
+
+
+def seed(engine, patients):
+    Patient.__table__.create(engine)
+    for index in Patient.__table__.indexes:
+        index.drop(engine)
+    random.seed(0)
+    epoch = date(1930, 1, 1)
+    born_on = {}
+    with engine.begin() as connection:
+        for start in range(0, patients, CHUNK):
+            rows = []
+            for i in range(start, min(start + CHUNK, patients)):
+                name, surname = random.choice(NAMES), random.choice(SURNAMES)
+                born = epoch + timedelta(days=random.randrange(90 * 365))
+                born_on[born] = born_on.get(born, 0) + 1
+                phone = f"+420 {600_000_000 + i:,}".replace(",", " ")
+                rows.append({"name": name, "surname": surname, "date_of_birth": born, "phone_number": phone,
+                             # Starts with the birth date, like a real personal number.
+                             "personal_number": f"{born:%y%m%d}{born_on[born]:04d}",
+                             **PatientService.search_columns(name, surname, phone)})
+            connection.execute(insert(Patient), rows)
+
+
+def measure(db, label):
+    print(label)
+    for name, filters in SEARCHES:
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            found = PatientService.search_patients(db, PatientSearch(**filters))
+            timings.append((time.perf_counter() - started) * 1000)
+            db.expunge_all()
+        print(f"{name:>15}: {len(found):3d} hits, median {statistics.median(timings):9.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        started = time.perf_counter()
+        seed(engine, args.patients)
+        print(f"seeded {args.patients} patients in {time.perf_counter() - started:.1f} s")
+        db = sessionmaker(bind=engine)()
+
+        measure(db, "without indexes")
+        started = time.perf_counter()
+        for index in Patient.__table__.indexes:
+            index.create(engine)
+        print(f"indexes built in {time.perf_counter() - started:.1f} s")
+        measure(db, "with indexes")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Benchmark storing analyzer results one by one against the bulk ingestion.
+
+Run from the backend directory: python -m benchmarks.bench_test_ingest [--results 10000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.models import Doctor, MedicalTestType, Patient, Request, Test
+from app.schemas.test import TestCreate
+from app.services.test_service import TestService
+
+TEST_TYPES = 50
+REQUESTS = 1000
+
+
+def seed(engine):
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Doctor), [{"name": "Jan", "surname": "Novak"}])
+        connection.execute(insert(Patient), [{"name": "Eva", "surname": "Dvorakova", "personal_number": "9001011234"}])
+        connection.execute(insert(MedicalTestType), [{"name": f"Test {i}"} for i in range(TEST_TYPES)])
+        connection.execute(insert(Request), [{"patient_id": 1, "doctor_id": 1} for _ in range(REQUESTS)])
+
+
+def analyzer_results(count):
+    random.seed(0)
+    start = datetime(2025, 3, 1, tzinfo=timezone.utc)
+    return [{"test_date": (start + timedelta(seconds=i)).isoformat(), "results": f"{random.uniform(0, 100):.1f} mg/l",
+             "state": "final", "test_type_id": random.randint(1, TEST_TYPES), "request_id": random.randint(1, REQUESTS)}
+            for i in range(count)]
+
+
+def timed(session_factory, store):
+    db = session_factory()
+    started = time.perf_counter()
+    store(db)
+    db.commit()
+    elapsed = time.perf_counter() - started
+    db.execute(delete(Test))
+    db.commit()
+    db.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{os.path.join(directory, 'bench.db')}")
+        seed(engine)
+        session_factory = sessionmaker(bind=engine)
+        items = analyzer_results(args.results)
+
+        def one_by_one(db):
+            for item in items:
+                TestService.create_test(db, TestCreate.model_validate(item))
+
+        single_s = timed(session_factory, one_by_one)
+        bulk_s = timed(session_factory, lambda db: TestService.ingest_tests(db, items))
+        print(f"{args.results} results: one by one {single_s:.2f} s ({args.results / single_s:,.0f}/s), "
+              f"bulk {bulk_s:.2f} s ({args.results / bulk_s:,.0f}/s)")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
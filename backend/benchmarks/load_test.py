@@ -0,0 +1,224 @@
+"""Concurrent HTTP load test for the read endpoints.
+
+Start the API (e.g. `uvicorn app.main:app --port 8000`) against the target database, then run
+from the backend directory:
+
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --concurrency 200 --requests 2000
+
+Run it once on a build with sync endpoints and once with the async ones to compare throughput
+and tail latency under the same concurrency.
+
+Without a remote database, `--simulate-db-latency-ms` compares both in one run: it serves the
+async appointment and history endpoints next to sync copies of them (under /sync) from a
+temporary SQLite file whose connections sleep before every statement, like a round trip to a
+database server. Both engines get `--pool-size` connections; the sync endpoints are also capped
+by Starlette's threadpool of 40 threads. Keep the pool at least as large as the concurrency: a
+sync request holds its connection until its dependency teardown gets a thread, so a smaller
+pool can starve the threadpool until checkouts time out.
+
+    python -m benchmarks.load_test --simulate-db-latency-ms 20 --concurrency 100 --requests 1000
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import socket
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import httpx
+import uvicorn
+from fastapi import APIRouter, FastAPI, Response
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app import dependencies
+from app.api.appointments import router as appointments_router
+from app.api.history import router as history_router
+from app.core.pagination import PageLimit, with_next_cursor
+from app.dependencies import DbSession
+from app.models import Appointment, Doctor, MedicalTestType, Patient, Request, Test
+from app.schemas.appointment import AppointmentOut
+from app.schemas.history import PatientHistoryResponse, PatientLookup
+from app.services import history_service
+from app.services.appointment_service import AppointmentService
+
+ENDPOINTS = {
+    "terms": ("GET", "/api/terms/list-all-terms", None),
+    "appointments": ("GET", "/appointments/", None),
+    "history": ("POST", "/history/patient", {"personal_number": "9001011234", "name": "Eva", "surname": "Dvorakova"}),
+}
+
+SIMULATED = ("appointments", "history")
+
+
+class SlowCursor(sqlite3.Cursor):
+    """Sleeps before every statement; the sleep releases the GIL like a blocking network read."""
+    latency = 0.0
+
+    def execute(self, *args):
+        time.sleep(self.latency)
+        return super().execute(*args)
+
+    def executemany(self, *args):
+        time.sleep(self.latency)
+        return super().executemany(*args)
+
+
+class SlowConnection(sqlite3.Connection):
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+
+sync_router = APIRouter()
+
+
+@sync_router.get("/appointments/", response_model=list[AppointmentOut])
+def list_appointments_sync(response: Response, db: DbSession, cursor: Optional[str] = None, limit: PageLimit = 100):
+    return with_next_cursor(response, AppointmentService.get_appointments(db=db, cursor=cursor, limit=limit))
+
+
+@sync_router.post("/history/patient", response_model=PatientHistoryResponse)
+def patient_history_sync(lookup_data: PatientLookup, db: DbSession):
+    return history_service.get_patient_history(db=db, lookup_data=lookup_data)
+
+
+def seed(engine):
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    with sessionmaker(bind=engine)() as db:
+        doctor = Doctor(name="Jan", surname="Novak")
+        patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+        test_type = MedicalTestType(name="blood")
+        db.add_all([doctor, patient, test_type])
+        db.flush()
+        appointments = [
+            Appointment(event_type="ambulance", date_from=start + timedelta(hours=i),
+                        date_to=start + timedelta(hours=i, minutes=30), doctor_id=doctor.id)
+            for i in range(200)
+        ]
+        db.add_all(appointments)
+        db.flush()
+        requests = [Request(patient_id=patient.id, doctor_id=doctor.id, appointment_id=appointments[i].id)
+                    for i in range(20)]
+        db.add_all(requests)
+        db.flush()
+        db.add_all([Test(test_date=start, results="ok", state="done", test_type_id=test_type.id,
+                         request_id=request.id) for request in requests])
+        db.commit()
+
+
+def serve_simulation(path, pool_size, latency_ms, port):
+    """Serves the async endpoints and their sync copies from `path`; runs in its own process."""
+    url = f"sqlite:///{path}"
+    pool = {"pool_size": pool_size, "max_overflow": 0, "connect_args": {"factory": SlowConnection}}
+    engine = create_engine(url, **pool)
+    SQLModel.metadata.create_all(engine)
+    seed(engine)
+    SlowCursor.latency = latency_ms / 1000
+    async_engine = create_async_engine(url.replace("sqlite://", "sqlite+aiosqlite://"), **pool)
+    dependencies.SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+    dependencies.AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False,
+                                                        expire_on_commit=False)
+
+    application = FastAPI()
+    application.include_router(appointments_router, prefix="/appointments")
+    application.include_router(history_router, prefix="/history")
+    application.include_router(sync_router, prefix="/sync")
+    uvicorn.run(application, port=port, log_level="warning", backlog=4096, timeout_keep_alive=60)
+
+
+def start_simulation(path, pool_size, latency_ms):
+    """Starts `serve_simulation` in a child process, so the client does not share its GIL; returns it and the URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = multiprocessing.Process(target=serve_simulation, args=(path, pool_size, latency_ms, port), daemon=True)
+    server.start()
+    url = f"http://127.0.0.1:{port}"
+    while True:
+        try:
+            httpx.get(url)
+            return server, url
+        except httpx.TransportError:
+            if not server.is_alive():
+                raise RuntimeError("The simulated server did not start")
+            time.sleep(0.1)
+
+
+async def worker(client, method, path, body, queue, latencies, statuses):
+    while True:
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        started = time.perf_counter()
+        try:
+            status = (await client.request(method, path, json=body)).status_code
+        except httpx.TransportError as error:
+            status = type(error).__name__
+        latencies.append((time.perf_counter() - started) * 1000)
+        statuses[status] = statuses.get(status, 0) + 1
+
+
+async def run(url, endpoint, concurrency, requests, prefix="", label=""):
+    method, path, body = ENDPOINTS[endpoint]
+    path = prefix + path
+    queue = asyncio.Queue()
+    for _ in range(requests):
+        queue.put_nowait(None)
+    latencies, statuses = [], {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        # Warm up: open every HTTP connection (and the server's database connections) before timing.
+        await asyncio.gather(*(client.request(method, path, json=body) for _ in range(concurrency)))
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            worker(client, method, path, body, queue, latencies, statuses) for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+    latencies.sort()
+    print(
+        f"{endpoint + label:>19}: {requests} requests, concurrency {concurrency}, {requests / elapsed:8.1f} req/s, "
+        f"p50 {statistics.median(latencies):7.1f} ms, p99 {latencies[int(len(latencies) * 0.99) - 1]:7.1f} ms, "
+        f"statuses {statuses}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--endpoint", choices=[*ENDPOINTS, "all"], default="all")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--simulate-db-latency-ms", type=float, default=None)
+    parser.add_argument("--pool-size", type=int, default=None, help="defaults to --concurrency")
+    args = parser.parse_args()
+    if args.simulate_db_latency_ms is None:
+        for endpoint in ENDPOINTS if args.endpoint == "all" else [args.endpoint]:
+            asyncio.run(run(args.url, endpoint, args.concurrency, args.requests))
+        return
+    if args.endpoint not in (*SIMULATED, "all"):
+        parser.error(f"--simulate-db-latency-ms supports the {' and '.join(SIMULATED)} endpoints")
+
+    pool_size = args.pool_size or args.concurrency
+    with tempfile.TemporaryDirectory() as directory:
+        server, url = start_simulation(os.path.join(directory, "load_test.db"), pool_size, args.simulate_db_latency_ms)
+        print(f"Simulated database latency {args.simulate_db_latency_ms} ms per statement, "
+              f"pool of {pool_size} connections")
+        try:
+            for endpoint in SIMULATED if args.endpoint == "all" else [args.endpoint]:
+                for prefix, label in (("/sync", " (sync)"), ("", " (async)")):
+                    asyncio.run(run(url, endpoint, args.concurrency, args.requests, prefix, label))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
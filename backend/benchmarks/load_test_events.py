@@ -0,0 +1,111 @@
+"""Load test for the request event stream: many SSE subscribers, one writer.
+
+Run it only against a throwaway database. Every event creates and approves a real request, so
+patient notifications and history rows are written for it; the copies are deleted directly in
+the database (--database-url, by default $DATABASE_URL) when the run ends, but the
+notifications and history rows stay.
+
+Start the API (e.g. `uvicorn app.main:app --port 8000`, a single worker, since every worker
+streams only its own events) against a database with at least one request, then run from the
+backend directory:
+
+    DATABASE_URL=... python -m benchmarks.load_test_events --url http://127.0.0.1:8000 --request-id 1 --subscribers 500
+
+State changes only move forward, so every event creates a pending copy of the request (without
+its appointment) and approves it; each approval is awaited on every subscriber before the next
+one is made. Latency is measured from sending the PUT to the event arriving at a subscriber.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+import httpx
+from sqlalchemy import create_engine, delete
+
+from app.models import Request
+
+COPIED_FIELDS = ("description", "patient_id", "doctor_id", "nurse_id", "request_type_id")
+
+
+async def subscriber(client, arrivals, received, subscribed):
+    async with client.stream("GET", "/events/requests") as response:
+        async for line in response.aiter_lines():
+            if line == ": subscribed":
+                subscribed.release()
+            elif line.startswith("data: "):
+                if "previous_state" in json.loads(line[6:]):
+                    arrivals.append(time.perf_counter())
+                    received.release()
+
+
+def delete_copies(database_url, request_ids):
+    """Removes the requests the run created; the API has no endpoint for deleting requests."""
+    engine = create_engine(database_url)
+    with engine.begin() as connection:
+        connection.execute(delete(Request).where(Request.id.in_(request_ids)))
+    engine.dispose()
+
+
+async def run(url, request_id, subscribers, events, copies):
+    limits = httpx.Limits(max_connections=subscribers + 10, max_keepalive_connections=subscribers + 10)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=None) as client:
+        subscribed, received = asyncio.Semaphore(0), asyncio.Semaphore(0)
+        arrivals = [[] for _ in range(subscribers)]
+        started = time.perf_counter()
+        tasks = [asyncio.create_task(subscriber(client, arrivals[i], received, subscribed)) for i in range(subscribers)]
+        for _ in range(subscribers):
+            await subscribed.acquire()
+        connect_time = time.perf_counter() - started
+
+        template = (await client.get(f"/requests/{request_id}")).raise_for_status().json()
+        copy = {field: template[field] for field in COPIED_FIELDS}
+        sent, lost = [], 0
+        for _ in range(events):
+            created = (await client.post("/requests/", json=copy)).raise_for_status().json()
+            copies.append(created["id"])
+            sent.append(time.perf_counter())
+            response = await client.put(f"/requests/{created['id']}", json={"state": "approved"})
+            response.raise_for_status()
+            for _ in range(subscribers):
+                try:
+                    await asyncio.wait_for(received.acquire(), timeout=10)
+                except asyncio.TimeoutError:
+                    lost += 1
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = sorted((arrival - sent[index]) * 1000 for times in arrivals for index, arrival in enumerate(times))
+    print(
+        f"{subscribers} subscribers connected in {connect_time:.2f} s; {events} events, "
+        f"{len(latencies)}/{subscribers * events} delivered ({lost} lost), "
+        f"p50 {statistics.median(latencies):.1f} ms, p95 {latencies[int(len(latencies) * 0.95) - 1]:.1f} ms, "
+        f"max {latencies[-1]:.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--request-id", type=int, required=True)
+    parser.add_argument("--subscribers", type=int, default=500)
+    parser.add_argument("--events", type=int, default=20)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"),
+                        help="the API's database, where the created copies are deleted at the end")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required to delete the created requests")
+    copies = []
+    try:
+        asyncio.run(run(args.url, args.request_id, args.subscribers, args.events, copies))
+    finally:
+        if copies:
+            delete_copies(args.database_url, copies)
+            print(f"deleted {len(copies)} request copies")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+
+# app.core.config requires DATABASE_URL; tests always run against in-memory SQLite.
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+import pytest  # noqa: E402
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+from sqlmodel import SQLModel  # noqa: E402
+
+import app.models  # noqa: E402,F401 - registers all tables on SQLModel.metadata
+from app import dependencies  # noqa: E402
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def statements(engine):
+    """Collects every SQL statement sent to the test engine."""
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def sqlite_file(tmp_path):
+    """A SQLite file with all tables, shared by the sync and async fixtures below."""
+    path = tmp_path / "test.db"
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    engine.dispose()
+    return path
+
+
+@pytest.fixture
+def file_db(sqlite_file):
+    engine = create_engine(f"sqlite:///{sqlite_file}")
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def async_session_factory(sqlite_file):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{sqlite_file}")
+    yield async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
+    engine.sync_engine.dispose()
+
+
+@pytest.fixture
+def api_client(engine, monkeypatch):
+    """Builds a TestClient for routers mounted at their prefixes, e.g. `api_client({"/requests": router})`.
+
+    Requests go through the real get_db unit of work on the test engine, so endpoints commit
+    and roll back as in production. `async_sessions` serves get_async_db for `async def` endpoints.
+    """
+    monkeypatch.setattr(
+        dependencies, "SessionLocal",
+        sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine),
+    )
+
+    def build(routers: dict, async_sessions=None) -> TestClient:
+        if async_sessions is not None:
+            monkeypatch.setattr(dependencies, "AsyncSessionLocal", async_sessions)
+        application = FastAPI()
+        for prefix, router in routers.items():
+            application.include_router(router, prefix=prefix)
+        return TestClient(application)
+
+    return build
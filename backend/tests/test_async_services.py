@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Appointment, Doctor, Patient, Request, RequestType, MedicalTestType
+from app.models import Test as LabTest
+from app.schemas.history import PatientLookup
+from app.services import history_service
+from app.services.appointment_service import AppointmentService
+from app.services.list_all_terms_service import TermService
+
+START = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+
+
+def run(async_session_factory, call):
+    async def main():
+        async with async_session_factory() as db:
+            return await call(db)
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def seeded(file_db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+    request_type = RequestType(name="checkup", description="desc", length=15)
+    test_type = MedicalTestType(name="blood")
+    file_db.add_all([doctor, patient, request_type, test_type])
+    file_db.flush()
+    for i in range(3):
+        appointment = Appointment(event_type="ambulance", date_from=START + timedelta(days=i),
+                                  date_to=START + timedelta(days=i, hours=1), doctor_id=doctor.id)
+        file_db.add(appointment)
+        file_db.flush()
+        request = Request(patient_id=patient.id, doctor_id=doctor.id, nurse_id=None,
+                          appointment_id=appointment.id, request_type_id=request_type.id)
+        file_db.add(request)
+        file_db.flush()
+        file_db.add(LabTest(id=None, test_date=START, results="ok", state="done",
+                            test_type_id=test_type.id, request_id=request.id))
+    file_db.commit()
+    return file_db
+
+
+def test_get_all_terms_async_matches_sync(seeded, async_session_factory):
+    terms = run(async_session_factory, lambda db: TermService.get_all_terms_async(db, limit=2))
+
+    assert [term["kalendar_id"] for term in terms] == [1, 2]
+    assert terms[0]["zadanky"][0]["typ_zadanky"]["nazev"] == "checkup"
+    assert terms == TermService.get_all_terms(seeded, limit=2)
+
+
+def test_get_patient_history_async(seeded, async_session_factory):
+    lookup = PatientLookup(personal_number="9001011234", name="Eva", surname="Dvorakova")
+
+    history = run(async_session_factory, lambda db: history_service.get_patient_history_async(db, lookup))
+
+    assert len(history.requests) == 3
+    assert len(history.appointments) == 3
+    assert len(history.tests) == 3
+
+
+def test_get_patient_history_async_not_found(seeded, async_session_factory):
+    lookup = PatientLookup(personal_number="0000000000", name="Eva", surname="Dvorakova")
+
+    with pytest.raises(HTTPException) as exc:
+        run(async_session_factory, lambda db: history_service.get_patient_history_async(db, lookup))
+
+    assert exc.value.status_code == 404
+
+
+def test_get_appointments_async(seeded, async_session_factory):
+    first = run(async_session_factory, lambda db: AppointmentService.get_appointments_async(db, limit=2))
+    rest = run(async_session_factory,
+               lambda db: AppointmentService.get_appointments_async(db, cursor=first.next_cursor, limit=2))
+
+    assert [appointment.id for appointment in first.items + rest.items] == [1, 2, 3]
+    assert rest.next_cursor is None
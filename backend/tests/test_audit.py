@@ -0,0 +1,124 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import sessionmaker
+
+from app.core import audit
+from app.core.audit import audit_on_commit
+from app.core.batch_writer import BatchWriter
+from app.models import Appointment, AppointmentHistory, Doctor, Nurse, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+from app.services.request_service import RequestService
+
+
+def row(number):
+    return {"change_type": "request_booked", "description": f"row {number}",
+            "created_at": datetime(2025, 1, 6, tzinfo=timezone.utc)}
+
+
+def count(db):
+    return db.scalar(select(func.count()).select_from(AppointmentHistory))
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def writer(engine):
+    writer = BatchWriter(AppointmentHistory, sessionmaker(bind=engine), batch_size=10, flush_interval=60, max_buffer=25)
+    yield writer
+    writer.stop()
+
+
+def test_full_batch_is_flushed_without_waiting(db, writer):
+    writer.start()
+    writer.record([row(i) for i in range(9)])
+    time.sleep(0.05)
+    assert count(db) == 0
+
+    writer.record([row(9)])
+
+    wait_until(lambda: writer.written == 10)
+    assert count(db) == 10
+
+
+def test_interval_flush_and_stop_flush(db, engine):
+    writer = BatchWriter(AppointmentHistory, sessionmaker(bind=engine), batch_size=100, flush_interval=0.02, max_buffer=100)
+    writer.start()
+    writer.record([row(0)])
+    wait_until(lambda: writer.written == 1)
+
+    writer.stop()
+    writer.record([row(1), row(2)])
+    writer.stop()
+
+    assert count(db) == 3
+
+
+def test_failed_flush_keeps_newest_rows(db, writer, engine):
+    def broken_session():
+        raise ConnectionError("database down")
+
+    writer.session_factory = broken_session
+    writer.record([row(i) for i in range(30)])
+
+    assert writer.flush() == 0
+    assert writer.pending == 25
+    assert writer.dropped == 5
+
+    writer.session_factory = sessionmaker(bind=engine)
+    assert writer.flush() == 25
+    assert [r.description for r in db.scalars(select(AppointmentHistory).order_by(AppointmentHistory.id))][0] == "row 5"
+
+
+def test_rows_are_recorded_on_commit_only(db, writer, monkeypatch):
+    monkeypatch.setattr(audit, "audit_writer", writer)
+
+    db.add(Doctor(name="Jan", surname="Novak"))
+    db.flush()
+    audit_on_commit(db, [row(0)])
+    db.rollback()
+    audit_on_commit(db, [row(1)])
+    assert writer.pending == 0
+    db.commit()
+
+    assert writer.pending == 1
+
+
+def test_booking_and_state_change_are_audited(db, writer, monkeypatch):
+    monkeypatch.setattr(audit, "audit_writer", writer)
+    doctor = Doctor(name="Jan", surname="Novak")
+    request_type = RequestType(name="checkup", description="desc", length=15)
+    db.add_all([doctor, request_type])
+    db.flush()
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    appointment = Appointment(event_type="ambulance", date_from=start, date_to=start + timedelta(hours=1),
+                              doctor_id=doctor.id)
+    db.add_all([appointment, Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id)])
+    db.commit()
+
+    request = BookTermService.book_term(db, BookTermBase(
+        pacient_jmeno="Eva", pacient_prijmeni="Dvorakova", pacient_rodne_cislo="9001011234",
+        pacient_telefon="123", pacient_poznamka="", doktor_id=doctor.id, kalendar_id=appointment.id,
+        typ_zadanky_id=request_type.id
+    ))
+    db.commit()
+    RequestService.update_request_status(db, request.id, "cancelled")
+    db.commit()
+    writer.flush()
+
+    history = db.scalars(select(AppointmentHistory).order_by(AppointmentHistory.id)).all()
+    assert [(h.change_type, h.description) for h in history] == [
+        ("request_booked", f"Request {request.id} booked for appointment {appointment.id}"),
+        ("request_cancelled", f"Request {request.id}: pending -> cancelled"),
+    ]
+    assert {(h.patient_id, h.doctor_id, h.appointment_id) for h in history} == {
+        (request.patient_id, doctor.id, appointment.id)
+    }
@@ -0,0 +1,146 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError
+
+from app.models import Appointment, Doctor, Nurse, Patient, Request, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+
+
+@pytest.fixture
+def calendar(db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    db.add(doctor)
+    db.flush()
+    nurse = Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id)
+    appointment = Appointment(
+        event_type="vaccination",
+        date_from=datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc),
+        date_to=datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc),
+        doctor_id=doctor.id,
+    )
+    request_type = RequestType(name="vaccination", description="desc", length=15)
+    db.add_all([nurse, appointment, request_type])
+    db.commit()
+    return {"doctor_id": doctor.id, "appointment_id": appointment.id, "request_type_id": request_type.id}
+
+
+def booking(calendar, personal_number="9001011234", **overrides):
+    data = {
+        "kalendar_id": calendar["appointment_id"],
+        "doktor_id": calendar["doctor_id"],
+        "pacient_jmeno": "Eva",
+        "pacient_prijmeni": "Dvorakova",
+        "pacient_telefon": "777123456",
+        "pacient_rodne_cislo": personal_number,
+        "pacient_poznamka": "first dose",
+        "typ_zadanky_id": calendar["request_type_id"],
+    }
+    data.update(overrides)
+    return BookTermBase.model_validate(data)
+
+
+def book(db, booking):
+    """Books through the service and commits, as the per-request unit of work does."""
+    created = BookTermService.book_term(db, booking)
+    db.commit()
+    return created
+
+
+def test_book_term_creates_patient_and_request_in_one_transaction(db, calendar, statements):
+    statements.clear()
+
+    BookTermService.book_term(db, booking(calendar))
+    db.commit()
+
+    writes = [s for s in statements if not s.lstrip().upper().startswith("SELECT")]
+    assert len(statements) == 3
+    assert len(writes) == 2
+    assert db.query(Patient).count() == 1
+    assert db.query(Request).one().nurse_id is not None
+
+
+def test_book_term_reuses_existing_patient(db, calendar):
+    book(db, booking(calendar))
+    second_appointment = Appointment(
+        event_type="vaccination",
+        date_from=datetime(2025, 1, 7, 8, 0, tzinfo=timezone.utc),
+        date_to=datetime(2025, 1, 7, 9, 0, tzinfo=timezone.utc),
+        doctor_id=calendar["doctor_id"],
+    )
+    db.add(second_appointment)
+    db.commit()
+
+    book(db, booking(calendar, kalendar_id=second_appointment.id, pacient_jmeno="Other"))
+
+    assert db.query(Patient).count() == 1
+    assert db.query(Patient).one().name == "Eva"
+    assert db.query(Request).count() == 2
+
+
+def test_book_term_rejects_duplicate_active_request(db, calendar):
+    book(db, booking(calendar))
+
+    with pytest.raises(HTTPException) as exc:
+        book(db, booking(calendar))
+    db.rollback()
+
+    assert exc.value.status_code == 409
+    assert db.query(Request).count() == 1
+
+
+def test_book_term_reraises_other_integrity_errors(db, calendar, monkeypatch):
+    flush = db.flush
+
+    def fail(*args, **kwargs):
+        if any(isinstance(obj, Request) for obj in db.new):
+            raise IntegrityError("INSERT INTO request", {}, sqlite3.IntegrityError("FOREIGN KEY constraint failed"))
+        flush(*args, **kwargs)
+
+    monkeypatch.setattr(db, "flush", fail)
+
+    with pytest.raises(IntegrityError):
+        BookTermService.book_term(db, booking(calendar))
+
+
+def test_book_term_allows_rebooking_after_decline(db, calendar):
+    book(db, booking(calendar))
+    db.query(Request).one().state = "declined"
+    db.commit()
+
+    book(db, booking(calendar))
+
+    assert db.query(Request).count() == 2
+
+
+def test_book_term_unknown_request_type_writes_nothing(db, calendar):
+    with pytest.raises(HTTPException) as exc:
+        book(db, booking(calendar, typ_zadanky_id=999))
+
+    assert exc.value.status_code == 404
+    assert db.query(Patient).count() == 0
+
+
+def test_book_terms_reports_per_item_results(db, calendar, statements):
+    book(db, booking(calendar, personal_number="8001011234"))
+    batch = [
+        booking(calendar, personal_number="9001011234"),
+        booking(calendar, personal_number="9001011234"),
+        booking(calendar, personal_number="8001011234"),
+        booking(calendar, personal_number="7001011234", typ_zadanky_id=999),
+        booking(calendar, personal_number="6001011234"),
+    ]
+    statements.clear()
+
+    results = BookTermService.book_terms(db, batch)
+
+    assert [result["status"] for result in results] == ["created", "error", "error", "error", "created"]
+    assert results[1]["detail"] == "Request already exists"
+    assert results[2]["detail"] == "Request already exists"
+    assert results[3]["detail"] == "Request type not found"
+    assert len(statements) == 5
+    assert db.query(Patient).count() == 3
+    assert db.query(Request).count() == 3
@@ -0,0 +1,251 @@
+import asyncio
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import redis
+from redis.backoff import NoBackoff
+from redis.retry import Retry
+
+from app.core import cache as cache_module
+from app.core.cache import RedisCache, TTLCache
+from app.models import Appointment, Doctor, Nurse, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """The subset of the Redis protocol (RESP2) the cache uses: GET, SET PX, DEL, SADD, SMEMBERS, PEXPIRE,
+    MULTI/EXEC, PUBLISH and SUBSCRIBE."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.data = {}
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"redis://127.0.0.1:{self.server_address[1]}/0"
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self.write_lock = threading.Lock()
+
+    def send(self, reply):
+        with self.write_lock:
+            self.wfile.write(encode(reply))
+            self.wfile.flush()
+
+    def read_command(self):
+        header = self.rfile.readline()
+        if not header:
+            return None
+        parts = []
+        for _ in range(int(header[1:])):
+            length = int(self.rfile.readline()[1:])
+            parts.append(self.rfile.read(length + 2)[:-2].decode())
+        return parts
+
+    def handle(self):
+        server = self.server
+        queued = None
+        while (command := self.read_command()) is not None:
+            name, args = command[0].upper(), command[1:]
+            with server.lock:
+                if name == "MULTI":
+                    queued, reply = [], Status("OK")
+                elif name == "EXEC":
+                    reply, queued = [self.execute(*queued_command) for queued_command in queued], None
+                elif queued is not None:
+                    queued.append((name, args))
+                    reply = Status("QUEUED")
+                elif name == "SUBSCRIBE":
+                    for channel in args:
+                        server.subscribers.setdefault(channel, []).append(self)
+                        self.send(["subscribe", channel, 1])
+                    continue
+                elif name == "UNSUBSCRIBE":
+                    for channel in args or list(server.subscribers):
+                        if self in server.subscribers.get(channel, []):
+                            server.subscribers[channel].remove(self)
+                        self.send(["unsubscribe", channel, 0])
+                    continue
+                else:
+                    reply = self.execute(name, args)
+            self.send(reply)
+
+    def execute(self, name, args):
+        server = self.server
+        now = time.monotonic()
+        server.data = {k: v for k, v in server.data.items() if v[1] is None or v[1] > now}
+        if name == "GET":
+            return server.data.get(args[0], (None, None))[0]
+        if name == "SET":
+            expires = now + int(args[3]) / 1000 if len(args) > 3 and args[2].upper() == "PX" else None
+            server.data[args[0]] = (args[1], expires)
+            return Status("OK")
+        if name in ("DEL", "UNLINK"):
+            return sum(server.data.pop(key, None) is not None for key in args)
+        if name == "SADD":
+            members, expires = server.data.get(args[0], (set(), None))
+            added = set(args[1:]) - members
+            server.data[args[0]] = (members | added, expires)
+            return len(added)
+        if name == "SMEMBERS":
+            return sorted(server.data.get(args[0], (set(), None))[0])
+        if name == "PEXPIRE":
+            if args[0] not in server.data:
+                return 0
+            server.data[args[0]] = (server.data[args[0]][0], now + int(args[1]) / 1000)
+            return 1
+        if name == "PUBLISH":
+            receivers = server.subscribers.get(args[0], [])
+            for handler in receivers:
+                handler.send(["message", args[0], args[1]])
+            return len(receivers)
+        if name == "PING":
+            return Status("PONG")
+        return Status("OK")  # CLIENT SETINFO and other connection setup commands
+
+
+class Status(str):
+    pass
+
+
+def encode(reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, Status):
+        return f"+{reply}\r\n".encode()
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if isinstance(reply, list):
+        return f"*{len(reply)}\r\n".encode() + b"".join(encode(item) for item in reply)
+    data = str(reply).encode()
+    return f"${len(data)}\r\n".encode() + data + b"\r\n"
+
+
+@pytest.fixture
+def redis_server():
+    server = FakeRedisServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def workers(redis_server):
+    """Two worker processes' caches sharing one server."""
+    caches = [RedisCache(redis.Redis.from_url(redis_server.url, protocol=2), ttl=60, maxsize=100, local_ttl=60)
+              for _ in range(2)]
+    for worker in caches:
+        worker.start()
+    yield caches
+    for worker in caches:
+        worker.stop()
+
+
+def wait_until(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_workers_share_entries_through_the_server(workers):
+    first, second = workers
+    calls = []
+    first.get_or_load(("doctors", 0, 100), lambda: calls.append(1) or [{"id": 1}])
+
+    entry = second.get_or_load(("doctors", 0, 100), lambda: calls.append(2) or [])
+
+    assert entry.value == [{"id": 1}]
+    assert calls == [1]
+
+
+def test_invalidation_reaches_other_workers(workers, redis_server):
+    first, second = workers
+    first.set(("terms", "page"), ["old"])
+    second.get(("terms", "page"))
+    first.set(("doctors", 0, 100), ["kept"])
+
+    first.invalidate("terms")
+
+    wait_until(lambda: second.local.stats()["size"] == 0)
+    assert second.get(("terms", "page")) is None
+    assert sorted(redis_server.data) == ["cache:doctors", first.redis_key(("doctors", 0, 100))]
+
+
+def test_keys_hash_their_parts(workers):
+    cache = workers[0]
+
+    assert cache.redis_key(("terms", "a:b", None)) != cache.redis_key(("terms", "a", "b:None"))
+    assert cache.redis_key(("terms", 1)) != cache.redis_key(("terms", "1"))
+    assert cache.redis_key(("terms", "a:b", None)).startswith("cache:terms:")
+
+
+def test_unreachable_server_reads_through():
+    client = redis.Redis(port=1, protocol=2, retry=Retry(NoBackoff(), 0), socket_connect_timeout=0.1)
+    unreachable = RedisCache(client, ttl=60, maxsize=10, local_ttl=5)
+
+    entry = unreachable.get_or_load(("doctors", 0, 100), lambda: ["from database"])
+    unreachable.invalidate("doctors")
+
+    assert entry.value == ["from database"]
+    assert unreachable.stats()["misses"] == 1
+
+
+def test_async_path_uses_the_server(workers):
+    first, second = workers
+    first.set(("terms", "page"), ["cached"])
+
+    async def load():
+        raise AssertionError("should be served from the cache server")
+
+    entry = asyncio.run(second.get_or_load_async(("terms", "page"), load))
+
+    assert entry.value == ["cached"]
+
+
+def test_memory_backend_respects_shorter_ttl():
+    now = [0.0]
+    memory = TTLCache(maxsize=10, ttl=300, clock=lambda: now[0])
+    memory.set(("terms", "page"), [], ttl=30)
+
+    now[0] = 31
+
+    assert memory.get(("terms", "page")) is None
+
+
+def test_booking_invalidates_terms_on_every_worker(db, workers, monkeypatch):
+    first, second = workers
+    monkeypatch.setattr(cache_module, "cache", first)
+    doctor = Doctor(name="Jan", surname="Novak")
+    request_type = RequestType(name="checkup", description="desc", length=15)
+    db.add_all([doctor, request_type])
+    db.flush()
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    appointment = Appointment(event_type="ambulance", date_from=start, date_to=start + timedelta(hours=1),
+                              doctor_id=doctor.id)
+    db.add_all([appointment, Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id)])
+    db.commit()
+    second.set(("terms", None, None, None, None, None, None), {"terms": [], "next_cursor": None})
+
+    BookTermService.book_term(db, BookTermBase(
+        pacient_jmeno="Eva", pacient_prijmeni="Dvorakova", pacient_rodne_cislo="9001011234",
+        pacient_telefon="123", pacient_poznamka="", doktor_id=doctor.id, kalendar_id=appointment.id,
+        typ_zadanky_id=request_type.id
+    ))
+    assert second.local.stats()["size"] == 1
+    db.commit()
+
+    wait_until(lambda: second.local.stats()["size"] == 0)
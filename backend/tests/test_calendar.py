@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Appointment, Doctor, Patient, Request, RequestType
+from app.services.calendar_service import CalendarService
+
+MONDAY = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+
+
+def at(minutes: int) -> datetime:
+    return MONDAY + timedelta(minutes=minutes)
+
+
+def test_compute_free_slots_skips_booked_prefix():
+    windows = [(1, at(0), at(60), 20)]
+
+    slots = CalendarService.compute_free_slots(windows, timedelta(minutes=15))
+
+    assert slots == [(1, at(20), at(35)), (1, at(35), at(50))]
+
+
+def test_compute_free_slots_respects_overlapping_windows():
+    windows = [(1, at(0), at(60), 60), (2, at(30), at(90), 0)]
+
+    slots = CalendarService.compute_free_slots(windows, timedelta(minutes=30))
+
+    assert slots == [(2, at(60), at(90))]
+
+
+def test_compute_free_slots_blocks_window_with_untyped_request():
+    windows = [(1, at(0), at(60), None), (2, at(60), at(90), 0)]
+
+    slots = CalendarService.compute_free_slots(windows, timedelta(minutes=30))
+
+    assert slots == [(2, at(60), at(90))]
+
+
+def test_get_free_slots_ignores_released_requests(db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+    checkup = RequestType(name="checkup", description="desc", length=20)
+    db.add_all([doctor, patient, checkup])
+    db.flush()
+    appointment = Appointment(event_type="ambulance", date_from=at(0), date_to=at(60), doctor_id=doctor.id)
+    db.add(appointment)
+    db.flush()
+    for state in ("pending", "declined"):
+        db.add(Request(patient_id=patient.id, doctor_id=doctor.id, nurse_id=None,
+                       appointment_id=appointment.id, request_type_id=checkup.id, state=state))
+    db.commit()
+
+    availability = CalendarService.get_free_slots(db, doctor.id, checkup.id, at(0), at(24 * 60))
+
+    assert [(slot["date_from"], slot["date_to"]) for slot in availability["free_slots"]] == [
+        (at(20), at(40)),
+        (at(40), at(60)),
+    ]
+
+
+def test_get_free_slots_unknown_request_type(db):
+    with pytest.raises(HTTPException) as exc:
+        CalendarService.get_free_slots(db, 1, 999, at(0), at(60))
+
+    assert exc.value.status_code == 404
@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.database import MeteredAsyncAdaptedQueuePool, MeteredQueuePool, get_pool_metrics
+
+
+def test_metered_pool_records_waits_and_timeouts(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    held = engine.connect()
+
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    held.close()
+    with engine.connect():
+        pass
+
+    pool = engine.pool
+    assert pool.wait_count == 3
+    assert pool.timeouts == 1
+    assert pool.wait_max >= 0.05
+    engine.dispose()
+
+
+def test_get_pool_metrics_reports_pool_class():
+    metrics = get_pool_metrics()
+
+    assert metrics["pool_class"]
+    assert "status" in metrics
+
+
+def test_metered_async_pool_records_waits_and_timeouts(tmp_path):
+    async def run():
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}",
+            poolclass=MeteredAsyncAdaptedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                await engine.connect().start()
+        pool = engine.sync_engine.pool
+        await engine.dispose()
+        return pool
+
+    pool = asyncio.run(run())
+
+    assert pool.wait_count == 2
+    assert pool.timeouts == 1
+    assert pool.wait_max >= 0.05
+
+
+def test_get_pool_metrics_reports_async_pool():
+    metrics = get_pool_metrics()
+
+    assert metrics["async_pool"]["pool_class"]
+    assert "status" in metrics["async_pool"]
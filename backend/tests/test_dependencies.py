@@ -0,0 +1,48 @@
+import pytest
+from fastapi import APIRouter, HTTPException
+from sqlalchemy import event
+
+from app.dependencies import DbSession
+from app.models import Doctor, Nurse, RequestType
+from app.schemas.doctor import DoctorCreate, DoctorOut
+from app.schemas.nurse import NurseCreate
+from app.schemas.request_type import RequestTypeCreate
+from app.services.doctor_service import DoctorService
+from app.services.nurse_service import NurseService
+from app.services.request_type_service import RequestTypeService
+
+
+@pytest.fixture
+def client(api_client):
+    router = APIRouter()
+
+    @router.post("/clinic", response_model=DoctorOut)
+    def create_clinic(db: DbSession, fail: bool = False):
+        doctor = DoctorService.create_doctor(db, DoctorCreate(name="Jan", surname="Novak"))
+        NurseService.create_nurse(db, NurseCreate(name="Marie", surname="Kralova", doctor_id=doctor.id))
+        RequestTypeService.create_request_type(db, RequestTypeCreate(name="checkup", description="desc", length=15))
+        if fail:
+            raise HTTPException(status_code=409, detail="Conflict")
+        return doctor
+
+    return api_client({"": router})
+
+
+def test_unit_of_work_commits_once_without_refresh(client, engine, db, statements):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    response = client.post("/clinic")
+
+    assert response.status_code == 200
+    assert response.json()["id"] == 1
+    assert len(commits) == 1
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert db.query(Doctor).count() == db.query(Nurse).count() == db.query(RequestType).count() == 1
+
+
+def test_unit_of_work_rolls_back_on_error(client, db):
+    response = client.post("/clinic", params={"fail": True})
+
+    assert response.status_code == 409
+    assert db.query(Doctor).count() == db.query(Nurse).count() == db.query(RequestType).count() == 0
@@ -0,0 +1,173 @@
+import asyncio
+import signal
+import socket
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import uvicorn
+from sqlalchemy.orm import sessionmaker
+
+from app import main
+from app.core import events as events_module
+from app.core.batch_writer import BatchWriter
+from app.core.events import EventBroker, format_sse, publish_on_commit, stream_events
+from app.core.medicine_index import MedicineIndex
+from app.models import Appointment, AppointmentHistory, Doctor, Notification, Nurse, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+from app.services.request_service import REQUEST_CREATED, REQUEST_STATE_CHANGED, RequestService
+
+
+def drain(subscription):
+    messages = []
+    while not subscription.queue.empty():
+        messages.append(subscription.queue.get_nowait())
+    return messages
+
+
+def test_publish_fans_out_to_matching_subscribers():
+    async def scenario():
+        broker = EventBroker()
+        everyone = [broker.subscribe() for _ in range(3)]
+        nurse_two = broker.subscribe(lambda data: data["nurse_id"] == 2)
+
+        broker.publish(REQUEST_CREATED, {"id": 1, "nurse_id": 1})
+        broker.publish(REQUEST_CREATED, {"id": 2, "nurse_id": 2})
+        await asyncio.sleep(0)
+
+        assert [[m["data"]["id"] for m in drain(s)] for s in everyone] == [[1, 2]] * 3
+        assert [m["data"]["id"] for m in drain(nurse_two)] == [2]
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_disconnected(monkeypatch):
+    monkeypatch.setattr(events_module, "SUBSCRIBER_QUEUE_SIZE", 2)
+
+    async def scenario():
+        broker = EventBroker()
+        slow = broker.subscribe()
+        for event_id in range(3):
+            broker.publish(REQUEST_CREATED, {"id": event_id})
+        await asyncio.sleep(0)
+
+        assert slow.closed
+        assert drain(slow) == [None]
+
+    asyncio.run(scenario())
+
+
+def test_stream_formats_events_and_unsubscribes(monkeypatch):
+    broker = EventBroker()
+    monkeypatch.setattr(events_module, "broker", broker)
+
+    async def scenario():
+        stream = stream_events(heartbeat=0.01)
+        assert (await anext(stream)).endswith(": subscribed\n\n")
+        assert await anext(stream) == ": keep-alive\n\n"
+        broker.publish(REQUEST_STATE_CHANGED, {"id": 7, "state": "approved"})
+        assert await anext(stream) == 'id: 1\nevent: request.state_changed\ndata: {"id": 7, "state": "approved"}\n\n'
+        broker.close()
+        assert [chunk async for chunk in stream] == []
+
+    asyncio.run(scenario())
+    assert broker.subscriber_count == 0
+
+
+def test_format_sse():
+    assert format_sse({"id": 3, "event": "e", "data": {}}) == "id: 3\nevent: e\ndata: {}\n\n"
+
+
+def seed(db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    request_type = RequestType(name="checkup", description="desc", length=15)
+    db.add_all([doctor, request_type])
+    db.flush()
+    nurse = Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id)
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    appointment = Appointment(event_type="ambulance", date_from=start, date_to=start + timedelta(hours=1),
+                              doctor_id=doctor.id)
+    db.add_all([nurse, appointment])
+    db.commit()
+    return BookTermBase(
+        pacient_jmeno="Eva", pacient_prijmeni="Dvorakova", pacient_rodne_cislo="9001011234",
+        pacient_telefon="123", pacient_poznamka="", doktor_id=doctor.id, kalendar_id=appointment.id,
+        typ_zadanky_id=request_type.id
+    )
+
+
+def test_request_events_are_published_after_commit(db, monkeypatch):
+    published = []
+    broker = EventBroker()
+    monkeypatch.setattr(broker, "publish", lambda event_type, data: published.append((event_type, data)))
+    monkeypatch.setattr(events_module, "broker", broker)
+    booking = seed(db)
+
+    request = BookTermService.book_term(db, booking)
+    assert published == []
+    db.commit()
+    RequestService.update_request_status(db, request.id, "approved")
+    db.commit()
+
+    assert [event_type for event_type, _ in published] == [REQUEST_CREATED, REQUEST_STATE_CHANGED]
+    assert published[0][1]["id"] == request.id
+    assert published[1][1]["state"] == "approved"
+    assert published[1][1]["previous_state"] == "pending"
+
+
+def test_rolled_back_changes_are_not_published(db, monkeypatch):
+    published = []
+    monkeypatch.setattr(events_module.broker, "publish", lambda event_type, data: published.append(event_type))
+    booking = seed(db)
+
+    BookTermService.book_term(db, booking)
+    db.rollback()
+    publish_on_commit(db, "other", {})
+    db.commit()
+
+    assert published == ["other"]
+
+
+def test_exit_signal_ends_streams_so_shutdown_flushes_writers(engine, monkeypatch):
+    """An open stream must not keep uvicorn from reaching the lifespan shutdown that flushes the writers."""
+    writers = [BatchWriter(model, sessionmaker(bind=engine), batch_size=100, flush_interval=60, max_buffer=100)
+               for model in (AppointmentHistory, Notification)]
+    monkeypatch.setattr(main, "audit_writer", writers[0])
+    monkeypatch.setattr(main, "notification_writer", writers[1])
+    monkeypatch.setattr(main, "create_tables", lambda: None)
+    monkeypatch.setattr(main, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(main, "medicine_index", MedicineIndex(refresh_interval=60))
+    # uvicorn re-raises the signal once it has shut down; the test process must survive it.
+    previous = signal.signal(signal.SIGTERM, lambda signum, frame: None)
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    server = uvicorn.Server(uvicorn.Config(main.app, log_level="warning"))
+
+    async def subscriber():
+        while not server.started:
+            await asyncio.sleep(0.01)
+        async with httpx.AsyncClient() as client:
+            url = f"http://127.0.0.1:{listener.getsockname()[1]}/events/requests"
+            async with client.stream("GET", url) as response:
+                lines = response.aiter_lines()
+                while await anext(lines) != ": subscribed":
+                    pass
+                writers[0].record([{"change_type": "request_booked", "description": "booked",
+                                    "created_at": datetime(2025, 1, 6, tzinfo=timezone.utc)}])
+                writers[1].record([{"message": "booked"}])
+                signal.raise_signal(signal.SIGTERM)
+                async for _ in lines:
+                    pass
+
+    async def scenario():
+        stream = asyncio.create_task(subscriber())
+        await asyncio.wait_for(server.serve(sockets=[listener]), timeout=10)
+        await stream
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        signal.signal(signal.SIGTERM, previous)
+        listener.close()
+
+    assert [writer.written for writer in writers] == [1, 1]
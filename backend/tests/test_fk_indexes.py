@@ -0,0 +1,23 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, MetaData, Table
+from sqlmodel import SQLModel
+
+from tools.check_fk_indexes import find_unindexed_foreign_keys
+
+
+def test_every_foreign_key_is_indexed():
+    assert find_unindexed_foreign_keys(SQLModel.metadata) == []
+
+
+def test_reports_foreign_key_without_leading_index():
+    metadata = MetaData()
+    Table("parent", metadata, Column("id", Integer, primary_key=True))
+    Table(
+        "child", metadata,
+        Column("id", Integer, primary_key=True),
+        Column("parent_id", Integer, ForeignKey("parent.id")),
+        Column("other_id", Integer),
+        Index("ix_child_other_parent", "other_id", "parent_id"),
+        Index("ix_child_parent_partial", "parent_id", sqlite_where=Column("other_id").is_(None)),
+    )
+
+    assert find_unindexed_foreign_keys(metadata) == ["child(parent_id) -> parent"]
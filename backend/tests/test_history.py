@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import json
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Appointment, Doctor, Patient, Request, MedicalTestType
+from app.models import Test as LabTest
+from app.api.history import router as history_router
+from app.schemas.history import HistoryCursors, PatientLookup
+from app.services import history_service
+
+START = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+LOOKUP = PatientLookup(personal_number="9001011234", name="Eva", surname="Dvorakova")
+
+
+def seed_chronic_patient(db):
+    """Three requests on two appointments (one of them re-booked after a cancellation), each with ten lab tests."""
+    doctor = Doctor(name="Jan", surname="Novak")
+    patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+    test_type = MedicalTestType(name="blood")
+    db.add_all([doctor, patient, test_type])
+    db.flush()
+    appointments = [
+        Appointment(event_type="ambulance", date_from=START + timedelta(days=i),
+                    date_to=START + timedelta(days=i, hours=1), doctor_id=doctor.id)
+        for i in range(2)
+    ]
+    db.add_all(appointments)
+    db.flush()
+    requests = [
+        Request(patient_id=patient.id, doctor_id=doctor.id, appointment_id=appointments[0].id, state="cancelled"),
+        Request(patient_id=patient.id, doctor_id=doctor.id, appointment_id=appointments[0].id),
+        Request(patient_id=patient.id, doctor_id=doctor.id, appointment_id=appointments[1].id),
+    ]
+    db.add_all(requests)
+    db.flush()
+    db.add_all([LabTest(test_date=START, results="ok", state="done", test_type_id=test_type.id, request_id=request.id)
+                for request in requests for _ in range(10)])
+    db.commit()
+    patient_id = patient.id
+    db.expunge_all()
+    return patient_id
+
+
+@pytest.fixture
+def chronic_patient(db):
+    return seed_chronic_patient(db)
+
+
+def test_history_sections(db, chronic_patient):
+    history = history_service.get_patient_history(db, LOOKUP)
+
+    assert len(history.requests) == 3
+    assert len(history.appointments) == 2
+    assert len(history.tests) == 30
+
+
+def test_history_uses_one_narrow_query_per_section(db, chronic_patient, statements):
+    history_service.get_patient_history(db, LOOKUP)
+
+    assert len(statements) == 4
+    assert not any("JOIN" in statement.upper() for statement in statements)
+
+
+def test_history_rows_are_not_multiplied(db, chronic_patient):
+    requests = db.scalars(history_service.build_requests_statement(chronic_patient)).all()
+    appointment_ids = {request.appointment_id for request in requests}
+    request_ids = [request.id for request in requests]
+
+    rows = [
+        len(db.execute(history_service.build_requests_statement(chronic_patient)).all()),
+        len(db.execute(history_service.build_appointments_statement(appointment_ids)).all()),
+        len(db.execute(history_service.build_tests_statement(request_ids)).all()),
+    ]
+
+    assert rows == [3, 2, 30]
+
+
+def test_history_without_requests(db, chronic_patient):
+    db.add(Patient(name="Petr", surname="Svoboda", personal_number="8001011234"))
+    db.commit()
+
+    history = history_service.get_patient_history(
+        db, PatientLookup(personal_number="8001011234", name="Petr", surname="Svoboda"))
+
+    assert history.requests == history.appointments == history.tests == []
+
+
+def test_history_pages_walk_each_section(db, chronic_patient):
+    tests, cursors = [], HistoryCursors()
+    while True:
+        page = history_service.get_patient_history_page(db, LOOKUP, limit=7, cursors=cursors, section="tests")
+        assert page.requests == page.appointments == []
+        tests.extend(page.tests)
+        if page.next_cursors.tests is None:
+            break
+        cursors = HistoryCursors(tests=page.next_cursors.tests)
+
+    assert [test.id for test in tests] == list(range(1, 31))
+
+
+def test_history_page_cursors_per_section(db, chronic_patient):
+    page = history_service.get_patient_history_page(db, LOOKUP, limit=2, cursors=HistoryCursors())
+
+    assert [len(page.requests), len(page.appointments), len(page.tests)] == [2, 2, 2]
+    assert page.next_cursors.requests is not None
+    assert page.next_cursors.appointments is None
+    assert page.next_cursors.tests is not None
+
+
+def test_history_page_rejects_invalid_cursor(db, chronic_patient):
+    with pytest.raises(HTTPException) as error:
+        history_service.get_patient_history_page(db, LOOKUP, limit=2, cursors=HistoryCursors(tests="not-a-cursor"))
+
+    assert error.value.status_code == 400
+
+
+def test_history_stream_endpoint(file_db, async_session_factory, api_client):
+    seed_chronic_patient(file_db)
+    client = api_client({"/history": history_router}, async_sessions=async_session_factory)
+
+    response = client.post("/history/patient/stream", json=LOOKUP.model_dump())
+    missing = client.post("/history/patient/stream", json={**LOOKUP.model_dump(), "name": "Petr"})
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [line["section"] for line in lines] == ["requests"] * 3 + ["appointments"] * 2 + ["tests"] * 30
+    assert lines[0]["data"]["state"] == "cancelled"
+    assert missing.status_code == 404
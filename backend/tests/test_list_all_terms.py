@@ -0,0 +1,127 @@
+from datetime import datetime, timedelta, timezone
+
+from app.api.list_all_terms import router as list_all_terms_router
+from app.core.cache import cache
+from app.models import Appointment, Doctor, Patient, Request, RequestType
+from app.services.list_all_terms_service import TermService
+
+
+def seed_calendar(db, appointments: int, requests_per_appointment: int):
+    doctor = Doctor(name="Jan", surname="Novak")
+    first_patient_id = db.query(Patient).count()
+    patients = [
+        Patient(name="Eva", surname="Dvorakova", personal_number=f"{first_patient_id + j:010d}")
+        for j in range(max(requests_per_appointment, 1))
+    ]
+    request_types = [RequestType(name=f"type {i}", description="desc", length=15) for i in range(3)]
+    db.add_all([doctor, *patients, *request_types])
+    db.flush()
+
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    for i in range(appointments):
+        appointment = Appointment(
+            event_type="ambulance",
+            date_from=start + timedelta(hours=i),
+            date_to=start + timedelta(hours=i, minutes=45),
+            doctor_id=doctor.id,
+        )
+        db.add(appointment)
+        db.flush()
+        for j in range(requests_per_appointment):
+            db.add(Request(
+                patient_id=patients[j].id,
+                doctor_id=doctor.id,
+                nurse_id=None,
+                appointment_id=appointment.id,
+                request_type_id=request_types[j % len(request_types)].id,
+            ))
+    db.commit()
+    db.expunge_all()
+
+
+def count_statements(db, statements):
+    statements.clear()
+    terms = TermService.get_all_terms(db)
+    return len(statements), terms
+
+
+def test_get_all_terms_statement_count_is_constant(db, statements):
+    seed_calendar(db, appointments=2, requests_per_appointment=1)
+    small_count, small_terms = count_statements(db, statements)
+    db.expunge_all()
+
+    seed_calendar(db, appointments=40, requests_per_appointment=5)
+    large_count, large_terms = count_statements(db, statements)
+
+    assert len(small_terms) == 2
+    assert len(large_terms) == 42
+    assert small_count == large_count
+    assert large_count <= 2
+
+
+def test_get_all_terms_formats_requests(db):
+    seed_calendar(db, appointments=1, requests_per_appointment=2)
+
+    terms = TermService.get_all_terms(db)
+
+    assert len(terms) == 1
+    assert terms[0]["event_type"] == "ambulance"
+    assert len(terms[0]["zadanky"]) == 2
+    assert all(request["typ_zadanky"]["popis"] == "desc" for request in terms[0]["zadanky"])
+
+
+def test_get_all_terms_filters_by_doctor_and_date_range(db):
+    seed_calendar(db, appointments=10, requests_per_appointment=0)
+    other_doctor = Doctor(name="Petr", surname="Svoboda")
+    db.add(other_doctor)
+    db.flush()
+    db.add(Appointment(
+        event_type="vaccination",
+        date_from=datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc),
+        date_to=datetime(2025, 1, 6, 9, 30, tzinfo=timezone.utc),
+        doctor_id=other_doctor.id,
+    ))
+    db.commit()
+
+    terms = TermService.get_all_terms(
+        db,
+        date_from=datetime(2025, 1, 6, 9, 0),
+        date_to=datetime(2025, 1, 6, 12, 0),
+        doctor_id=1,
+    )
+
+    assert [term["date_from"].hour for term in terms] == [9, 10, 11]
+    assert all(term["event_type"] == "ambulance" for term in terms)
+    assert len(TermService.get_all_terms(db, event_type="vaccination")) == 1
+
+
+def test_get_all_terms_keyset_pagination_walks_every_term_once(db):
+    seed_calendar(db, appointments=7, requests_per_appointment=1)
+
+    seen = []
+    cursor = None
+    while True:
+        page = TermService.get_all_terms(db, cursor=cursor, limit=3)
+        seen.extend(term["kalendar_id"] for term in page)
+        if len(page) < 3:
+            break
+        cursor = TermService.encode_cursor(page[-1]["date_from"], page[-1]["kalendar_id"])
+
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_endpoint_returns_empty_pages_and_404_only_unfiltered(file_db, async_session_factory, api_client):
+    cache.clear()
+    seed_calendar(file_db, appointments=4, requests_per_appointment=0)
+    client = api_client({"/api/terms": list_all_terms_router}, async_sessions=async_session_factory)
+
+    first = client.get("/api/terms/list-all-terms", params={"limit": 2})
+    second = client.get("/api/terms/list-all-terms", params={"limit": 2, "cursor": first.headers["x-next-cursor"]})
+    past_end = client.get("/api/terms/list-all-terms", params={"limit": 2, "cursor": second.headers["x-next-cursor"]})
+    empty_week = client.get("/api/terms/list-all-terms", params={"doctor_id": 999})
+
+    assert [len(first.json()), len(second.json())] == [2, 2]
+    assert (past_end.status_code, past_end.json()) == (200, [])
+    assert (empty_week.status_code, empty_week.json()) == (200, [])
+    cache.clear()
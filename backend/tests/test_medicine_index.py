@@ -0,0 +1,100 @@
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.dialects import postgresql
+
+from app.core import medicine_index as medicine_index_module
+from app.core.medicine_index import MedicineIndex, trigrams
+from app.core.text import normalize_search_text
+from app.models import Medicine
+from app.schemas.prescription_medicine import PrescriptionMedicineCreate
+from app.services import prescription_medicine_service
+from app.services.prescription_medicine_service import PrescriptionMedicineService
+
+NAMES = ["Paralen 500", "Paracetamol Teva", "Ibalgin 400", "Ibálgin Rapid", "Ibuprofen", "Nurofen Rapid"]
+
+
+@pytest.fixture
+def index(db, monkeypatch):
+    db.execute(insert(Medicine), [{"name": name, "name_normalized": normalize_search_text(name)} for name in NAMES])
+    db.commit()
+    index = MedicineIndex(refresh_interval=3600)
+    index.load(db)
+    monkeypatch.setattr(prescription_medicine_service, "medicine_index", index)
+    monkeypatch.setattr(medicine_index_module, "medicine_index", index)
+    return index
+
+
+def names(results):
+    return [result["name"] for result in results]
+
+
+def test_trigrams_match_pg_trgm():
+    assert trigrams("ibalgin 400") == {"  i", " ib", "iba", "bal", "alg", "lgi", "gin", "in ",
+                                       "  4", " 40", "400", "00 "}
+
+
+def test_prefix_matches_come_first_in_name_order(index):
+    assert names(index.search("iba", limit=10, fuzzy=False)) == ["Ibalgin 400", "Ibálgin Rapid"]
+    assert names(index.search("para", limit=1)) == ["Paracetamol Teva"]
+
+
+def test_fuzzy_matches_typos_and_inner_words(index):
+    assert names(index.search("ibuprofem", limit=5)) == ["Ibuprofen"]
+    assert names(index.search("rapid", limit=5)) == ["Ibálgin Rapid", "Nurofen Rapid"]
+    assert names(index.search("ibalgin", limit=5)) == ["Ibalgin 400", "Ibálgin Rapid"]
+    assert index.search("xyz", limit=5) == []
+
+
+def test_created_medicines_are_added_on_commit(db, index):
+    PrescriptionMedicineService.create_medicine(db, PrescriptionMedicineCreate(name="Ibumax"))
+    db.rollback()
+    assert names(index.search("ibum", limit=5, fuzzy=False)) == []
+
+    PrescriptionMedicineService.create_medicine(db, PrescriptionMedicineCreate(name="Ibumax"))
+    assert names(index.search("ibum", limit=5, fuzzy=False)) == []
+    db.commit()
+
+    assert names(index.search("ibum", limit=5, fuzzy=False)) == ["Ibumax"]
+
+
+def test_refresh_picks_up_rows_from_other_workers(db, index):
+    db.execute(insert(Medicine), [{"name": "Zodac", "name_normalized": "zodac"}])
+    db.commit()
+    index.refresh_if_stale(db)
+    assert index.search("zod", limit=5) == []
+
+    index.refresh_interval = 0
+    index.refresh_if_stale(db)
+
+    assert names(index.search("zod", limit=5)) == ["Zodac"]
+    assert len(index) == len(NAMES) + 1
+
+
+def test_refresh_picks_up_lower_ids_committed_late(db, index):
+    index.refresh_interval = 0
+    late_id = len(NAMES) + 1
+    db.execute(insert(Medicine), [{"id": late_id + 1, "name": "Zodac", "name_normalized": "zodac"}])
+    db.commit()
+    index.refresh_if_stale(db)
+    db.execute(insert(Medicine), [{"id": late_id, "name": "Zyrtec", "name_normalized": "zyrtec"}])
+    db.commit()
+    index.refresh_if_stale(db)
+
+    assert names(index.search("z", limit=5, fuzzy=False)) == ["Zodac", "Zyrtec"]
+    assert len(index) == len(index._sorted) == len(NAMES) + 2
+
+
+def test_service_searches_the_loaded_index(db, index, statements):
+    statements.clear()
+
+    assert names(PrescriptionMedicineService.search_medicines(db, "NUROFEN")) == ["Nurofen Rapid"]
+    assert statements == []
+
+
+def test_postgresql_fuzzy_search_uses_pg_trgm():
+    statement = PrescriptionMedicineService.build_search_statement("ibuprofem", "postgresql", fuzzy=True)
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert "medicine.name_normalized %% " in sql  # "%" escaped for the pyformat paramstyle
+    assert "similarity(medicine.name_normalized" in sql
+    assert "LIKE" in sql
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from app.api.notifications import router as notifications_router
+from app.core import notifications
+from app.core.batch_writer import BatchWriter
+from app.models import Appointment, Doctor, Notification, Nurse, Patient, RequestType
+from app.schemas.book_term import BookTermBase
+from app.services.book_term_service import BookTermService
+from app.services.notification_service import NotificationService
+from app.services.request_service import RequestService
+
+
+@pytest.fixture
+def writer(engine, monkeypatch):
+    writer = BatchWriter(Notification, sessionmaker(bind=engine), batch_size=100, flush_interval=60, max_buffer=100)
+    monkeypatch.setattr(notifications, "notification_writer", writer)
+    return writer
+
+
+@pytest.fixture
+def inbox(db):
+    """Five unread and one opened notification for the first patient, one for the second."""
+    patients = [Patient(name="Eva", surname="Dvorakova", personal_number="9001011234"),
+                Patient(name="Jana", surname="Mala", personal_number="9101011234")]
+    db.add_all(patients)
+    db.flush()
+    db.add_all([Notification(message=f"message {i}", opened=i == 5, patient_id=patients[0].id) for i in range(6)])
+    db.add(Notification(message="other", patient_id=patients[1].id))
+    db.commit()
+    return [patient.id for patient in patients]
+
+
+def test_booking_and_approval_notify_the_patient(db, writer, statements):
+    doctor = Doctor(name="Jan", surname="Novak")
+    request_type = RequestType(name="checkup", description="desc", length=15)
+    db.add_all([doctor, request_type])
+    db.flush()
+    start = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+    appointment = Appointment(event_type="ambulance", date_from=start, date_to=start + timedelta(hours=1),
+                              doctor_id=doctor.id)
+    db.add_all([appointment, Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id)])
+    db.commit()
+    statements.clear()
+
+    request = BookTermService.book_term(db, BookTermBase(
+        pacient_jmeno="Eva", pacient_prijmeni="Dvorakova", pacient_rodne_cislo="9001011234",
+        pacient_telefon="123", pacient_poznamka="", doktor_id=doctor.id, kalendar_id=appointment.id,
+        typ_zadanky_id=request_type.id
+    ))
+    db.commit()
+    assert not any("notification" in statement for statement in statements)
+    RequestService.update_request_status(db, request.id, "approved")
+    with pytest.raises(HTTPException) as rejected:
+        RequestService.update_request_status(db, request.id, "pending")
+    db.commit()
+    writer.flush()
+
+    sent = db.scalars(select(Notification).order_by(Notification.id)).all()
+    assert [n.message for n in sent] == [f"Your request #{request.id} was received and is waiting for approval.",
+                                         f"Your request #{request.id} was approved."]
+    assert rejected.value.status_code == 400
+    assert {(n.patient_id, n.doctor_id, n.opened) for n in sent} == {(request.patient_id, doctor.id, False)}
+
+
+def test_unread_newest_first(db, inbox):
+    first = NotificationService.get_unread(db, inbox[0], limit=3)
+    rest = NotificationService.get_unread(db, inbox[0], cursor=first.next_cursor, limit=3)
+
+    assert [n.message for n in first.items + rest.items] == [f"message {i}" for i in (4, 3, 2, 1, 0)]
+    assert rest.next_cursor is None
+
+
+def test_unread_query_uses_the_patient_index(db, inbox, statements):
+    NotificationService.get_unread(db, inbox[0])
+
+    plan = " ".join(str(row) for row in db.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statements[-1], (inbox[0], 101, 0)))
+    assert "ix_notification_patient_opened" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_mark_opened_endpoint(db, inbox, api_client):
+    client = api_client({"/notifications": notifications_router})
+    unread = client.get(f"/notifications/patient/{inbox[0]}/unread").json()
+    other = client.get(f"/notifications/patient/{inbox[1]}/unread").json()
+
+    marked = client.post(f"/notifications/patient/{inbox[0]}/mark-opened",
+                         json={"ids": [unread[0]["id"], unread[1]["id"], other[0]["id"]]})
+
+    assert marked.json() == {"updated": 2}
+    assert len(client.get(f"/notifications/patient/{inbox[0]}/unread").json()) == 3
+    assert client.post(f"/notifications/patient/{inbox[0]}/mark-opened", json={}).json() == {"updated": 3}
+    assert client.get(f"/notifications/patient/{inbox[0]}/unread").json() == []
+    assert len(client.get(f"/notifications/patient/{inbox[1]}/unread").json()) == 1
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.api.patients import router as patients_router
+from app.core.pagination import encode_cursor, keyset
+from app.models import Patient
+from app.services.patient_service import PatientService
+
+
+@pytest.fixture
+def client(db, api_client):
+    db.add_all([Patient(name=f"P{i}", surname="Novak", personal_number=f"90010{i:05d}") for i in range(7)])
+    db.commit()
+    return api_client({"/patients": patients_router})
+
+
+def test_walks_every_page_once_in_id_order(client):
+    ids, cursor = [], None
+    while True:
+        response = client.get("/patients/", params={"limit": 3, **({"cursor": cursor} if cursor else {})})
+        ids.extend(patient["id"] for patient in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if cursor is None:
+            break
+
+    assert ids == list(range(1, 8))
+
+
+def test_page_is_a_keyset_query():
+    statement = keyset(select(Patient), Patient.id, encode_cursor(3), limit=3)
+
+    query = str(statement.compile(dialect=postgresql.dialect())).upper()
+    assert "WHERE PATIENT.ID >" in query
+    assert "ORDER BY PATIENT.ID" in query
+    assert "OFFSET" not in query
+
+
+def test_full_last_page_has_no_cursor(db, client):
+    page = PatientService.get_patients(db, limit=7)
+
+    assert len(page.items) == 7
+    assert page.next_cursor is None
+
+
+def test_invalid_cursor_and_limit(client):
+    assert client.get("/patients/", params={"cursor": "not-a-cursor"}).status_code == 400
+    assert client.get("/patients/", params={"limit": 0}).status_code == 422
@@ -1,2 +1,89 @@
-def test_placeholder():
-    pass
\ No newline at end of file
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import text
+
+from app.api.patients import router as patients_router
+from app.schemas.patient import PatientCreate, PatientSearch
+from app.services.patient_service import PatientService
+
+
+@pytest.fixture
+def registry(db):
+    for name, surname, born, phone, personal_number in [
+        ("Jiří", "Novák", date(1970, 5, 1), "+420 603 123 456", "7005011234"),
+        ("Jana", "Nováková", date(1970, 9, 12), None, "7059121234"),
+        ("Josef", "Novák", date(1985, 1, 20), "777 888 999", "8501201234"),
+        ("Eva", "Dvořáková", date(1970, 3, 3), "00420 601 000 111", "7053031234"),
+    ]:
+        PatientService.create_patient(db, PatientCreate(
+            name=name, surname=surname, date_of_birth=born, sex="M", address="Ostrava",
+            phone_number=phone, personal_number=personal_number
+        ))
+    db.commit()
+
+
+def search(db, **filters):
+    return [f"{patient.name} {patient.surname}" for patient in PatientService.search_patients(db, PatientSearch(**filters))]
+
+
+def test_surname_prefix_ignores_case_and_diacritics(db, registry):
+    assert search(db, surname="NOVAK") == ["Jiří Novák", "Josef Novák", "Jana Nováková"]
+    assert search(db, surname="novák", birth_year=1970) == ["Jiří Novák", "Jana Nováková"]
+    assert search(db, surname="nov", name="jo") == ["Josef Novák"]
+
+
+def test_personal_number_date_and_phone_filters(db, registry):
+    assert search(db, personal_number="70") == ["Eva Dvořáková", "Jiří Novák", "Jana Nováková"]
+    assert search(db, personal_number="700501/1234") == ["Jiří Novák"]
+    assert search(db, date_of_birth=date(1985, 1, 20)) == ["Josef Novák"]
+    assert search(db, phone_number="603123456") == ["Jiří Novák"]
+    assert search(db, phone_number="+420601000111") == ["Eva Dvořáková"]
+
+
+def test_search_requires_a_filter(db, registry):
+    with pytest.raises(HTTPException) as error:
+        PatientService.search_patients(db, PatientSearch(surname="  "))
+    assert error.value.status_code == 400
+
+
+def test_booking_upsert_sets_search_columns(db):
+    PatientService.upsert_patient(db, "Šárka", "Černá", "603 000 000", "9051011234")
+
+    assert search(db, surname="cerna", name="sarka", phone_number="+420603000000") == ["Šárka Černá"]
+
+
+@pytest.mark.parametrize("filters, index", [
+    ({"surname": "novak", "birth_year": 1970}, "ix_patient_surname_name_normalized"),
+    ({"name": "jan"}, "ix_patient_name_normalized"),
+    ({"personal_number": "70"}, "ix_patient_personal_number"),
+    ({"birth_year": 1970}, "ix_patient_date_of_birth"),
+    ({"phone_number": "603123456"}, "ix_patient_phone_normalized"),
+])
+def test_each_filter_uses_an_index(db, filters, index):
+    statement = PatientService.build_search_statement(PatientSearch(**filters), "sqlite")
+    compiled = statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+
+    plan = [row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+
+    assert plan[0].startswith(f"SEARCH patient USING INDEX {index} ")
+
+
+def test_search_endpoint(registry, api_client):
+    client = api_client({"/patients": patients_router})
+
+    found = client.get("/patients/search", params={"surname": "dvorakova"})
+    missing_filter = client.get("/patients/search")
+
+    assert [patient["personal_number"] for patient in found.json()] == ["7053031234"]
+    assert missing_filter.status_code == 400
+
+
+def test_duplicate_personal_number_is_a_conflict(registry, api_client):
+    client = api_client({"/patients": patients_router})
+    payload = {"name": "Jiří", "surname": "Novák", "sex": "M", "address": "Brno", "personal_number": "7005011234"}
+
+    response = client.post("/patients/", json=payload)
+
+    assert response.status_code == 409
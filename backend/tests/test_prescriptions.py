@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.api.medicines import router as medicines_router
+from app.api.prescriptions import router as prescriptions_router
+from app.models import Doctor, Medicine, Patient, Prescription
+from app.schemas.prescription import PrescriptionCreate, PrescriptionRepeat
+from app.schemas.prescription_medicine import PrescriptionMedicineCreate
+from app.services.prescription_medicine_service import PrescriptionMedicineService
+from app.services.prescription_service import PrescriptionService
+
+NOW = datetime(2025, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pharmacy(db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    patients = [Patient(name="Eva", surname="Dvorakova", personal_number="9001011234"),
+                Patient(name="Jana", surname="Mala", personal_number="9101011234")]
+    db.add_all([doctor, *patients])
+    db.flush()
+    for name in ("Paralen 500", "Paracetamol Teva", "Ibalgin 400", "Ibálgin Rapid", "Ibuprofen"):
+        PrescriptionMedicineService.create_medicine(db, PrescriptionMedicineCreate(name=name))
+    db.commit()
+    return doctor.id, [patient.id for patient in patients]
+
+
+def prescription(patient_id, doctor_id, days_from, days_to, medicine_id=1):
+    return PrescriptionCreate(
+        dosage="1-0-1", patient_id=patient_id, doctor_id=doctor_id, medicine_id=medicine_id,
+        date_from=None if days_from is None else NOW + timedelta(days=days_from),
+        date_to=None if days_to is None else NOW + timedelta(days=days_to)
+    )
+
+
+def test_bulk_issue_reports_each_item(db, pharmacy, statements):
+    doctor_id, patient_ids = pharmacy
+    items = [
+        prescription(patient_ids[0], doctor_id, 0, 30),
+        prescription(999, doctor_id, 0, 30),
+        prescription(patient_ids[1], doctor_id, 0, 30, medicine_id=999),
+        prescription(patient_ids[1], doctor_id, 30, 0),
+        prescription(patient_ids[1], doctor_id, 0, 30, medicine_id=2),
+    ]
+    statements.clear()
+
+    results = PrescriptionService.issue_prescriptions(db, items)
+
+    assert [statement.split()[0] for statement in statements] == ["SELECT"] * 3 + ["INSERT"] * 2
+    assert [result["status"] for result in results] == ["created", "error", "error", "error", "created"]
+    assert [result.get("detail") for result in results[1:4]] == [
+        "Patient not found", "Medicine not found", "date_to is before date_from"
+    ]
+    assert db.get(Prescription, results[4]["prescription_id"]).medicine_id == 2
+
+
+def test_repeat_copies_originals_for_a_new_period(db, pharmacy):
+    doctor_id, patient_ids = pharmacy
+    original = PrescriptionService.create_prescription(db, prescription(patient_ids[0], doctor_id, -60, -30, 3))
+
+    results = PrescriptionService.repeat_prescriptions(db, PrescriptionRepeat(
+        prescription_ids=[999, original.id], doctor_id=doctor_id,
+        date_from=NOW.replace(tzinfo=None), date_to=NOW + timedelta(days=30)
+    ))
+
+    assert results[0] == {"index": 0, "status": "error", "detail": "Prescription not found"}
+    copy = db.get(Prescription, results[1]["prescription_id"])
+    assert (copy.patient_id, copy.medicine_id, copy.dosage) == (patient_ids[0], 3, "1-0-1")
+    assert copy.date_from.replace(tzinfo=timezone.utc) == NOW
+
+
+def test_active_prescriptions(db, pharmacy, statements):
+    doctor_id, patient_ids = pharmacy
+    PrescriptionService.issue_prescriptions(db, [
+        prescription(patient_ids[0], doctor_id, -60, -30),   # ended
+        prescription(patient_ids[0], doctor_id, -10, 10),    # active
+        prescription(patient_ids[0], doctor_id, 5, 30),      # not started
+        prescription(patient_ids[0], doctor_id, None, None),  # open-ended
+        prescription(patient_ids[1], doctor_id, -10, 10),    # another patient
+    ])
+    db.commit()
+
+    page = PrescriptionService.get_active_prescriptions(db, patient_ids[0], at=NOW)
+
+    assert [p.id for p in page.items] == [2, 4]
+    plan = " ".join(str(row) for row in db.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statements[-1], (patient_ids[0], NOW.isoformat(), NOW.isoformat(), 101, 0)))
+    assert "ix_prescription_patient_date_to" in plan
+
+
+def test_medicine_prefix_search(db, pharmacy, statements):
+    assert [m.name for m in PrescriptionMedicineService.search_medicines(db, "IBÁL")] == [
+        "Ibalgin 400", "Ibálgin Rapid"
+    ]
+    assert [m.name for m in PrescriptionMedicineService.search_medicines(db, "para", limit=1)] == ["Paracetamol Teva"]
+    assert PrescriptionMedicineService.search_medicines(db, "  ") == []
+
+    plan = " ".join(str(row) for row in db.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statements[-1], ("para", "parb", 1, 0)))
+    assert "ix_medicine_name_normalized" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_postgresql_search_uses_like():
+    statement = PrescriptionMedicineService.build_search_statement("50%", "postgresql")
+
+    assert "LIKE" in str(statement)
+
+
+def test_endpoints(db, pharmacy, api_client):
+    doctor_id, patient_ids = pharmacy
+    client = api_client({"/prescriptions": prescriptions_router, "/medicines": medicines_router})
+    issued = client.post("/prescriptions/bulk", json=[
+        {"dosage": "1-0-0", "patient_id": patient_ids[0], "doctor_id": doctor_id, "medicine_id": 4,
+         "date_from": "2025-01-01T00:00:00", "date_to": "2099-01-01T00:00:00"}
+    ])
+
+    active = client.get(f"/prescriptions/patient/{patient_ids[0]}/active")
+
+    assert issued.json()["created"] == 1
+    assert [p["id"] for p in active.json()] == [issued.json()["results"][0]["prescription_id"]]
+    assert [m["name"] for m in client.get("/medicines/search", params={"q": "ibu"}).json()] == ["Ibuprofen"]
+    assert client.get("/medicines/search", params={"q": ""}).status_code == 422
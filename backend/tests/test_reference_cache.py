@@ -0,0 +1,106 @@
+import pytest
+
+from app.api.doctors import router as doctors_router
+from app.api.test_types import router as lab_test_types_router
+from app.core.cache import TTLCache, cache
+from app.schemas.doctor import DoctorCreate
+from app.schemas.request_type import RequestTypeCreate
+from app.services.doctor_service import DoctorService
+from app.services.list_all_terms_service import CACHE_NAMESPACE as TERMS_CACHE_NAMESPACE
+from app.services.request_type_service import RequestTypeService
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client({"/doctors": doctors_router, "/test-types": lab_test_types_router})
+
+
+def test_ttl_and_lru_eviction():
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, clock=lambda: now[0])
+    cache.set(("a", 1), 1)
+    cache.set(("a", 2), 2)
+    cache.get(("a", 1))
+    cache.set(("b", 1), 3)
+
+    assert cache.get(("a", 2)) is None
+    assert cache.get(("a", 1)).value == 1
+    now[0] = 10
+    assert cache.get(("b", 1)) is None
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_invalidate_namespace():
+    cache = TTLCache(maxsize=10, ttl=10)
+    cache.set(("doctors", 0, 100), [])
+    cache.set(("test_types", 0, 100), [])
+
+    cache.invalidate("doctors")
+
+    assert cache.get(("doctors", 0, 100)) is None
+    assert cache.get(("test_types", 0, 100)) is not None
+
+
+def test_list_is_served_from_cache_until_a_write_commits(client, statements):
+    client.post("/doctors/", json={"name": "Jan", "surname": "Novak"})
+    first = client.get("/doctors/")
+    statements.clear()
+    second = client.get("/doctors/")
+
+    assert second.json() == first.json() == [{"name": "Jan", "surname": "Novak", "email": None,
+                                              "phone_number": None, "specialization_id": None, "id": 1}]
+    assert not [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    assert cache.stats()["hits"] == 1
+
+    client.put("/doctors/1", json={"name": "Jan", "surname": "Dvorak"})
+
+    assert client.get("/doctors/").json()[0]["surname"] == "Dvorak"
+
+
+def test_rolled_back_write_keeps_cache(db):
+    entry = DoctorService.get_doctors_cached(db)
+    DoctorService.create_doctor(db, DoctorCreate(name="Jan", surname="Novak"))
+    db.rollback()
+    db.commit()  # a later commit must not run the rolled-back invalidation
+
+    assert DoctorService.get_doctors_cached(db) == entry
+
+
+def test_etag_revalidation(client):
+    client.post("/test-types/", json={"name": "blood"})
+    response = client.get("/test-types/")
+    etag = response.headers["etag"]
+
+    not_modified = client.get("/test-types/", headers={"If-None-Match": etag})
+    assert response.headers["cache-control"].startswith("private, max-age=")
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+    client.post("/test-types/", json={"name": "urine"})
+    changed = client.get("/test-types/", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [t["name"] for t in changed.json()] == ["blood", "urine"]
+
+
+def test_request_type_changes_invalidate_term_listings(db):
+    request_type = RequestTypeService.create_request_type(db, RequestTypeCreate(name="blood", description="", length=15))
+    db.commit()
+    cache.set((TERMS_CACHE_NAMESPACE, "unfiltered"), {"terms": []})
+
+    RequestTypeService.update_request_type(db, request_type.id, RequestTypeCreate(name="urine", description="", length=10))
+    db.commit()
+    assert cache.get((TERMS_CACHE_NAMESPACE, "unfiltered")) is None
+
+    cache.set((TERMS_CACHE_NAMESPACE, "unfiltered"), {"terms": []})
+    RequestTypeService.delete_request_type(db, request_type.id)
+    db.commit()
+    assert cache.get((TERMS_CACHE_NAMESPACE, "unfiltered")) is None
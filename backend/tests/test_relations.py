@@ -0,0 +1,86 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.relations import router as relations_router
+from app.models import Doctor, FamilyRelation, Patient, Request
+from app.schemas.relation import RelationCreate
+from app.services.relation_service import RelationService
+
+
+@pytest.fixture
+def family(db):
+    """grandmother - father = mother, father/mother - son and daughter; a stranger."""
+    names = ["grandmother", "father", "mother", "son", "daughter", "stranger"]
+    people = {name: Patient(name=name, surname="Novak", personal_number=f"{i:010d}") for i, name in enumerate(names)}
+    doctor = Doctor(name="Jan", surname="Dvorak")
+    db.add_all([*people.values(), doctor])
+    db.flush()
+    ids = {name: patient.id for name, patient in people.items()}
+    for patient, related, relation in [
+        ("grandmother", "father", "child"),
+        ("father", "mother", "spouse"),
+        ("son", "father", "parent"),
+        ("son", "mother", "parent"),
+        ("mother", "daughter", "child"),
+    ]:
+        db.add(FamilyRelation(patient_id=ids[patient], related_id=ids[related], relation=relation))
+    for name, state in [("daughter", "pending"), ("daughter", "pending"), ("father", "approved"),
+                        ("grandmother", "pending"), ("stranger", "pending")]:
+        db.add(Request(patient_id=ids[name], doctor_id=doctor.id, state=state))
+    db.commit()
+    return ids
+
+
+def depths(ids, rows):
+    names = {patient_id: name for name, patient_id in ids.items()}
+    return {names[row["patient_id"]]: row["depth"] for row in rows}
+
+
+def test_relatives_walk_both_directions_up_to_max_depth(db, family, statements):
+    statements.clear()
+
+    direct = RelationService.get_relatives(db, family["son"], max_depth=1)
+    within_two = RelationService.get_relatives(db, family["son"], max_depth=2)
+    everyone = RelationService.get_relatives(db, family["son"], max_depth=6)
+
+    assert depths(family, direct) == {"father": 1, "mother": 1}
+    assert depths(family, within_two) == {"father": 1, "mother": 1, "grandmother": 2, "daughter": 2}
+    assert depths(family, everyone) == depths(family, within_two)
+    assert [row["depth"] for row in within_two] == [1, 1, 2, 2]
+    assert sum(statement.lstrip().startswith("WITH RECURSIVE") for statement in statements) == 3
+
+
+def test_relatives_with_pending_requests(db, family):
+    nearest = RelationService.get_relatives_with_pending_requests(db, family["son"], max_depth=1)
+    rows = RelationService.get_relatives_with_pending_requests(db, family["son"], max_depth=2)
+
+    assert nearest == []
+    assert {(row["patient_id"], row["pending_requests"]) for row in rows} == {
+        (family["grandmother"], 1), (family["daughter"], 2)
+    }
+
+
+def test_create_relation_validates_patients(db, family):
+    with pytest.raises(HTTPException) as self_relation:
+        RelationService.create_relation(db, RelationCreate(patient_id=1, related_id=1, relation="self"))
+    with pytest.raises(HTTPException) as missing:
+        RelationService.create_relation(db, RelationCreate(patient_id=family["son"], related_id=999, relation="x"))
+    with pytest.raises(HTTPException) as duplicate:
+        RelationService.create_relation(db, RelationCreate(
+            patient_id=family["son"], related_id=family["father"], relation="parent"
+        ))
+
+    assert [error.value.status_code for error in (self_relation, missing, duplicate)] == [400, 404, 409]
+
+
+def test_relatives_endpoint(family, api_client):
+    client = api_client({"/relations": relations_router})
+
+    relatives = client.get(f"/relations/patient/{family['daughter']}/relatives", params={"max_depth": 1})
+    pending = client.get(f"/relations/patient/{family['daughter']}/relatives/pending", params={"max_depth": 3})
+    too_deep = client.get(f"/relations/patient/{family['daughter']}/relatives", params={"max_depth": 7})
+    unknown = client.get("/relations/patient/999/relatives")
+
+    assert [row["patient_id"] for row in relatives.json()] == [family["mother"]]
+    assert [row["patient_id"] for row in pending.json()] == [family["grandmother"]]
+    assert (too_deep.status_code, unknown.status_code) == (422, 404)
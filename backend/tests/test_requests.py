@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core import audit
+from app.core.batch_writer import BatchWriter
+from app.api.requests import router as requests_router
+from app.models import AppointmentHistory, Doctor, Nurse, Patient, Request
+from app.schemas.request import RequestFilter
+from app.services.request_service import RequestService
+
+START = datetime(2025, 1, 6, 8, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def queue(db):
+    """Ten requests for each of two nurses, every third one approved, created an hour apart in reverse id order."""
+    doctor = Doctor(name="Jan", surname="Novak")
+    db.add(doctor)
+    db.flush()
+    nurses = [Nurse(name="Marie", surname="Kralova", doctor_id=doctor.id),
+              Nurse(name="Jana", surname="Mala", doctor_id=doctor.id)]
+    patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+    db.add_all([*nurses, patient])
+    db.flush()
+    db.add_all([
+        Request(patient_id=patient.id, doctor_id=doctor.id, nurse_id=nurses[i % 2].id,
+                state="approved" if i % 3 == 0 else "pending", created_at=START - timedelta(hours=i))
+        for i in range(20)
+    ])
+    db.commit()
+    return nurses
+
+
+def walk(db, **kwargs):
+    ids, cursor = [], None
+    while True:
+        page = RequestService.get_requests(db, cursor=cursor, limit=3, **kwargs)
+        ids.extend(request.id for request in page.items)
+        if page.next_cursor is None:
+            return ids
+        cursor = page.next_cursor
+
+
+def test_nurse_queue_oldest_first(db, queue):
+    ids = walk(db, filters=RequestFilter(state=["pending"], nurse_id=queue[0].id), sort="created_at")
+
+    assert ids == [17, 15, 11, 9, 5, 3]
+
+
+def test_newest_first_and_created_range(db, queue):
+    filters = RequestFilter(created_from=START - timedelta(hours=5), created_to=START - timedelta(hours=1))
+
+    assert walk(db, filters=filters, sort="-created_at") == [3, 4, 5, 6]
+    assert walk(db, filters=filters, sort="-id") == [6, 5, 4, 3]
+
+
+def test_multiple_states(db, queue):
+    ids = walk(db, filters=RequestFilter(state=["approved", "declined"], doctor_id=1))
+
+    assert ids == [1, 4, 7, 10, 13, 16, 19]
+
+
+def test_queue_query_uses_the_partial_index(db, queue, statements):
+    RequestService.get_requests(db, filters=RequestFilter(state=["pending"], nurse_id=queue[0].id), sort="created_at")
+    query = statements[-1]
+
+    plan = " ".join(str(row) for row in db.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + query, ("pending", queue[0].id, 101, 0)))
+    assert "ix_request_pending_queue" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_endpoint_filters(db, queue, api_client):
+    client = api_client({"/requests": requests_router})
+
+    response = client.get("/requests/", params={"state": "pending", "nurse_id": queue[1].id,
+                                                "sort": "created_at", "limit": 2})
+    rest = client.get("/requests/", params={"state": "pending", "nurse_id": queue[1].id,
+                                            "sort": "created_at", "cursor": response.headers["x-next-cursor"]})
+
+    assert [r["id"] for r in response.json() + rest.json()] == [20, 18, 14, 12, 8, 6, 2]
+    assert client.get("/requests/", params={"sort": "state"}).status_code == 422
+
+
+def test_bulk_transition_uses_two_statements(db, queue, engine, statements, monkeypatch):
+    writer = BatchWriter(AppointmentHistory, sessionmaker(bind=engine), batch_size=1000, flush_interval=60, max_buffer=1000)
+    monkeypatch.setattr(audit, "audit_writer", writer)
+    ids = list(range(1, 21)) + [999]
+    statements.clear()
+
+    results = RequestService.transition_requests(db, ids, "approved")
+    db.commit()
+
+    assert len(statements) == 2
+    assert [result["id"] for result in results] == ids
+    updated = [result["id"] for result in results if result["status"] == "updated"]
+    assert updated == [i for i in range(1, 21) if (i - 1) % 3 != 0]
+    assert results[0] == {"id": 1, "status": "error", "previous_state": "approved",
+                          "detail": "Cannot change state from approved to approved"}
+    assert results[-1]["detail"] == "Request not found"
+    assert db.scalar(select(func.count()).select_from(Request).where(Request.state == "approved")) == 20
+    writer.flush()
+    history = db.scalars(select(AppointmentHistory).order_by(AppointmentHistory.id)).all()
+    assert [row.change_type for row in history] == ["request_approved"] * len(updated)
+    assert history[0].description == "Request 2: pending -> approved"
+
+
+def test_bulk_transition_endpoint(db, queue, api_client):
+    client = api_client({"/requests": requests_router})
+
+    completed = client.post("/requests/transitions", json={"ids": [1, 4, 2], "state": "completed"})
+
+    assert completed.json()["updated"] == 2
+    assert [r["status"] for r in completed.json()["results"]] == ["updated", "updated", "error"]
+    assert client.post("/requests/transitions", json={"ids": [1], "state": "pending"}).json()["updated"] == 0
+    assert client.post("/requests/transitions", json={"ids": [1], "state": "archived"}).status_code == 400
+    assert client.post("/requests/transitions", json={"ids": list(range(1001)), "state": "approved"}).status_code == 413
+
+
+def test_single_update_follows_allowed_transitions(db, queue, api_client):
+    client = api_client({"/requests": requests_router})
+
+    assert client.put("/requests/2", json={"state": "approved"}).json()["state"] == "approved"
+    assert client.put("/requests/1", json={"state": "pending"}).status_code == 400
+    assert client.put("/requests/1", json={"state": "archived"}).status_code == 400
+    assert client.put("/requests/999", json={"state": "approved"}).status_code == 404
+    assert client.put("/requests/2", json={"description": "no state"}).status_code == 422
+    assert db.get(Request, 1).state == "approved"
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from app.api import tests as tests_api
+from app.models import Doctor, MedicalTestType, Patient, Request
+from app.models import Test as LabTest
+from app.services import test_service
+
+
+@pytest.fixture
+def lab(db):
+    doctor = Doctor(name="Jan", surname="Novak")
+    patient = Patient(name="Eva", surname="Dvorakova", personal_number="9001011234")
+    test_type = MedicalTestType(name="CRP")
+    db.add_all([doctor, patient, test_type])
+    db.flush()
+    request = Request(patient_id=patient.id, doctor_id=doctor.id)
+    db.add(request)
+    db.commit()
+    return test_type.id, request.id
+
+
+def result(test_type_id, request_id, value="12 mg/l"):
+    return {"test_date": "2025-03-01T08:00:00", "results": value, "state": "final",
+            "test_type_id": test_type_id, "request_id": request_id}
+
+
+def test_ingest_stores_valid_rows_and_reports_failures(db, lab, statements):
+    test_type_id, request_id = lab
+    items = [
+        result(test_type_id, request_id),
+        result(999, request_id),
+        result(test_type_id, 999),
+        {"results": "missing fields"},
+        ValueError("Expecting value"),
+        result(test_type_id, request_id, "3 mg/l"),
+    ]
+    statements.clear()
+
+    outcome = test_service.TestService.ingest_tests(db, items)
+
+    assert [statement.split()[0] for statement in statements] == ["SELECT", "SELECT", "INSERT"]
+    assert (outcome["created"], outcome["failed"]) == (2, 4)
+    assert [(error["index"], error["detail"].split(":")[0]) for error in outcome["errors"]] == [
+        (1, "Test type not found"), (2, "Request not found"), (3, "test_date"), (4, "Invalid JSON")
+    ]
+    assert sorted(test.results for test in db.query(LabTest)) == ["12 mg/l", "3 mg/l"]
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client({"/tests": tests_api.router})
+
+
+def test_bulk_endpoint_accepts_json_array_and_ndjson(client, lab):
+    test_type_id, request_id = lab
+    ndjson = "\n".join([json.dumps(result(test_type_id, request_id)), "{not json", "",
+                        json.dumps(result(test_type_id, request_id))]) + "\n"
+
+    from_array = client.post("/tests/bulk", json=[result(test_type_id, request_id)])
+    from_stream = client.post("/tests/bulk", content=ndjson, headers={"Content-Type": "application/x-ndjson"})
+
+    assert from_array.json() == {"created": 1, "failed": 0, "errors": []}
+    assert from_stream.json()["created"] == 2
+    assert [error["index"] for error in from_stream.json()["errors"]] == [1]
+
+
+def test_bulk_endpoint_rejects_bad_bodies(client, monkeypatch):
+    monkeypatch.setattr(tests_api, "MAX_BATCH_SIZE", 2)
+
+    not_a_list = client.post("/tests/bulk", json={"results": "x"})
+    too_many = client.post("/tests/bulk", content="{}\n{}\n{}\n", headers={"Content-Type": "application/x-ndjson"})
+    wrong_type = client.post("/tests/bulk", content="a,b", headers={"Content-Type": "text/csv"})
+
+    assert [not_a_list.status_code, too_many.status_code, wrong_type.status_code] == [400, 413, 415]
@@ -0,0 +1,50 @@
+"""Fails when a foreign key has no index to support it.
+
+An index supports a foreign key when the key's columns are its leading columns, in any order.
+The primary key and unique constraints count as indexes; partial indexes do not, because they
+cannot serve every join.
+
+Run from the backend directory: python -m tools.check_fk_indexes
+"""
+import sys
+
+from sqlalchemy import UniqueConstraint
+from sqlmodel import SQLModel
+
+import app.models  # noqa: F401 - registers all tables on SQLModel.metadata
+
+
+def is_partial(index) -> bool:
+    return any(key.endswith("_where") and value is not None for key, value in index.kwargs.items())
+
+
+def find_unindexed_foreign_keys(metadata) -> list[str]:
+    """Returns "table(columns) -> referred_table" for every foreign key without a supporting index."""
+    missing = []
+    for table in metadata.sorted_tables:
+        candidates = [[column.name for column in table.primary_key.columns]]
+        candidates += [[column.name for column in index.columns] for index in table.indexes if not is_partial(index)]
+        candidates += [
+            [column.name for column in constraint.columns]
+            for constraint in table.constraints if isinstance(constraint, UniqueConstraint)
+        ]
+        for foreign_key in table.foreign_key_constraints:
+            columns = [column.name for column in foreign_key.columns]
+            if not any(set(candidate[:len(columns)]) == set(columns) for candidate in candidates):
+                missing.append(f"{table.name}({', '.join(columns)}) -> {foreign_key.referred_table.name}")
+    return missing
+
+
+def main() -> int:
+    missing = find_unindexed_foreign_keys(SQLModel.metadata)
+    for foreign_key in missing:
+        print(f"Foreign key without index: {foreign_key}")
+    if missing:
+        print("Add index=True to the Field or an Index in __table_args__, plus an Alembic migration.")
+        return 1
+    print("All foreign keys are indexed.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())